@@ -1,7 +1,12 @@
-﻿from src.game import Game
+﻿import sys
+
+from src.game import Game
 from src import settings
 
 if __name__ == "__main__":
+    # --watch: reload scene CSVs live while editing them
+    if "--watch" in sys.argv[1:]:
+        settings.HOT_RELOAD = True
     # Print all top-level, uppercase entries from src/settings.py so we can
     # confirm exactly what configuration the process loaded at startup.
     try:
@@ -0,0 +1,239 @@
+"""
+Sprite animations built on first use.
+
+An `AnimationSet` knows how to build every animation of a character from
+the sprite sheets in one directory (or from their packed atlas, see
+src/core/atlas.py) but only builds an animation when it is first asked for,
+so startup pays only for what the first seconds of play show. `preload`
+reads an animation on a worker thread ahead of time when the game can
+predict it; like chunk baking, the worker only produces plain surfaces and
+the display conversion happens on the main thread when they are collected.
+
+Frames are either centered on their visible pixels (the classic aligned
+walk cycle) or anchored: cropped with one shared rect so effects and lunges
+keep their place relative to the character, with `anchors` giving the feet
+point inside each frame.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pygame
+from src.core.atlas import SHEET_FRAME_SIZE, slice_sheet
+from src.core.frame_cache import PendingFrames, finish_aligned_frames, read_aligned_frames
+from src.core.sprite_align import visible_rect
+from src.core.surfaces import has_display
+
+
+class AnimationSpec:
+    """How to build one animation.
+
+    sheet: sprite sheet name (file stem in the sprite directory).
+    source: name of another animation of the set whose built frames are
+    reused instead of a sheet (e.g. a single pose of the walk cycle).
+    frames: indices of the sheet's (or source's) frames to play (default:
+    all of them).
+    count: number of frames in the sheet (read from the sheet if None).
+    loop: restart after the last frame; otherwise the last frame is held.
+    speed: frames advanced per update.
+    anchored: keep the frames' positions in the sheet and pin them at the
+    character's feet; otherwise each frame's visible pixels are centered.
+    """
+
+    def __init__(self, sheet=None, frames=None, count=None, loop=True, speed=0.1, anchored=True, source=None):
+        self.sheet = sheet
+        self.source = source
+        self.frames = frames
+        self.count = count
+        self.loop = loop
+        self.speed = speed
+        self.anchored = anchored
+
+
+class Animation:
+    """Built frames of an animation plus its playback settings.
+
+    anchors[i] is the feet point inside frames[i], or None when the frame
+    is aligned by its visible pixels.
+    """
+
+    def __init__(self, frames, anchors=None, loop=True, speed=0.1):
+        self.frames = frames
+        self.anchors = anchors if anchors is not None else [None] * len(frames)
+        self.loop = loop
+        self.speed = speed
+
+
+def crop_anchored(frames, feet):
+    """Crop frames with the union of their visible rects.
+
+    Returns (cropped copies, feet point inside the crop).
+    """
+    bounds = [rect for rect in map(visible_rect, frames) if rect.width and rect.height]
+    union = bounds[0].unionall(bounds[1:]) if bounds else pygame.Rect(0, 0, 1, 1)
+    return [frame.subsurface(union).copy() for frame in frames], (feet[0] - union.x, feet[1] - union.y)
+
+
+class AnimationSet:
+    """The animations of one character, built on demand.
+
+    specs: animation name -> AnimationSpec. feet: the character's feet in
+    a source frame (anchor of anchored animations). canvas: canvas size the
+    centered animations are aligned onto. atlas: the loaded atlas of
+    directory (see `read_atlas`), or None to build from the sheets.
+
+    Building is split in two: `read` does the disk work (decoding sheets,
+    reading the frame cache) and is safe on any thread; `get` and `collect`
+    finish the result into display-format frames on the main thread.
+    """
+
+    def __init__(self, directory, specs, feet, frame_size=SHEET_FRAME_SIZE, canvas=(48, 48), atlas=None):
+        self.directory = Path(directory)
+        self.specs = specs
+        self.feet = feet
+        self.frame_size = frame_size
+        self.canvas = canvas
+        self.atlas = atlas
+        self.animations = {}  # name -> Animation
+        self.decoded = {}  # name -> `read` result waiting for the main thread
+        self.pending = {}  # name -> Future of the worker's `read`
+        self.builds = 0
+        self._executor = None
+
+    def loaded(self, name):
+        return name in self.animations
+
+    def _sheet_path(self, spec):
+        return self.directory / f"{spec.sheet}.png"
+
+    def _frame_count(self, spec):
+        if spec.count is not None:
+            return spec.count
+        return pygame.image.load(str(self._sheet_path(spec))).get_height() // self.frame_size[1]
+
+    def read(self, name):
+        """Disk work of building animation name (safe off the main thread)."""
+        spec = self.specs[name]
+        if self.atlas is not None:
+            frames = self.atlas.frames(spec.sheet)
+            anchors = [None] * len(frames)
+            if spec.anchored:
+                anchors = [
+                    (self.feet[0] - entry["offset"][0], self.feet[1] - entry["offset"][1])
+                    for entry in self.atlas.index["animations"][spec.sheet]
+                ]
+            return frames, anchors
+        if spec.anchored:
+            sheet = pygame.image.load(str(self._sheet_path(spec)))
+            frames, anchor = crop_anchored(list(slice_sheet(sheet, self.frame_size)), self.feet)
+            return frames, [anchor] * len(frames)
+        return read_aligned_frames(
+            str(self._sheet_path(spec)), *self.frame_size, self._frame_count(spec), align_size=self.canvas
+        )
+
+    def decode(self, *names):
+        """Read animations now, on the calling thread (e.g. an asset loader
+        worker); `get` finishes them. A failed read is retried by `get`."""
+        if self.atlas is not None:
+            # Decoding the pages was the work; frames must be sliced from the
+            # pages `convert` produces, not from these unconverted ones
+            return
+        for name in names:
+            name = self.specs[name].source or name
+            if name in self.animations or name in self.decoded:
+                continue
+            try:
+                self.decoded[name] = self.read(name)
+            except (pygame.error, OSError, KeyError):
+                pass
+
+    def convert(self):
+        """Convert the atlas pages to the display format (main thread); returns self."""
+        if self.atlas is not None:
+            self.atlas.convert()
+        return self
+
+    def _store(self, name, read):
+        spec = self.specs[name]
+        if isinstance(read, PendingFrames):
+            # Aligned frames come out of finishing in display format
+            frames = finish_aligned_frames(read)
+            anchors = [None] * len(frames)
+        else:
+            frames, anchors = read
+            if has_display() and spec.anchored and self.atlas is None:
+                # Cropped from a freshly decoded sheet; atlas pages are in
+                # display format already
+                frames = [frame.convert_alpha() for frame in frames]
+        if spec.frames is not None:
+            frames = [frames[i] for i in spec.frames]
+            anchors = [anchors[i] for i in spec.frames]
+        self.animations[name] = Animation(frames, anchors, spec.loop, spec.speed)
+        self.builds += 1
+
+    def preload(self, name):
+        """Read animation name in the background if it isn't built yet."""
+        name = self.specs[name].source or name
+        if name in self.animations or name in self.pending or name in self.decoded:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="animation-loader")
+        self.pending[name] = self._executor.submit(self.read, name)
+
+    def _finish(self, name, load, fallback, strict=True):
+        """Store the build of name from load(); on failure use fallback.
+
+        Without a fallback the error is raised, or only logged unless strict.
+        """
+        try:
+            self._store(name, load())
+        except (pygame.error, OSError, KeyError) as e:
+            if fallback is None and strict:
+                raise
+            print(f"Could not load animation {name!r}: {e}")
+            if fallback is not None:
+                self.animations[name] = fallback
+
+    def collect(self, fallback=None):
+        """Finish the background reads that are done.
+
+        A failed read is logged instead of raised: fallback (if given) then
+        stands in for the animation like in `get`, otherwise `get` retries it.
+        """
+        for name, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[name]
+                self._finish(name, future.result, fallback, strict=False)
+
+    def get(self, name, fallback=None):
+        """Animation name, waiting for (or doing) its build if needed.
+
+        If the build fails and a fallback animation is given, it stands in
+        for name from then on instead of raising.
+        """
+        animation = self.animations.get(name)
+        if animation is None and self.specs[name].source is not None:
+            animation = self.animations[name] = self._derive(name, fallback)
+        elif animation is None:
+            future = self.pending.pop(name, None)
+            if name in self.decoded:
+                read = self.decoded.pop(name)
+                self._finish(name, lambda: read, fallback)
+            else:
+                self._finish(name, future.result if future is not None else lambda: self.read(name), fallback)
+            animation = self.animations[name]
+        return animation
+
+    def _derive(self, name, fallback):
+        """Animation name picked from the frames of its source animation."""
+        spec = self.specs[name]
+        source = self.get(spec.source, fallback)
+        frames, anchors = source.frames, source.anchors
+        if spec.frames is not None and source is not fallback:
+            frames = [frames[i] for i in spec.frames]
+            anchors = [anchors[i] for i in spec.frames]
+        return Animation(frames, anchors, spec.loop, spec.speed)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,83 @@
+"""
+Asynchronous asset loading.
+
+`AssetManager` runs loading jobs on a small thread pool: file I/O, PNG
+decoding and map parsing release the GIL, so they overlap with each other
+and with the main loop (e.g. a loading screen). A job may have a `finish`
+step, run on the main thread by `poll`, for work that must happen there,
+such as converting decoded images to the display format.
+
+Jobs marked required make up the minimum set the game needs before its
+first playable frame; `ready` turns true once those are finished, while
+optional jobs keep loading in the background.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AssetManager:
+    """Named loading jobs on a worker pool, finished on the main thread."""
+
+    def __init__(self, workers=2):
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="asset-loader")
+        self.pending = {}  # name -> (Future, finish, label)
+        self.assets = {}  # name -> finished asset
+        self.errors = {}  # name -> exception raised by load or finish
+        self.required = set()
+        self.total = 0
+        self.status = ""  # label of the last job finished
+
+    def submit(self, name, load, finish=None, required=True, label=None):
+        """Queue load() on a worker; finish(result) later runs on the main thread."""
+        if name in self.pending or name in self.assets:
+            return
+        self.pending[name] = (self._executor.submit(load), finish, label or name)
+        self.total += 1
+        if required:
+            self.required.add(name)
+
+    def _finish(self, name):
+        future, finish, label = self.pending.pop(name)
+        try:
+            result = future.result()
+            self.assets[name] = finish(result) if finish is not None else result
+        except Exception as e:
+            self.errors[name] = e
+        self.status = label
+
+    def poll(self):
+        """Finish the jobs whose workers are done; returns their names."""
+        done = [name for name, (future, _, _) in self.pending.items() if future.done()]
+        for name in done:
+            self._finish(name)
+        return done
+
+    def progress(self):
+        """Fraction (0-1) of submitted jobs that are finished."""
+        if not self.total:
+            return 1.0
+        return (self.total - len(self.pending)) / self.total
+
+    def ready(self):
+        """True once every required job is finished (or failed)."""
+        return not any(name in self.pending for name in self.required)
+
+    def get(self, name):
+        """The finished asset, waiting for its job if needed.
+
+        Re-raises the exception if the job failed.
+        """
+        if name in self.pending:
+            self._finish(name)
+        if name in self.errors:
+            raise self.errors[name]
+        return self.assets[name]
+
+    def wait(self):
+        """Block until every required job is finished."""
+        for name in list(self.required):
+            if name in self.pending:
+                self._finish(name)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,241 @@
+"""
+Packed sprite atlases.
+
+The character sheets in assets/ are vertical strips of mostly empty frames.
+`build_atlas` (run at build time by tools/pack_atlas.py) trims every frame
+to its visible pixels, packs the trimmed frames of all sheets in a directory
+onto one or a few atlas pages and writes an index next to them:
+
+    atlas.json      version, frame size, source stamps, pages, and per
+                    animation a list of frames:
+                        page    index into pages
+                        rect    trimmed frame on the page (x, y, w, h)
+                        offset  trimmed rect's topleft inside the source frame
+                        pivot   feet point (bottom center of the visible
+                                pixels) inside the source frame
+    atlas_<n>.png   the pages
+
+At runtime `load_atlas` decodes each page once and hands out subsurfaces of
+it (`read_atlas` does the decoding only, for loader threads; convert the
+result on the main thread). Both return None when no up-to-date atlas exists, so callers fall back to
+slicing the sheets (see src/core/support.py). Generated files are not
+committed.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pygame
+from src.core.sprite_align import visible_rect
+from src.core.surfaces import has_display, new_surface
+
+VERSION = 1
+INDEX_NAME = "atlas.json"
+PAGE_NAME = "atlas_{}.png"
+# Frame size of the sheets in assets/mage.samurai (vertical strips)
+SHEET_FRAME_SIZE = (128, 48)
+MAX_PAGE_SIZE = 1024
+PADDING = 1
+
+
+class AtlasFormatError(ValueError):
+    """Raised when an atlas index is missing fields or has another version."""
+
+
+def _is_page(path):
+    return path.name.startswith("atlas_") and path.suffix == ".png"
+
+
+def sheet_paths(directory):
+    """Source sprite sheets in directory (every PNG except atlas pages)."""
+    return sorted(path for path in Path(directory).glob("*.png") if not _is_page(path))
+
+
+def _stamp(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def slice_sheet(sheet, frame_size):
+    """Yield the frames of a vertical strip (a horizontal one if it is one frame tall)."""
+    frame_w, frame_h = frame_size
+    width, height = sheet.get_size()
+    if height > frame_h:
+        for y in range(0, height - frame_h + 1, frame_h):
+            yield sheet.subsurface((0, y, min(frame_w, width), frame_h))
+    else:
+        for x in range(0, width - frame_w + 1, frame_w):
+            yield sheet.subsurface((x, 0, frame_w, min(frame_h, height)))
+
+
+def trim(frame):
+    """Bounding rect of the visible pixels (at least 1x1, like align_frame_to_midbottom)."""
+    bbox = visible_rect(frame)
+    if bbox.width == 0 or bbox.height == 0:
+        return pygame.Rect(0, 0, 1, 1)
+    return bbox
+
+
+def shelf_pack(sizes, max_size=MAX_PAGE_SIZE, padding=PADDING):
+    """Place (w, h) boxes on shelves, tallest first.
+
+    Returns (placements, page sizes) where placements[i] is (page, x, y) for
+    sizes[i]. A box larger than max_size gets a page of its own.
+    """
+    placements = [None] * len(sizes)
+    pages = []
+    x = y = shelf_h = 0
+    for index in sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0])):
+        w, h = sizes[index][0] + padding, sizes[index][1] + padding
+        if not pages:
+            pages.append([0, 0])
+        if x + w > max_size and x > 0:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if y + h > max_size and y > 0:
+            pages.append([0, 0])
+            x = y = shelf_h = 0
+        placements[index] = (len(pages) - 1, x, y)
+        page = pages[-1]
+        page[0] = max(page[0], x + w)
+        page[1] = max(page[1], y + h)
+        x += w
+        shelf_h = max(shelf_h, h)
+    return placements, [tuple(page) for page in pages]
+
+
+def build_atlas(directory, frame_size=SHEET_FRAME_SIZE, max_size=MAX_PAGE_SIZE):
+    """Trim and pack every sheet in directory; writes the pages and index.
+
+    Returns the index path.
+    """
+    directory = Path(directory)
+    animations = {}
+    frames = []  # (animation, frame surface, trimmed rect)
+    sources = {}
+    for path in sheet_paths(directory):
+        sheet = pygame.image.load(str(path))
+        sources[path.name] = _stamp(path)
+        animations[path.stem] = []
+        for frame in slice_sheet(sheet, frame_size):
+            frames.append((path.stem, frame, trim(frame)))
+
+    placements, page_sizes = shelf_pack([bbox.size for _, _, bbox in frames], max_size)
+    pages = [new_surface(size, per_pixel_alpha=True) for size in page_sizes]
+    for (name, frame, bbox), (page, x, y) in zip(frames, placements):
+        # Copy pixels as they are; alpha blending onto the empty page would
+        # darken semi-transparent edges.
+        pages[page].blit(frame, (x, y), bbox, special_flags=pygame.BLEND_RGBA_MAX)
+        animations[name].append(
+            {
+                "page": page,
+                "rect": [x, y, bbox.width, bbox.height],
+                "offset": [bbox.x, bbox.y],
+                "pivot": [bbox.x + bbox.width // 2, bbox.bottom],
+            }
+        )
+
+    for stale in directory.glob("atlas_*.png"):
+        stale.unlink()
+    page_names = []
+    for number, page in enumerate(pages):
+        page_names.append(PAGE_NAME.format(number))
+        pygame.image.save(page, str(directory / page_names[-1]))
+    index = {
+        "version": VERSION,
+        "frame_size": list(frame_size),
+        "sources": sources,
+        "pages": page_names,
+        "animations": animations,
+    }
+    index_path = directory / INDEX_NAME
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, "w") as file:
+        json.dump(index, file, indent=1)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def read_index(directory):
+    """Parsed atlas index of directory, or None if there is none."""
+    index_path = Path(directory) / INDEX_NAME
+    if not index_path.exists():
+        return None
+    with open(index_path) as file:
+        index = json.load(file)
+    if index.get("version") != VERSION or "animations" not in index:
+        raise AtlasFormatError(f"{index_path}: unsupported atlas index")
+    return index
+
+
+def is_stale(directory, index=None):
+    """True when the atlas is missing or a sheet was added, removed or changed."""
+    directory = Path(directory)
+    try:
+        index = index if index is not None else read_index(directory)
+    except (AtlasFormatError, ValueError):
+        return True
+    if index is None:
+        return True
+    current = {path.name: _stamp(path) for path in sheet_paths(directory)}
+    if current != index["sources"]:
+        return True
+    return not all((directory / name).exists() for name in index["pages"])
+
+
+class SpriteAtlas:
+    """Decoded atlas pages; frames are subsurfaces sharing the page pixels."""
+
+    def __init__(self, index, pages):
+        self.index = index
+        self.pages = pages
+        self.frame_size = tuple(index["frame_size"])
+        self._frames = {}
+
+    def names(self):
+        return list(self.index["animations"])
+
+    def convert(self):
+        """Convert the pages to the display format (main thread); returns self."""
+        if has_display():
+            self.pages = [page.convert_alpha() for page in self.pages]
+            self._frames.clear()
+        return self
+
+    def frames(self, name):
+        """Trimmed frames of animation name, as subsurfaces of their page."""
+        frames = self._frames.get(name)
+        if frames is None:
+            frames = self._frames[name] = [
+                self.pages[entry["page"]].subsurface(entry["rect"]) for entry in self.index["animations"][name]
+            ]
+        return frames
+
+    def pivots(self, name):
+        """Feet point of each frame of name, relative to the trimmed frame's topleft."""
+        return [
+            (entry["pivot"][0] - entry["offset"][0], entry["pivot"][1] - entry["offset"][1])
+            for entry in self.index["animations"][name]
+        ]
+
+
+def read_atlas(directory):
+    """Decode the atlas packed for directory without converting its pages.
+
+    Safe to run off the main thread. Returns None if it is missing or stale.
+    """
+    directory = Path(directory)
+    try:
+        index = read_index(directory)
+    except (AtlasFormatError, ValueError):
+        return None
+    if index is None or is_stale(directory, index):
+        return None
+    pages = [pygame.image.load(str(directory / name)) for name in index["pages"]]
+    return SpriteAtlas(index, pages)
+
+
+def load_atlas(directory):
+    """Load the atlas packed for directory, or None if it is missing or stale."""
+    atlas = read_atlas(directory)
+    return atlas.convert() if atlas is not None else None
@@ -1,5 +1,21 @@
+import inspect
+import math
+from bisect import bisect_left, insort
+from itertools import count
+
 import pygame
 from src import settings
+from src.core.render import FrameStats, submit
+from src.core.surfaces import new_surface
+from src.core.zoom import ZOOM_LEVELS, ScaledSurfaceCache, mip_level_for
+
+# Side of one spatial-hash cell used for view culling, in pixels
+CULL_CELL_SIZE = 256
+# Extra border around the view, for sprites whose image overhangs their rect
+CULL_MARGIN = 128
+# Sprites away from the view that haven't moved lately are re-checked for
+# movement this many per query, round robin
+MOVE_SWEEP_BATCH = 64
 
 
 class CameraLookAhead:
@@ -11,30 +27,411 @@ class CameraLookAhead:
         self.offset.y = int(target_pos[1])
 
 
+def _resolve_draw(sprite):
+    """Return sprite.draw if it takes (surface, offset), else None (plain blit)."""
+    draw = getattr(sprite, "draw", None)
+    if not callable(draw) or getattr(draw, "plain_blit", False):
+        return None
+    try:
+        inspect.signature(draw).bind(None, None)
+    except (TypeError, ValueError):
+        return None
+    return draw
+
+
+class _Entry:
+    __slots__ = ("draw", "rect", "cells", "key")
+
+    def __init__(self, draw, key):
+        self.draw = draw
+        self.rect = None
+        self.cells = ()
+        self.key = key
+
+
+class Viewport:
+    """One camera view onto the world.
+
+    rect: area of the display surface this view draws into (None = all of
+        it). Extra viewports (split-screen, picture-in-picture, spectator
+        views) are added with `YSortCameraGroup.add_viewport`.
+    target: sprite the view stays centered on; when None the view is
+        centered on `center` (world pixels) instead.
+    background: color the view is cleared to first (None = draw over
+        whatever is already there, like the main view over the sky fill).
+
+    Each view keeps its own offset, zoom and depth-sorted visible list;
+    the sprite index and all surface caches belong to the camera group.
+    """
+
+    def __init__(self, rect=None, target=None, zoom=1.0, center=(0, 0), background=None):
+        self.rect = pygame.Rect(rect) if rect is not None else None
+        self.target = target
+        self.center = pygame.Vector2(center)
+        self.background = background
+        self.offset = pygame.Vector2()
+        self.zoom = zoom
+        self.target_zoom = zoom
+        self.drawn_rects = []  # display rects drawn to by the last draw
+        self.view_cells = None  # (x0, y0, x1, y1) cell range of the last draw
+        self.visible = []  # sorted (centery, order, sprite) for sprites in view_cells
+        self._zoom_target = None  # intermediate surface for between-level zooms
+        self._zoom_scaled = None  # the intermediate scaled to the view
+
+    # --- Zoom ---
+    def set_zoom(self, zoom, smooth=True):
+        self.target_zoom = zoom
+        if not smooth:
+            self.zoom = zoom
+
+    def zoom_in(self):
+        larger = [level for level in ZOOM_LEVELS if level > self.target_zoom + 1e-9]
+        self.set_zoom(larger[0] if larger else ZOOM_LEVELS[-1])
+
+    def zoom_out(self):
+        smaller = [level for level in ZOOM_LEVELS if level < self.target_zoom - 1e-9]
+        self.set_zoom(smaller[-1] if smaller else ZOOM_LEVELS[0])
+
+    def update_zoom(self, dt):
+        """Ease the zoom towards target_zoom (geometrically, so in and out feel alike)."""
+        if self.zoom == self.target_zoom:
+            return
+        ratio = self.target_zoom / self.zoom
+        self.zoom *= ratio ** min(1.0, dt * settings.ZOOM_SPEED)
+        if abs(self.zoom / self.target_zoom - 1) < 0.005:
+            self.zoom = self.target_zoom
+
+    def focus(self):
+        """World position the view is centered on."""
+        if self.target is not None:
+            return self.target.rect.center
+        return self.center
+
+
 class YSortCameraGroup(pygame.sprite.Group):
+    """Sprite group drawn relative to a camera that follows a target sprite.
+
+    Sprites are kept in a spatial hash so a frame only visits the ones near
+    the view, and in depth (rect.centery) order that is patched only for
+    sprites whose rect changed since the last frame. Movement is detected
+    without visiting every sprite: only sprites indexed in the view's cells,
+    sprites that moved lately and a small round-robin batch of the rest have
+    their rect compared each frame. Each sprite's draw path
+    (its own draw(surface, offset) or a plain blit) is picked once on add.
+
+    Plain blits are gathered into one flat (surface, dest) list, reused
+    across frames, and submitted in a single batched call per layer; a
+    sprite with its own draw flushes the batch first so depth order holds.
+    `stats` counts the draw calls and pixels submitted each frame.
+
+    Zoom (`zoom_in`, `zoom_out`, `set_zoom`) eases towards its target in
+    `update_zoom`. Zoomed frames draw chunks and sprites from per-level
+    caches of prescaled surfaces (see core.zoom) and scale the finished
+    frame once, so they cost about as much as a normal frame.
+
+    `main_view` follows the sprite passed to `custom_draw`; extra
+    `Viewport`s draw after it from the same sprite index, baked layers and
+    prescaled surface cache, so another view only costs its own blits.
+    The zoom methods and `offset` here act on the main view.
+    """
+
     def __init__(self):
         super().__init__()
         self.display_surface = pygame.display.get_surface()
-        self.offset = pygame.math.Vector2()
+        # Pre-rendered layers drawn under the sprites, e.g. a ChunkCache.
+        # Each layer needs a draw(surface, offset) method; layers with
+        # draw_items(items, offset, size, view) are batched (and zoomable).
+        self.static_layers = []
+        self._entries = {}  # sprite -> _Entry
+        self._cells = {}  # (cell x, cell y) -> set of sprites
+        self._movers = set()  # new sprites and sprites that moved at their last check
+        self._sweep = []  # sprites left in the current round-robin pass
+        self._order = count()  # insertion order breaks depth ties, like a stable sort
+        self.draw_list = []  # (surface, dest) pairs, reused every frame
+        self.drawn_rects = []  # screen rects drawn to this frame, across all views
+        self.stats = FrameStats()
+        self.scaled_surfaces = ScaledSurfaceCache()
+        self.main_view = Viewport()
+        self.viewports = [self.main_view]
 
-    def custom_draw(self, target_sprite):
-        screen_center = pygame.Vector2(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2)
-        self.offset.x = int(target_sprite.rect.centerx - screen_center.x)
-        self.offset.y = int(target_sprite.rect.centery - screen_center.y)
-
-        for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
-            if hasattr(sprite, "draw"):
-                try:
-                    sprite.draw(self.display_surface, self.offset)
-                except TypeError:
-                    offset_pos = (
-                        sprite.rect.x - self.offset.x,
-                        sprite.rect.y - self.offset.y,
-                    )
-                    self.display_surface.blit(sprite.image, offset_pos)
+    # --- Viewports ---
+    def add_viewport(self, viewport):
+        self.viewports.append(viewport)
+        return viewport
+
+    def remove_viewport(self, viewport):
+        if viewport is self.main_view or viewport not in self.viewports:
+            return
+        self.viewports.remove(viewport)
+        for layer in self.static_layers:
+            release = getattr(layer, "release_view", None)
+            if release is not None:
+                release(viewport)
+
+    @property
+    def offset(self):
+        return self.main_view.offset
+
+    @property
+    def zoom(self):
+        return self.main_view.zoom
+
+    @property
+    def target_zoom(self):
+        return self.main_view.target_zoom
+
+    def set_zoom(self, zoom, smooth=True):
+        self.main_view.set_zoom(zoom, smooth)
+
+    def zoom_in(self):
+        self.main_view.zoom_in()
+
+    def zoom_out(self):
+        self.main_view.zoom_out()
+
+    def update_zoom(self, dt):
+        for viewport in self.viewports:
+            viewport.update_zoom(dt)
+
+    # --- pygame.sprite.Group hooks ---
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if sprite not in self._entries:
+            # Indexed on the next draw: sprites usually join their groups
+            # in Sprite.__init__, before they have a rect.
+            self._entries[sprite] = _Entry(_resolve_draw(sprite), (0, next(self._order)))
+            self._movers.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        entry = self._entries.pop(sprite, None)
+        if entry is not None:
+            self._unlink(sprite, entry)
+        self._movers.discard(sprite)
+
+    # --- Spatial index ---
+    @staticmethod
+    def _cell_range(rect):
+        size = CULL_CELL_SIZE
+        return rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    @staticmethod
+    def _in_view_cells(viewport, entry):
+        if viewport.view_cells is None:
+            return False
+        x0, y0, x1, y1 = viewport.view_cells
+        return any(x0 <= cx <= x1 and y0 <= cy <= y1 for cx, cy in entry.cells)
+
+    def _unlink(self, sprite, entry):
+        for cell in entry.cells:
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(sprite)
+                if not bucket:
+                    del self._cells[cell]
+        for viewport in self.viewports:
+            visible = viewport.visible
+            # (centery, order) sorts just before its (centery, order, sprite) item
+            index = bisect_left(visible, entry.key)
+            if index < len(visible) and visible[index][2] is sprite:
+                del visible[index]
+
+    def _place(self, sprite):
+        """(Re)index a sprite whose rect changed and patch each view's order."""
+        entry = self._entries[sprite]
+        self._unlink(sprite, entry)
+        rect = sprite.rect
+        entry.rect = rect.copy()
+        entry.key = (rect.centery, entry.key[1])
+        x0, y0, x1, y1 = self._cell_range(rect)
+        entry.cells = [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+        for cell in entry.cells:
+            self._cells.setdefault(cell, set()).add(sprite)
+        for viewport in self.viewports:
+            if self._in_view_cells(viewport, entry):
+                insort(viewport.visible, (entry.key[0], entry.key[1], sprite))
+
+    def _query_visible(self, viewport, view_cells):
+        """Rebuild a view's depth-sorted list of sprites for a new cell range."""
+        x0, y0, x1, y1 = view_cells
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                found.update(self._cells.get((cx, cy), ()))
+        entries = self._entries
+        viewport.view_cells = view_cells
+        viewport.visible = sorted((entries[s].key[0], entries[s].key[1], s) for s in found)
+
+    def _refresh(self, view_cells):
+        """Re-index the sprites that moved, checking only likely candidates.
+
+        A static sprite away from the view that starts moving is found by
+        the round-robin sweep within len(sprites) / MOVE_SWEEP_BATCH queries
+        and checked every frame from then on while it keeps moving.
+        """
+        x0, y0, x1, y1 = view_cells
+        candidates = set(self._movers)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                candidates.update(self._cells.get((cx, cy), ()))
+        if not self._sweep:
+            self._sweep = list(self._entries)
+        candidates.update(self._sweep[-MOVE_SWEEP_BATCH:])
+        del self._sweep[-MOVE_SWEEP_BATCH:]
+
+        entries = self._entries
+        for sprite in candidates:
+            entry = entries.get(sprite)
+            if entry is None:
+                continue  # removed since the sweep started
+            # A rect compare is all a static sprite costs; only moved
+            # sprites are re-hashed and re-inserted into the depth order.
+            if sprite.rect != entry.rect:
+                if entry.rect is None:
+                    self._movers.discard(sprite)  # first placement, not a move
+                else:
+                    self._movers.add(sprite)
+                self._place(sprite)
             else:
-                offset_pos = (
-                    sprite.rect.x - self.offset.x,
-                    sprite.rect.y - self.offset.y,
-                )
-                self.display_surface.blit(sprite.image, offset_pos)
+                self._movers.discard(sprite)
+
+    def visible_sprites(self, view, viewport=None):
+        """Sprites whose rect overlaps `view` (world space), in depth order."""
+        if viewport is None:
+            viewport = self.main_view
+        view = view.inflate(2 * CULL_MARGIN, 2 * CULL_MARGIN)
+        view_cells = self._cell_range(view)
+        self._refresh(view_cells)
+        if view_cells != viewport.view_cells:
+            self._query_visible(viewport, view_cells)
+        return [sprite for _, _, sprite in viewport.visible if view.colliderect(sprite.rect)]
+
+    # --- Drawing ---
+    @staticmethod
+    def _draw_bounds(sprite, offset):
+        """Screen rect a self-drawing sprite may have touched."""
+        bounds = getattr(sprite, "draw_bounds", None)
+        if bounds is not None:
+            return bounds(offset)
+        # Unknown extent: assume it stays within the culling margin
+        return sprite.rect.move(-offset.x, -offset.y).inflate(2 * CULL_MARGIN, 2 * CULL_MARGIN)
+
+    def custom_draw(self, target_sprite):
+        """Draw every viewport; the main view follows target_sprite."""
+        self.main_view.target = target_sprite
+        self.stats.begin_frame()
+        self.drawn_rects.clear()
+        for viewport in self.viewports:
+            self.draw_viewport(viewport)
+            self.drawn_rects.extend(viewport.drawn_rects)
+
+    def draw_viewport(self, viewport):
+        """Draw one view into its area of the display surface."""
+        display = self.display_surface
+        area = display.get_rect()
+        if viewport.rect is not None:
+            area = viewport.rect.clip(area)
+            if not area.width or not area.height:
+                viewport.drawn_rects = []
+                return
+        surface = display if area == display.get_rect() else display.subsurface(area)
+        if viewport.background is not None:
+            surface.fill(viewport.background)
+        if viewport.zoom != 1:
+            self._draw_zoomed(viewport, surface)
+        else:
+            self._draw_native(viewport, surface)
+        if viewport.background is not None:
+            viewport.drawn_rects = [area]
+        elif area.topleft != (0, 0):
+            viewport.drawn_rects = [rect.move(area.topleft).clip(area) for rect in viewport.drawn_rects]
+
+    def _draw_native(self, viewport, surface):
+        width, height = surface.get_size()
+        center = viewport.focus()
+        offset = viewport.offset
+        offset.x = int(center[0] - width // 2)
+        offset.y = int(center[1] - height // 2)
+
+        stats = self.stats
+        items = self.draw_list
+        for layer in self.static_layers:
+            draw_items = getattr(layer, "draw_items", None)
+            if draw_items is None:
+                layer.draw(surface, offset)
+                stats.record(1, 0)
+                continue
+            items.clear()
+            draw_items(items, offset, (width, height), viewport)
+            submit(surface, items, stats)
+
+        ox, oy = offset
+        view = pygame.Rect(int(ox), int(oy), width, height)
+        items.clear()
+        drawn = viewport.drawn_rects = []
+        for sprite in self.visible_sprites(view, viewport):
+            draw = self._entries[sprite].draw
+            if draw is None:
+                dest = (sprite.rect.x - ox, sprite.rect.y - oy)
+                items.append((sprite.image, dest))
+                drawn.append(pygame.Rect(dest, sprite.image.get_size()))
+                continue
+            submit(surface, items, stats)
+            items.clear()
+            draw(surface, offset)
+            stats.record(1, 0)
+            drawn.append(self._draw_bounds(sprite, offset))
+        submit(surface, items, stats)
+        items.clear()
+
+    def _draw_zoomed(self, viewport, surface):
+        """Draw a view at its current (non-1) zoom."""
+        stats = self.stats
+        zoom = viewport.zoom
+        level = mip_level_for(zoom)
+        width, height = surface.get_size()
+        view = pygame.Rect(0, 0, math.ceil(width / zoom), math.ceil(height / zoom))
+        view.center = viewport.focus()
+        viewport.offset.update(view.topleft)
+
+        # Draw straight to the screen on a mip level, else at the level below
+        # into an intermediate that is scaled up once at the end.
+        if level == zoom:
+            target = surface
+        else:
+            size = (math.ceil(view.width * level), math.ceil(view.height * level))
+            if viewport._zoom_target is None or viewport._zoom_target.get_size() != size:
+                viewport._zoom_target = new_surface(size, per_pixel_alpha=True)
+            target = viewport._zoom_target
+            target.fill((0, 0, 0, 0))
+
+        cache = self.scaled_surfaces
+        items = self.draw_list
+        for layer in self.static_layers:
+            draw_items = getattr(layer, "draw_items", None)
+            if draw_items is None:
+                continue  # layers without draw_items only support zoom 1
+            layer_items = []
+            draw_items(layer_items, viewport.offset, view.size, viewport)
+            items.clear()
+            items.extend(
+                (cache.get(image, level), (round(x * level), round(y * level))) for image, (x, y) in layer_items
+            )
+            submit(target, items, stats)
+
+        items.clear()
+        for sprite in self.visible_sprites(view, viewport):
+            source = getattr(sprite, "draw_source", None)
+            image, (x, y) = source() if source is not None else (sprite.image, sprite.rect.topleft)
+            items.append((cache.get(image, level), (round((x - view.x) * level), round((y - view.y) * level))))
+        submit(target, items, stats)
+        items.clear()
+
+        if target is not surface:
+            if viewport._zoom_scaled is None or viewport._zoom_scaled.get_size() != (width, height):
+                viewport._zoom_scaled = new_surface((width, height), per_pixel_alpha=True)
+            pygame.transform.scale(target, (width, height), viewport._zoom_scaled)
+            surface.blit(viewport._zoom_scaled, (0, 0))
+            stats.record(1, width * height)
+        # Every pixel of the view changed scale; present it in full
+        viewport.drawn_rects = [surface.get_rect()]
@@ -0,0 +1,142 @@
+"""
+Pre-baked chunk surfaces for the static tile layers.
+
+The visible tiles of a scene never change while running, so instead of
+blitting every tile sprite each frame the world is baked into wide chunk
+surfaces (CHUNK_COLS tiles wide, full scene height). Drawing a frame then
+takes a couple of chunk blits. Chunks ahead of the camera are baked on a
+background worker so a chunk is normally ready before it scrolls into view.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from src import settings
+from src.core.render import submit
+from src.core.surfaces import COLORKEY, PER_PIXEL_ALPHA, has_display, optimize, surface_kind
+from src.core.tile_art import get_tile_surface
+
+# Width of one baked chunk, in tiles
+CHUNK_COLS = 16
+# How many chunks beyond each edge of the view are baked ahead of time
+PREFETCH_CHUNKS = 2
+# Tile ids drawn into chunks (4 is an invisible hazard, 0 is empty space)
+STATIC_TILE_IDS = (1, 2, 3, 5)
+
+
+class ChunkCache:
+    """Bake and draw CHUNK_COLS-wide slices of a looping `TileMap`."""
+
+    def __init__(self, tilemap, chunk_cols=CHUNK_COLS, tile_ids=STATIC_TILE_IDS, theme="default"):
+        self.tilemap = tilemap
+        self.chunk_cols = chunk_cols
+        self.chunk_width = chunk_cols * settings.TILE_SIZE
+        self.height = tilemap.height * settings.TILE_SIZE
+        # Resolve the shared tile surfaces on the main thread; the worker
+        # only reads them.
+        self.tile_surfaces = {tile_id: get_tile_surface(tile_id, theme) for tile_id in tile_ids}
+        # Display-format tiles are opaque or colorkeyed, so chunks can be baked
+        # onto a colorkey canvas and RLE encoded without scanning their alpha.
+        self._keyed = has_display() and all(
+            surface_kind(surface) != PER_PIXEL_ALPHA for surface in self.tile_surfaces.values()
+        )
+        self.chunks = {}  # chunk index -> Surface
+        self.pending = {}  # chunk index -> Future
+        self._ranges = {}  # view -> (first, last) chunk range it keeps baked
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunk-baker")
+
+    def chunk_index(self, world_x):
+        return int(world_x) // self.chunk_width
+
+    def bake(self, index):
+        """Render chunk `index` into a new surface (safe to run off-thread)."""
+        size = (self.chunk_width, max(1, self.height))
+        if self._keyed:
+            surface = pygame.Surface(size)
+            surface.fill(COLORKEY)
+            surface.set_colorkey(COLORKEY)
+        else:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+        first_col = index * self.chunk_cols
+        for i in range(self.chunk_cols):
+            x = i * settings.TILE_SIZE
+            for row_index, tile_id in enumerate(self.tilemap.column(first_col + i)):
+                tile_surface = self.tile_surfaces.get(tile_id)
+                if tile_surface is not None:
+                    surface.blit(tile_surface, (x, row_index * settings.TILE_SIZE))
+        return surface
+
+    def _store(self, index, surface):
+        self.chunks[index] = optimize(surface)
+
+    def request(self, index):
+        """Queue chunk `index` for background baking if it isn't known yet."""
+        if index not in self.chunks and index not in self.pending:
+            self.pending[index] = self._executor.submit(self.bake, index)
+
+    def collect(self):
+        """Move finished background bakes into the cache."""
+        for index, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[index]
+                self._store(index, future.result())
+
+    def get(self, index):
+        """Return the baked chunk, waiting for (or doing) the bake if needed."""
+        surface = self.chunks.get(index)
+        if surface is None:
+            future = self.pending.pop(index, None)
+            self._store(index, future.result() if future is not None else self.bake(index))
+            surface = self.chunks[index]
+        return surface
+
+    def prefetch(self, first, last, view=None):
+        """Keep chunks first..last (inclusive) baked for `view`.
+
+        Chunks outside every view's range are dropped, so several viewports
+        share one cache without evicting each other's chunks.
+        """
+        self._ranges[view] = (first, last)
+        for index in range(first, last + 1):
+            self.request(index)
+        ranges = self._ranges.values()
+        for index in [i for i in self.chunks if not any(lo <= i <= hi for lo, hi in ranges)]:
+            del self.chunks[index]
+
+    def release_view(self, view):
+        """Stop keeping chunks around for a view that was removed."""
+        self._ranges.pop(view, None)
+
+    def invalidate(self):
+        """Forget all baked chunks (e.g. after the layout changed)."""
+        self.chunks.clear()
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+
+    def invalidate_columns(self, columns):
+        """Forget only the chunks containing the given world columns."""
+        for index in {col // self.chunk_cols for col in columns}:
+            self.chunks.pop(index, None)
+            future = self.pending.pop(index, None)
+            if future is not None:
+                future.cancel()
+
+    def draw_items(self, items, offset, size, view=None):
+        """Append (chunk surface, screen dest) pairs covering a view of `size` at `offset`."""
+        self.collect()
+        # The world starts at x = 0 (nothing is spawned left of it)
+        first = max(0, self.chunk_index(offset.x))
+        last = self.chunk_index(offset.x + size[0] - 1)
+        self.prefetch(max(0, first - PREFETCH_CHUNKS), last + PREFETCH_CHUNKS, view)
+        for index in range(first, last + 1):
+            items.append((self.get(index), (index * self.chunk_width - offset.x, -offset.y)))
+
+    def draw(self, surface, offset, stats=None):
+        """Blit the chunks covering the view at `offset` onto `surface`."""
+        items = []
+        self.draw_items(items, offset, surface.get_size())
+        submit(surface, items, stats)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
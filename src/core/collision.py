@@ -1,4 +1,8 @@
+from collections import OrderedDict
+
+import pygame
 from src import settings
+from src.core.constants import HAZARD_TILE_IDS, SOLID_TILE_IDS  # noqa: F401 (re-exported)
 
 
 def world_to_tile(x, y):
@@ -9,34 +13,214 @@ def tile_to_world(tx, ty):
     return tx * settings.TILE_SIZE, ty * settings.TILE_SIZE
 
 
-def move_and_collide_rect(rect, vx, vy, is_solid_tile):
-    rect.x += vx
-    if vx != 0:
-        left, top = world_to_tile(rect.left, rect.top)
-        right, bottom = world_to_tile(rect.right - 1, rect.bottom - 1)
-        for ty in range(top, bottom + 1):
-            if vx > 0:
-                tx = right
-                if is_solid_tile(tx, ty):
-                    rect.right = tile_to_world(tx, ty)[0]
-            else:
-                tx = left
-                if is_solid_tile(tx, ty):
-                    rect.left = tile_to_world(tx, ty)[0] + settings.TILE_SIZE
-    rect.y += vy
-    if vy != 0:
-        left, top = world_to_tile(rect.left, rect.top)
-        right, bottom = world_to_tile(rect.right - 1, rect.bottom - 1)
-        for tx in range(left, right + 1):
-            if vy > 0:
-                ty = bottom
-                if is_solid_tile(tx, ty):
-                    rect.bottom = tile_to_world(tx, ty)[1]
-            else:
-                ty = top
-                if is_solid_tile(tx, ty):
-                    rect.top = tile_to_world(tx, ty)[1] + settings.TILE_SIZE
+def tiles_in_rect(rect):
+    """Return the (left, top, right, bottom) tile range a rect overlaps (inclusive)."""
+    left, top = world_to_tile(rect.left, rect.top)
+    right, bottom = world_to_tile(rect.right - 1, rect.bottom - 1)
+    return left, top, right, bottom
+
+
+class MergedColliders:
+    """Solid and hazard tiles merged into a few large rects per chunk.
+
+    Long ground runs become one rect instead of dozens of 32x32 tiles, so
+    rect queries and debug drawing deal with a handful of candidates. The
+    merge runs lazily per chunk and is cached by the chunk's offset inside
+    the looping map (or by world column for endless maps, bounded by an
+    LRU), so memory stays bounded however far the runner goes.
+    """
+
+    def __init__(self, tilemap, chunk_cols=16, capacity=64):
+        self.tilemap = tilemap
+        self.chunk_cols = chunk_cols
+        self.chunk_width = chunk_cols * settings.TILE_SIZE
+        self.capacity = capacity
+        self._cache = OrderedDict()  # (kind, map column offset) -> list of local Rects
 
+    def _chunk_key(self, index):
+        first_col = index * self.chunk_cols
+        if self.tilemap.wrap and self.tilemap.width:
+            first_col %= self.tilemap.width
+        return first_col
+
+    def _local_rects(self, kind, index):
+        first_col = self._chunk_key(index)
+        key = (kind, first_col)
+        rects = self._cache.get(key)
+        if rects is not None:
+            self._cache.move_to_end(key)
+        else:
+            tile_ids = SOLID_TILE_IDS if kind == "solid" else HAZARD_TILE_IDS
+            size = settings.TILE_SIZE
+            rects = [
+                pygame.Rect(x * size, y * size, w * size, h * size)
+                for x, y, w, h in self.tilemap.merge_runs(first_col, self.chunk_cols, tile_ids)
+            ]
+            self._cache[key] = rects
+            if len(self._cache) > self.capacity:
+                self._cache.popitem(last=False)
+        return rects
+
+    def chunk_rects(self, kind, index):
+        """World-space merged rects of chunk `index` ("solid" or "hazard")."""
+        if index < 0:
+            return []  # the world starts at x = 0
+        dx = index * self.chunk_width
+        return [rect.move(dx, 0) for rect in self._local_rects(kind, index)]
+
+    def query(self, rect, kind="solid"):
+        """Merged rects of the given kind that overlap rect."""
+        found = []
+        for index in range(rect.left // self.chunk_width, (rect.right - 1) // self.chunk_width + 1):
+            found.extend(r for r in self.chunk_rects(kind, index) if r.colliderect(rect))
+        return found
+
+    def invalidate(self):
+        self._cache.clear()
+
+    def invalidate_columns(self, columns):
+        """Drop the merged rects of the chunks containing the given world columns."""
+        for index in {col // self.chunk_cols for col in columns}:
+            first_col = self._chunk_key(index)
+            for kind in ("solid", "hazard"):
+                self._cache.pop((kind, first_col), None)
+
+    def debug_draw(self, surface, offset):
+        """Outline the merged solid (green) and hazard (red) rects in view."""
+        view = pygame.Rect(int(offset.x), int(offset.y), surface.get_width(), surface.get_height())
+        for kind, color in (("solid", (0, 200, 0)), ("hazard", (255, 0, 0))):
+            for rect in self.query(view, kind):
+                pygame.draw.rect(surface, color, rect.move(-offset.x, -offset.y), 1)
+
+
+class TileGrid:
+    """Collision queries against a `TileMap`.
+
+    The map loops horizontally (see TileMap.wrap), but the world starts at
+    x = 0: nothing is solid or deadly left of it.
+
+    Queries only touch the handful of cells a rect overlaps, so their cost
+    doesn't depend on how much of the world is loaded.
+    """
+
+    def __init__(self, tilemap):
+        self.tilemap = tilemap
+        self.colliders = MergedColliders(tilemap)
+
+    def is_solid(self, tx, ty):
+        return tx >= 0 and self.tilemap.is_solid(tx, ty)
+
+    def is_hazard(self, tx, ty):
+        return tx >= 0 and self.tilemap.is_hazard(tx, ty)
+
+    def solid_cells_in_rect(self, rect):
+        left, top, right, bottom = tiles_in_rect(rect)
+        return [
+            (tx, ty)
+            for ty in range(top, bottom + 1)
+            for tx in range(left, right + 1)
+            if self.is_solid(tx, ty)
+        ]
+
+    def overlaps_hazard(self, rect):
+        return bool(self.colliders.query(rect, "hazard"))
+
+    def resolve_x(self, rect, vx):
+        """Push rect out of solid tiles along x after a horizontal move.
+
+        Resolves against every overlapped cell (not just the first one).
+        Returns True if the rect was blocked.
+        """
+        if vx == 0:
+            return False
+        cells = self.solid_cells_in_rect(rect)
+        if not cells:
+            return False
+        if vx > 0:
+            rect.right = min(tx for tx, _ in cells) * settings.TILE_SIZE
+        else:
+            rect.left = (max(tx for tx, _ in cells) + 1) * settings.TILE_SIZE
+        return True
+
+    def resolve_y(self, rect, vy):
+        """Push rect out of solid tiles along y after a vertical move.
+
+        Moving down (vy > 0) lands on the highest overlapped tile top;
+        otherwise the rect is pushed below the lowest overlapped tile.
+        Returns True if the rect was blocked.
+        """
+        cells = self.solid_cells_in_rect(rect)
+        if not cells:
+            return False
+        if vy > 0:
+            rect.bottom = min(ty for _, ty in cells) * settings.TILE_SIZE
+        else:
+            rect.top = (max(ty for _, ty in cells) + 1) * settings.TILE_SIZE
+        return True
+
+    def _column_blocked(self, tx, top, bottom):
+        return any(self.is_solid(tx, ty) for ty in range(top, bottom + 1))
+
+    def _row_blocked(self, ty, left, right):
+        return any(self.is_solid(tx, ty) for tx in range(left, right + 1))
+
+    def standing_on(self, rect):
+        """True if rect rests exactly on top of a solid tile row."""
+        if rect.bottom % settings.TILE_SIZE:
+            return False
+        left, _, right, _ = tiles_in_rect(rect)
+        return self._row_blocked(rect.bottom // settings.TILE_SIZE, left, right)
+
+    def sweep_x(self, rect, dx):
+        """Move rect by dx pixels, stopping flush at the first solid column crossed.
+
+        Continuous (swept) version of a move + resolve_x: every column
+        between the old and new leading edge is tested, so a large dx can't
+        tunnel through thin walls. Returns True if the rect was blocked.
+        """
+        if dx == 0:
+            return False
+        _, top, _, bottom = tiles_in_rect(rect)
+        T = settings.TILE_SIZE
+        if dx > 0:
+            for tx in range((rect.right - 1) // T + 1, (rect.right - 1 + dx) // T + 1):
+                if self._column_blocked(tx, top, bottom):
+                    rect.right = tx * T
+                    return True
+        else:
+            for tx in range(rect.left // T - 1, (rect.left + dx) // T - 1, -1):
+                if self._column_blocked(tx, top, bottom):
+                    rect.left = (tx + 1) * T
+                    return True
+        rect.x += dx
+        return False
+
+    def sweep_y(self, rect, dy):
+        """Move rect by dy pixels, stopping flush at the first solid row crossed.
+
+        Returns True if the rect was blocked (landed when dy > 0, bumped its
+        head when dy < 0).
+        """
+        if dy == 0:
+            return False
+        left, _, right, _ = tiles_in_rect(rect)
+        T = settings.TILE_SIZE
+        if dy > 0:
+            for ty in range((rect.bottom - 1) // T + 1, (rect.bottom - 1 + dy) // T + 1):
+                if self._row_blocked(ty, left, right):
+                    rect.bottom = ty * T
+                    return True
+        else:
+            for ty in range(rect.top // T - 1, (rect.top + dy) // T - 1, -1):
+                if self._row_blocked(ty, left, right):
+                    rect.top = (ty + 1) * T
+                    return True
+        rect.y += dy
+        return False
+
+
+def move_and_collide_rect(rect, vx, vy, is_solid_tile):
+    # --- Move along X axis ---
     rect.x += vx
     if vx != 0:
         left, top = world_to_tile(rect.left, rect.top)
@@ -49,12 +233,14 @@ def move_and_collide_rect(rect, vx, vy, is_solid_tile):
                     # Collision moving right: snap rect flush to left edge of tile
                     rect.right = tile_to_world(tx, ty)[0]
                     vx = 0
+                    break
             else:
                 tx = left
                 if is_solid_tile(tx, ty):
                     # Collision moving left: snap rect flush to right edge of tile
                     rect.left = tile_to_world(tx + 1, ty)[0]
                     vx = 0
+                    break
     # --- Move along Y axis ---
     rect.y += vy
     if vy != 0:
@@ -68,11 +254,13 @@ def move_and_collide_rect(rect, vx, vy, is_solid_tile):
                     # Collision moving down: snap rect flush to top edge of tile
                     rect.bottom = tile_to_world(tx, ty)[1]
                     vy = 0
+                    break
             else:
                 ty = top
                 if is_solid_tile(tx, ty):
                     # Collision moving up: snap rect flush to bottom edge of tile
                     rect.top = tile_to_world(tx, ty + 1)[1]
                     vy = 0
+                    break
     # Return corrected rect and possibly adjusted velocities
     return rect, vx, vy
@@ -20,3 +20,14 @@ PLAYER_COLLIDER_H = 2 * settings.TILE_SIZE
 # for presentation while the collision rect (PLAYER_COLLIDER_W/H) remains
 # authoritative for physics. Set to 1 to keep visuals matching collider by default.
 PLAYER_VISUAL_SCALE = 2
+
+# Tile ids used by the CSV scenes (see src/scenes/TILEMAP_KEY.md)
+TILE_EMPTY = 0
+TILE_GROUND = 1
+TILE_PLATFORM = 2
+TILE_SPIKES = 3
+TILE_INVISIBLE_HAZARD = 4
+TILE_SPAWN = 5
+# Tile ids that block movement / kill the player
+SOLID_TILE_IDS = (TILE_GROUND, TILE_PLATFORM)
+HAZARD_TILE_IDS = (TILE_SPIKES, TILE_INVISIBLE_HAZARD)
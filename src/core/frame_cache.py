@@ -0,0 +1,160 @@
+"""
+Persistent cache of processed sprite frames.
+
+Slicing a sheet and aligning every frame onto its canvas (see
+`load_aligned_vertical_sprite_frames`) costs a PNG decode plus a crop and
+blit per frame on every launch. The result is stored in FRAME_CACHE_DIR as
+one binary file per sheet and parameter set:
+
+    header   magic, version, frame count, frame width, frame height
+    pixels   the frames stacked vertically, RGBA, row-major
+
+The file name is `<sheet stem>-<path hash>-<key>`: the path hash tells
+apart same-named sheets of different characters, and the key hashes the
+sheet's bytes and the processing parameters, so editing the sheet or
+changing the parameters simply misses the cache. A warm start is one file read and one `pygame.image.frombuffer`.
+
+`read_aligned_frames` does the disk work (reading the entry, or decoding
+the sheet on a miss) and may run on a loader thread; `finish_aligned_frames`
+then builds the frames on the main thread.
+"""
+
+import hashlib
+import os
+import struct
+from pathlib import Path
+
+import pygame
+from src import settings
+from src.core.support import load_aligned_vertical_sprite_frames
+from src.core.surfaces import has_display
+
+MAGIC = b"IAFC"
+VERSION = 2
+CACHE_SUFFIX = ".frames"
+
+# magic, version, frame count, frame width, frame height
+HEADER = struct.Struct("<4sBxHHH")
+
+
+class FrameCacheError(ValueError):
+    """Raised when a cache file is truncated or has another version."""
+
+
+def cache_key(source, params):
+    """Hash of the source file's bytes and the processing parameters."""
+    digest = hashlib.sha1(f"{VERSION}:{params!r}:".encode())
+    with open(source, "rb") as file:
+        digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+
+def cache_path(cache_dir, source, key):
+    source_id = hashlib.sha1(os.path.normcase(os.path.abspath(source)).encode()).hexdigest()[:8]
+    return Path(cache_dir) / f"{Path(source).stem}-{source_id}-{key}{CACHE_SUFFIX}"
+
+
+def pack_frames(frames):
+    """Serialize same-sized frames into the cache format (returns bytes)."""
+    width, height = frames[0].get_size()
+    header = HEADER.pack(MAGIC, VERSION, len(frames), width, height)
+    pixels = b"".join(pygame.image.tobytes(frame, "RGBA") for frame in frames)
+    return header + pixels
+
+
+def unpack_frames(data, path=None):
+    """Frames from cache bytes.
+
+    The frames are subsurfaces of one surface wrapping the pixel data.
+    """
+    view = memoryview(data)
+    if len(view) < HEADER.size:
+        raise FrameCacheError(f"{path}: file too small")
+    magic, version, count, width, height = HEADER.unpack_from(view, 0)
+    if magic != MAGIC or version != VERSION or count == 0:
+        raise FrameCacheError(f"{path}: unsupported frame cache header")
+    if len(view) != HEADER.size + count * width * height * 4:
+        raise FrameCacheError(f"{path}: truncated frame data")
+    strip = pygame.image.frombuffer(view[HEADER.size:], (width, height * count), "RGBA")
+    # Own the pixels (in display format when possible) instead of the buffer
+    strip = strip.convert_alpha() if has_display() else strip.copy()
+    return [strip.subsurface((0, i * height, width, height)) for i in range(count)]
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+    # Entries for older versions of the same sheet (stem and path hash) are
+    # unreachable now
+    stem = path.name.rsplit("-", 1)[0]
+    for old in path.parent.glob(f"{stem}-*{CACHE_SUFFIX}"):
+        if old != path and old.name.rsplit("-", 1)[0] == stem:
+            old.unlink()
+
+
+class PendingFrames:
+    """The disk half of `load_aligned_frames`, finished by `finish_aligned_frames`.
+
+    data: bytes of the cache entry on a hit; sheet: the decoded sheet otherwise.
+    """
+
+    def __init__(self, image_path, params, path=None, data=None, sheet=None):
+        self.image_path = image_path
+        self.params = params
+        self.path = path
+        self.data = data
+        self.sheet = sheet
+
+
+def read_aligned_frames(image_path, frame_width, frame_height, num_frames, align_size=(48, 48), cache_dir=None):
+    """Read a sheet's cache entry, or decode the sheet on a miss.
+
+    Touches no display state, so it is safe on a worker thread.
+    """
+    if cache_dir is None:
+        cache_dir = settings.FRAME_CACHE_DIR
+    params = (frame_width, frame_height, num_frames, tuple(align_size))
+    if cache_dir:
+        path = cache_path(cache_dir, image_path, cache_key(image_path, params))
+        try:
+            with open(path, "rb") as file:
+                return PendingFrames(image_path, params, path, data=file.read())
+        except OSError:
+            pass
+    else:
+        path = None
+    return PendingFrames(image_path, params, path, sheet=pygame.image.load(image_path))
+
+
+def finish_aligned_frames(pending):
+    """Frames of a `read_aligned_frames` result (main thread: converts them)."""
+    if pending.data is not None:
+        try:
+            return unpack_frames(pending.data, pending.path)
+        except FrameCacheError:
+            pass
+
+    frame_width, frame_height, num_frames, align_size = pending.params
+    frames = load_aligned_vertical_sprite_frames(
+        pending.image_path, frame_width, frame_height, num_frames, align_size, sheet=pending.sheet
+    )
+    if pending.path is not None:
+        try:
+            _write(pending.path, pack_frames(frames))
+        except OSError as e:
+            print(f"Could not write frame cache {pending.path}: {e}")
+    return frames
+
+
+def load_aligned_frames(image_path, frame_width, frame_height, num_frames, align_size=(48, 48), cache_dir=None):
+    """`load_aligned_vertical_sprite_frames`, served from the frame cache.
+
+    cache_dir defaults to FRAME_CACHE_DIR; an empty value disables the
+    cache. An unreadable or unwritable cache only costs the processing.
+    """
+    return finish_aligned_frames(
+        read_aligned_frames(image_path, frame_width, frame_height, num_frames, align_size, cache_dir)
+    )
@@ -0,0 +1,48 @@
+"""
+Watch mode for scene CSVs.
+
+`MapWatcher` polls the modification times of the scene CSVs (no extra
+dependencies, one stat per file per interval). The game reloads changed
+scenes through `WorldMap.reload`, which diffs the new layout against the
+loaded one so only the affected chunks, colliders and tile columns are
+rebuilt and the player keeps their position.
+"""
+
+import os
+import time
+
+from src import settings
+
+
+class MapWatcher:
+    """Report scene CSVs whose mtime changed since the last poll."""
+
+    def __init__(self, paths, interval=None, clock=time.monotonic):
+        if interval is None:
+            interval = settings.HOT_RELOAD_INTERVAL
+        self.paths = list(dict.fromkeys(paths))
+        self.interval = interval
+        self._clock = clock
+        self._next_poll = clock() + interval
+        self._mtimes = {path: self._mtime(path) for path in self.paths}
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None  # missing or mid-save; picked up on a later poll
+
+    def poll(self, force=False):
+        """Return the paths that changed (at most once per interval)."""
+        now = self._clock()
+        if not force and now < self._next_poll:
+            return []
+        self._next_poll = now + self.interval
+        changed = []
+        for path in self.paths:
+            mtime = self._mtime(path)
+            if mtime is not None and mtime != self._mtimes[path]:
+                self._mtimes[path] = mtime
+                changed.append(path)
+        return changed
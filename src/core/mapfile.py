@@ -0,0 +1,212 @@
+"""
+Compiled binary tilemaps.
+
+CSV scenes (see src/scenes/TILEMAP_KEY.md) are compiled into a compact
+binary file next to the CSV (`map.csv` -> `map.tilemap`):
+
+    header   magic, version, order, width, height, special count
+    specials one (tile id, col, row) entry per special tile (spawn, hazards)
+    grid     width * height uint8 tile ids, row-major
+
+At runtime the file is memory-mapped, so loading a scene doesn't parse any
+text and each row is a zero-copy view into the map. The specials index makes
+lookups such as "where is the spawn tile" O(1) instead of a full scan.
+`load_map` recompiles automatically when the CSV is newer than the binary.
+"""
+
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from src.core.constants import HAZARD_TILE_IDS, TILE_SPAWN
+from src.core.support import load_csv_layout
+
+MAGIC = b"IATF"
+VERSION = 1
+ORDER_ROW_MAJOR = 0
+COMPILED_SUFFIX = ".tilemap"
+
+# magic, version, order, width, height, special count
+HEADER = struct.Struct("<4sBBHHI")
+# tile id, col, row
+SPECIAL = struct.Struct("<BxHH")
+# Widths, heights and special tile coordinates are stored as uint16
+MAX_DIMENSION = 0xFFFF
+
+# Tile ids indexed in the header: hazards and the spawn tile
+SPECIAL_TILE_IDS = HAZARD_TILE_IDS + (TILE_SPAWN,)
+SPAWN_TILE_ID = TILE_SPAWN
+
+
+class MapFormatError(ValueError):
+    """Raised when a CSV can't be compiled or a compiled map is invalid."""
+
+
+def _cell_value(cell, row, col):
+    # '' and '-1' are empty space, like the rest of the tile code
+    if cell == "" or cell == "-1":
+        return 0
+    try:
+        value = int(cell)
+    except ValueError:
+        raise MapFormatError(f"invalid tile id {cell!r} at row {row}, col {col}")
+    if not 0 <= value <= 255:
+        raise MapFormatError(f"tile id {value} out of range at row {row}, col {col}")
+    return value
+
+
+def compile_layout(layout):
+    """Compile raw CSV rows into the binary map format (returns bytes).
+
+    Short rows are padded with empty tiles to the widest row.
+    """
+    height = len(layout)
+    width = max((len(row) for row in layout), default=0)
+    if width > MAX_DIMENSION or height > MAX_DIMENSION:
+        raise MapFormatError(f"map is {width}x{height} tiles; the format allows at most {MAX_DIMENSION} per side")
+    grid = bytearray(width * height)
+    specials = []
+    for r, row in enumerate(layout):
+        for c, cell in enumerate(row):
+            value = _cell_value(cell, r, c)
+            grid[r * width + c] = value
+            if value in SPECIAL_TILE_IDS:
+                specials.append((value, c, r))
+    header = HEADER.pack(MAGIC, VERSION, ORDER_ROW_MAJOR, width, height, len(specials))
+    return header + b"".join(SPECIAL.pack(*entry) for entry in specials) + bytes(grid)
+
+
+def compiled_path(csv_path):
+    return Path(csv_path).with_suffix(COMPILED_SUFFIX)
+
+
+def compile_csv(csv_path, out_path=None):
+    """Compile a CSV scene and write it atomically; returns the output path."""
+    out_path = Path(out_path) if out_path is not None else compiled_path(csv_path)
+    data = compile_layout(load_csv_layout(csv_path))
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(data)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+def is_stale(csv_path, out_path=None):
+    out_path = Path(out_path) if out_path is not None else compiled_path(csv_path)
+    if not out_path.exists():
+        return True
+    return os.path.getmtime(csv_path) > os.path.getmtime(out_path)
+
+
+class CompiledMap:
+    """Read-only view of a compiled map.
+
+    `rows` holds one memoryview per row, so existing row-based code can
+    index `rows[ty][tx]` directly. Call `close()` (or use as a context
+    manager) to release the mapping.
+    """
+
+    def __init__(self, buffer, path=None):
+        self.path = path
+        self._buffer = buffer
+        view = memoryview(buffer)
+        if len(view) < HEADER.size:
+            raise MapFormatError(f"{path}: file too small")
+        magic, version, order, width, height, count = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION or order != ORDER_ROW_MAJOR:
+            raise MapFormatError(f"{path}: unsupported map header")
+        self.width = width
+        self.height = height
+        grid_start = HEADER.size + count * SPECIAL.size
+        if len(view) != grid_start + width * height:
+            raise MapFormatError(f"{path}: truncated map data")
+        self.specials = {}  # tile id -> list of (col, row)
+        for i in range(count):
+            tile_id, col, row = SPECIAL.unpack_from(view, HEADER.size + i * SPECIAL.size)
+            self.specials.setdefault(tile_id, []).append((col, row))
+        self.grid = view[grid_start:]
+        self.rows = [self.grid[r * width:(r + 1) * width] for r in range(height)]
+
+    def tile_at(self, col, row):
+        return self.grid[row * self.width + col]
+
+    def find_first(self, tile_id):
+        """Return (col, row) of the first tile_id in the specials index, or None."""
+        positions = self.specials.get(tile_id)
+        return positions[0] if positions else None
+
+    def close(self):
+        for row in self.rows:
+            row.release()
+        self.rows = []
+        self.grid.release()
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                # Someone still holds a row view; the mapping is released
+                # once those views are garbage collected.
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_compiled(path):
+    """Memory-map a compiled map file."""
+    with open(path, "rb") as file:
+        # mmap refuses empty files; a file cut short (e.g. by a crash while
+        # writing) must fall back to the CSV like any other bad map
+        if os.fstat(file.fileno()).st_size < HEADER.size:
+            raise MapFormatError(f"{path}: file too small")
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return CompiledMap(buffer, path)
+
+
+def load_map(csv_path):
+    """Load a scene from its compiled form, (re)compiling it if needed."""
+    out_path = compiled_path(csv_path)
+    if is_stale(csv_path, out_path):
+        compile_csv(csv_path, out_path)
+    try:
+        return open_compiled(out_path)
+    except MapFormatError:
+        # Written by an older version of this module
+        compile_csv(csv_path, out_path)
+        return open_compiled(out_path)
+
+
+def _read_header(path):
+    with open(path, "rb") as file:
+        header = file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise MapFormatError(f"{path}: file too small")
+    magic, version, order, width, height, count = HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION or order != ORDER_ROW_MAJOR:
+        raise MapFormatError(f"{path}: unsupported map header")
+    return width, height
+
+
+def read_size(csv_path):
+    """Return (width, height) of a scene by reading only its compiled header."""
+    out_path = compiled_path(csv_path)
+    if is_stale(csv_path, out_path):
+        compile_csv(csv_path, out_path)
+    try:
+        return _read_header(out_path)
+    except MapFormatError:
+        compile_csv(csv_path, out_path)
+        return _read_header(out_path)
+
+
+def compile_all(scenes_dir="src/scenes", force=False):
+    """Compile every scene CSV under scenes_dir; returns the written paths."""
+    written = []
+    for csv_path in sorted(Path(scenes_dir).glob("*/*.csv")):
+        if force or is_stale(csv_path):
+            written.append(compile_csv(csv_path))
+    return written
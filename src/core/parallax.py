@@ -0,0 +1,138 @@
+"""
+Layered parallax backgrounds drawn from pre-rendered wrap-around strips.
+
+Each layer is painted once into a strip whose right edge continues
+seamlessly into its left edge and that is at least as wide as the screen.
+Per frame a layer is then just placed at its scroll factor: one or two
+strip blits, no drawing. Layers plug into `YSortCameraGroup.static_layers`
+through the same `draw_items` protocol as `ChunkCache`.
+
+Painting only touches plain surfaces, so strips can be painted on a loader
+thread (`paint_strips`) and finished on the main thread (`from_strips`).
+"""
+
+import math
+import random
+
+import pygame
+from src import settings
+from src.core.surfaces import optimize
+
+
+def _strip_width(period, min_width):
+    """Smallest multiple of period that is at least min_width."""
+    return period * max(1, math.ceil(min_width / period))
+
+
+def render_hills(width, height, color, seed=0, amplitude=0.35):
+    """A band of rolling hills whose outline wraps around at `width`.
+
+    The outline is a sum of sines with whole periods per strip, so the
+    strip tiles seamlessly. Returns a plain surface; optimize it before use.
+    """
+    rng = random.Random(seed)
+    waves = [(rng.randint(1, 3) * k, rng.uniform(0, math.tau), rng.uniform(0.4, 1.0) / k) for k in (1, 2, 4)]
+    total = sum(weight for _, _, weight in waves)
+    crest = height * amplitude
+    points = [(0, height)]
+    for x in range(0, width + 1, 8):
+        wave = sum(weight * math.sin(math.tau * cycles * x / width + phase) for cycles, phase, weight in waves)
+        points.append((x, crest * (1 - wave / total)))
+    points.append((width, height))
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.polygon(surface, color, points)
+    return surface
+
+
+def render_clouds(width, height, color, seed=0, count=6):
+    """Scattered flat clouds; clouds crossing the right edge wrap to the left.
+
+    Returns a plain surface; optimize it before use.
+    """
+    rng = random.Random(seed)
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    for _ in range(count * width // settings.SCREEN_WIDTH):
+        cloud_w = rng.randint(80, 180)
+        cloud_h = rng.randint(24, 40)
+        x = rng.randrange(width)
+        y = rng.randint(0, max(0, height - cloud_h))
+        for shift in (0, -width):
+            pygame.draw.ellipse(surface, color, (x + shift, y, cloud_w, cloud_h))
+            pygame.draw.ellipse(surface, color, (x + shift + cloud_w // 4, y - cloud_h // 2, cloud_w // 2, cloud_h))
+    return surface
+
+
+# Strip painters for PARALLAX_LAYERS entries: kind -> (painter, strip height)
+PAINTERS = {
+    "hills": (render_hills, 480),
+    "clouds": (render_clouds, 120),
+}
+
+
+def paint_strips(config=None, view_width=None):
+    """Paint the strips of PARALLAX_LAYERS-style entries (off-thread safe).
+
+    Returns a list of (plain strip, factor, top) for `Parallax.from_strips`.
+    """
+    if config is None:
+        config = settings.PARALLAX_LAYERS
+    view_width = view_width or settings.SCREEN_WIDTH
+    painted = []
+    for seed, (kind, color, factor, top) in enumerate(config):
+        painter, height = PAINTERS[kind]
+        painted.append((painter(_strip_width(settings.SCREEN_WIDTH, view_width), height, color, seed), factor, top))
+    return painted
+
+
+class ParallaxLayer:
+    """A wrap-around strip that scrolls at `factor` times the camera speed.
+
+    pos: where the strip's top-left sits for a camera offset of (0, 0); the
+    layer appears at pos - offset * factor.
+    """
+
+    def __init__(self, strip, factor, pos=(0, 0)):
+        self.strip = strip
+        self.factor = factor
+        self.pos = pygame.Vector2(pos)
+        self.width = strip.get_width()
+        self.height = strip.get_height()
+
+    def draw_items(self, items, offset, size, view=None):
+        """Append the (strip, dest) blits covering a view of size at offset."""
+        y = round(self.pos.y - offset[1] * self.factor)
+        if y >= size[1] or y + self.height <= 0:
+            return
+        # Leftmost copy starts in (-width, 0]; a strip at least as wide as the
+        # view therefore needs at most one more copy to its right.
+        x = -(round(offset[0] * self.factor - self.pos.x) % self.width)
+        while x < size[0]:
+            items.append((self.strip, (x, y)))
+            x += self.width
+
+
+class Parallax:
+    """Back-to-front parallax layers, drawn as one camera static layer."""
+
+    def __init__(self, layers=()):
+        self.layers = list(layers)
+
+    @classmethod
+    def from_settings(cls, config=None, view_width=None, reference_y=0):
+        """Build layers from PARALLAX_LAYERS-style entries.
+
+        Each entry is (kind, color, factor, top): `top` is the layer's screen y
+        when the camera's offset y equals reference_y.
+        """
+        return cls.from_strips(paint_strips(config, view_width), reference_y)
+
+    @classmethod
+    def from_strips(cls, painted, reference_y=0):
+        """Finish strips from `paint_strips` into layers (main thread)."""
+        return cls(
+            ParallaxLayer(optimize(strip), factor, (0, top + reference_y * factor)) for strip, factor, top in painted
+        )
+
+    def draw_items(self, items, offset, size, view=None):
+        for layer in self.layers:
+            layer.draw_items(items, offset, size, view)
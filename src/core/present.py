@@ -0,0 +1,169 @@
+"""
+Frame presentation: fixed-size backbuffer, window scaling, dirty rects.
+
+The game always renders into a backbuffer of the logical resolution
+(SCREEN_WIDTH x SCREEN_HEIGHT). At present time the backbuffer is scaled to
+the (resizable) window in one nearest-neighbour `transform.scale` by the
+largest integer factor that fits, centered with black letterbox bars; a
+window smaller than the logical size gets a plain fit instead. Render cost
+therefore doesn't depend on the window size. When the window is exactly the
+logical size there is nothing to scale, so the game draws straight into the
+window and presenting costs no copy.
+
+With `settings.DIRTY_RECTS` on, a frame only pushes the regions that can
+have changed: where sprites were drawn this frame and the previous one,
+plus any regions marked by UI code. While the camera scrolls every world
+pixel moves, so once the camera offset changes by more than
+`settings.DIRTY_SCROLL_THRESHOLD` pixels (or the dirty area covers most of
+the screen) the frame falls back to a full flip.
+"""
+
+import pygame
+from src import settings
+from src.core.surfaces import new_surface
+
+LETTERBOX_COLOR = (0, 0, 0)
+
+
+class Presenter:
+    """Own the backbuffer and present it to the window.
+
+    Draw into `surface`; marked regions are in backbuffer coordinates. Call
+    `invalidate()` whenever the whole screen changes outside the camera's
+    knowledge (state changes, overlays appearing, map reloads) so the next
+    frame is a full flip, and `resize()` when the window size changed.
+    `surface` is the window itself while `direct` is true, so holders of
+    it must pick it up again after `resize()`.
+    """
+
+    def __init__(self, size=None, enabled=None, scroll_threshold=None, full_fraction=0.5):
+        self.size = size or (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        self.enabled = settings.DIRTY_RECTS if enabled is None else enabled
+        if scroll_threshold is None:
+            scroll_threshold = settings.DIRTY_SCROLL_THRESHOLD
+        self.scroll_threshold = scroll_threshold
+        self.full_fraction = full_fraction
+        # Offscreen backbuffer, created once in the display format when the
+        # window needs scaling or letterboxing
+        self._backbuffer = None
+        self.surface = None  # what everything draws into
+        self.direct = False  # surface is the window
+        self.window = None
+        self.scale = 1  # integer upscale factor; 0 when the window is too small
+        self.dest = pygame.Rect((0, 0), self.size)  # backbuffer area in the window
+        self.rects = []  # marked this frame
+        self._previous = []  # sprite regions presented last frame
+        self._offset = None
+        self._full = True
+        self.pixels = 0  # pixels pushed by the last present()
+        self.full_frames = 0
+        self.resize()
+        if self.surface is None:
+            self.surface = self._offscreen()
+
+    # --- Window layout ---
+    def _offscreen(self):
+        if self._backbuffer is None:
+            self._backbuffer = new_surface(self.size)
+        return self._backbuffer
+
+    def resize(self):
+        """Recompute the scale and letterbox for the current window size."""
+        self.window = pygame.display.get_surface()
+        if self.window is None:
+            return
+        width, height = self.size
+        window_w, window_h = self.window.get_size()
+        self.scale = min(window_w // width, window_h // height)
+        if self.scale >= 1:
+            size = (width * self.scale, height * self.scale)
+        else:
+            fit = min(window_w / width, window_h / height)
+            size = (max(1, int(width * fit)), max(1, int(height * fit)))
+        self.dest = pygame.Rect((0, 0), size)
+        self.dest.center = (window_w // 2, window_h // 2)
+        self.direct = self.scale == 1 and (window_w, window_h) == self.size
+        self.surface = self.window if self.direct else self._offscreen()
+        if not self.direct:
+            self.window.fill(LETTERBOX_COLOR)
+        self.invalidate()
+
+    def to_surface(self, pos):
+        """Map a window position (e.g. a mouse event) to backbuffer coordinates."""
+        x = (pos[0] - self.dest.x) * self.size[0] / self.dest.width
+        y = (pos[1] - self.dest.y) * self.size[1] / self.dest.height
+        return int(x), int(y)
+
+    def map_event(self, event):
+        """Copy of a mouse event with `pos` (and `rel`) in backbuffer coordinates."""
+        changes = {"pos": self.to_surface(event.pos)}
+        if hasattr(event, "rel"):
+            changes["rel"] = (
+                int(event.rel[0] * self.size[0] / self.dest.width),
+                int(event.rel[1] * self.size[1] / self.dest.height),
+            )
+        return pygame.event.Event(event.type, {**event.dict, **changes})
+
+    def _to_window(self, rect):
+        scale = self.scale
+        return pygame.Rect(
+            self.dest.x + rect.x * scale, self.dest.y + rect.y * scale, rect.width * scale, rect.height * scale
+        )
+
+    def _copy(self, rect):
+        """Scale a backbuffer region onto the window; returns the window rect."""
+        if self.direct:
+            return rect  # already drawn there
+        if rect == self.surface.get_rect():
+            source, target = self.surface, self.dest
+        else:
+            source, target = self.surface.subsurface(rect), self._to_window(rect)
+        if self.scale == 1:
+            self.window.blit(source, target)
+        else:
+            pygame.transform.scale(source, target.size, self.window.subsurface(target))
+        return target
+
+    # --- Dirty regions ---
+    def mark(self, rect):
+        self.rects.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        self._full = True
+
+    def _needs_full(self, offset):
+        if self._full or self._offset is None or self.scale < 1:
+            return True
+        dx = abs(offset[0] - self._offset[0])
+        dy = abs(offset[1] - self._offset[1])
+        if dx > self.scroll_threshold or dy > self.scroll_threshold:
+            return True
+        area = sum(rect.width * rect.height for rect in self.rects)
+        return area > self.size[0] * self.size[1] * self.full_fraction
+
+    def present(self, offset, sprite_rects=()):
+        """Push this frame. sprite_rects: backbuffer rects drawn by the camera."""
+        offset = (int(offset[0]), int(offset[1]))
+        current = [pygame.Rect(rect) for rect in sprite_rects]
+        # Regions a sprite left still show its old pixels on the display
+        self.rects.extend(self._previous)
+        self.rects.extend(current)
+        if not self.enabled or self._needs_full(offset):
+            if self.scale >= 1:
+                self._copy(self.surface.get_rect())
+            else:
+                pygame.transform.smoothscale(self.surface, self.dest.size, self.window.subsurface(self.dest))
+            pygame.display.flip()
+            self.pixels = self.dest.width * self.dest.height
+            self.full_frames += 1
+        else:
+            bounds = self.surface.get_rect()
+            rects = [rect.clip(bounds) for rect in self.rects]
+            rects = [self._copy(rect) for rect in rects if rect.width and rect.height]
+            if rects:
+                pygame.display.update(rects)
+            self.pixels = sum(rect.width * rect.height for rect in rects)
+        self._previous = current
+        self._offset = offset
+        self._full = False
+        self.rects.clear()
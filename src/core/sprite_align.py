@@ -1,10 +1,15 @@
-import pygame
+from src.core.surfaces import new_surface
+
+
+def visible_rect(frame):
+    """Bounding rect of the frame's visible (non-transparent) pixels."""
+    return frame.get_bounding_rect()
 
 
 def align_frame_to_midbottom(frame, canvas_size=(48, 48)):
-    bbox = frame.get_bounding_rect()
+    bbox = visible_rect(frame)
     cropped = frame.subsurface(bbox).copy()
-    canvas = pygame.Surface(canvas_size, pygame.SRCALPHA)
+    canvas = new_surface(canvas_size, per_pixel_alpha=True)
     canvas_rect = canvas.get_rect()
     dx = canvas_rect.midbottom[0] - cropped.get_rect().midbottom[0]
     dy = canvas_rect.midbottom[1] - cropped.get_rect().midbottom[1]
@@ -1,16 +1,21 @@
 import csv
 import pygame
 
+from src.core.surfaces import new_surface
+
 
 def load_aligned_vertical_sprite_frames(
-    image_path, frame_width, frame_height, num_frames, align_size=(48, 48)
+    image_path, frame_width, frame_height, num_frames, align_size=(48, 48), sheet=None
 ):
+    """sheet: the already decoded image_path (e.g. by a loader thread)."""
     from src.core.sprite_align import align_frame_to_midbottom
 
-    sprite_sheet = pygame.image.load(image_path).convert_alpha()
+    if sheet is None:
+        sheet = pygame.image.load(image_path)
+    sprite_sheet = sheet.convert_alpha()
     frames = []
     for i in range(num_frames):
-        frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+        frame_surface = new_surface((frame_width, frame_height), per_pixel_alpha=True)
         frame_rect = pygame.Rect(0, i * frame_height, frame_width, frame_height)
         frame_surface.blit(sprite_sheet, (0, 0), frame_rect)
         aligned = align_frame_to_midbottom(frame_surface, align_size)
@@ -31,7 +36,7 @@ def load_sprite_frames(image_path, frame_width, frame_height, num_frames):
     sprite_sheet = pygame.image.load(image_path).convert_alpha()
     frames = []
     for i in range(num_frames):
-        frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+        frame_surface = new_surface((frame_width, frame_height), per_pixel_alpha=True)
         frame_rect = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
         frame_surface.blit(sprite_sheet, (0, 0), frame_rect)
         frames.append(frame_surface)
@@ -42,7 +47,7 @@ def load_vertical_sprite_frames(image_path, frame_width, frame_height, num_frame
     sprite_sheet = pygame.image.load(image_path).convert_alpha()
     frames = []
     for i in range(num_frames):
-        frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+        frame_surface = new_surface((frame_width, frame_height), per_pixel_alpha=True)
         frame_rect = pygame.Rect(0, i * frame_height, frame_width, frame_height)
         frame_surface.blit(sprite_sheet, (0, 0), frame_rect)
         frames.append(frame_surface)
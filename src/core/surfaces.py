@@ -0,0 +1,118 @@
+"""
+Display-format surface factory.
+
+A surface whose pixel format differs from the target is converted pixel by
+pixel on every blit. Runtime surfaces in src/ are therefore created and
+finished here so they match the display once, up front:
+
+- `new_surface` creates a blank surface in the display format, opaque or
+  with per-pixel alpha when the caller will paint translucent pixels.
+- `optimize` converts a finished surface and picks the cheapest blit mode:
+  fully opaque pixels become a plain opaque surface, alpha that is only ever
+  fully on or off becomes an RLE colorkey, a constant alpha is RLE encoded,
+  and only genuinely blended pixels keep per-pixel alpha.
+
+Without a display mode (tests, tools) surfaces are returned unconverted;
+callers that cache surfaces can check `has_display` and finish them later.
+"""
+
+import pygame
+
+# Transparent color for surfaces whose alpha is all-or-nothing
+COLORKEY = (255, 0, 255)
+
+# optimize() results, see `surface_kind`
+OPAQUE = "opaque"
+COLORKEYED = "colorkey"
+CONSTANT_ALPHA = "constant-alpha"
+PER_PIXEL_ALPHA = "per-pixel-alpha"
+
+
+def has_display():
+    """True once a display mode is set (convert() needs one)."""
+    return pygame.display.get_surface() is not None
+
+
+def new_surface(size, per_pixel_alpha=False, fill=None):
+    """Blank surface of size in the display format.
+
+    per_pixel_alpha: start fully transparent with an alpha channel; use this
+    for canvases that will be painted with translucent pixels.
+    """
+    if per_pixel_alpha:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        if has_display():
+            surface = surface.convert_alpha()
+    else:
+        surface = pygame.Surface(size)
+        if has_display():
+            surface = surface.convert()
+    if fill is not None:
+        surface.fill(fill)
+    return surface
+
+
+def _alpha_kind(surface):
+    """OPAQUE, COLORKEYED or PER_PIXEL_ALPHA for a surface with an alpha channel."""
+    width, height = surface.get_size()
+    if width == 0 or height == 0:
+        return OPAQUE
+    solid = pygame.mask.from_surface(surface, 254)
+    if solid.count() == width * height:
+        return OPAQUE
+    if pygame.mask.from_surface(surface, 0).count() != solid.count():
+        return PER_PIXEL_ALPHA
+    # All-or-nothing alpha; usable as a colorkey unless a solid pixel
+    # already has the key color.
+    keyed = pygame.mask.from_threshold(surface, COLORKEY, (1, 1, 1, 255))
+    if keyed.overlap_area(solid, (0, 0)):
+        return PER_PIXEL_ALPHA
+    return COLORKEYED
+
+
+def optimize(surface, alpha=None):
+    """Return surface converted to the display format with the cheapest blit mode.
+
+    alpha: constant surface alpha (0-255) for e.g. translucent overlays;
+    it is RLE encoded. A surface with an existing colorkey keeps it.
+    The result must be treated as finished: drawing onto an RLE surface
+    forces it to be decoded and re-encoded.
+    """
+    if not has_display():
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        return surface
+    if alpha is not None:
+        surface = surface.convert()
+        surface.set_alpha(alpha, pygame.RLEACCEL)
+        return surface
+    colorkey = surface.get_colorkey()
+    if colorkey is not None:
+        surface = surface.convert()
+        surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        return surface
+    if not surface.get_masks()[3]:
+        return surface.convert()
+
+    kind = _alpha_kind(surface)
+    if kind == OPAQUE:
+        return surface.convert()
+    if kind == PER_PIXEL_ALPHA:
+        return surface.convert_alpha()
+    keyed = surface.convert()
+    transparent = pygame.mask.from_surface(surface, 0)
+    transparent.invert()
+    transparent.to_surface(keyed, setcolor=COLORKEY, unsetcolor=None)
+    keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return keyed
+
+
+def surface_kind(surface):
+    """How surface is blitted: OPAQUE, COLORKEYED, CONSTANT_ALPHA or PER_PIXEL_ALPHA."""
+    if surface.get_masks()[3]:
+        return PER_PIXEL_ALPHA
+    if surface.get_colorkey() is not None:
+        return COLORKEYED
+    if surface.get_alpha() is not None and surface.get_alpha() < 255:
+        return CONSTANT_ALPHA
+    return OPAQUE
@@ -0,0 +1,85 @@
+"""
+Shared (flyweight) tile surfaces.
+
+Every tile of the same id looks identical, so each look is painted once per
+theme, converted to the display format, and the same Surface is handed to
+every tile sprite. Tiles must treat these surfaces as read-only.
+"""
+
+import pygame
+from src import settings
+from src.core.surfaces import has_display, new_surface, optimize
+
+# Tile colors per theme (see src/scenes/TILEMAP_KEY.md for the tile ids)
+TILE_THEMES = {
+    "default": {
+        1: (139, 69, 19),  # Ground tile
+        2: (100, 100, 100),  # Platform tile
+        3: (220, 20, 20),  # Visible hazard (red)
+        5: (255, 215, 0),  # Player spawnpoint (gold/yellow)
+    },
+}
+
+# Darker shade used for the spike pattern on visible hazards
+SPIKE_COLOR = (180, 0, 0)
+
+# (theme, tile_id) -> Surface
+_surface_cache = {}
+
+
+def _paint_block(color):
+    surface = new_surface((settings.TILE_SIZE, settings.TILE_SIZE), fill=color)
+    pygame.draw.rect(surface, settings.BLACK, surface.get_rect(), 2)
+    return surface
+
+
+def _paint_spikes(color):
+    surface = new_surface((settings.TILE_SIZE, settings.TILE_SIZE), fill=color)
+    points = [
+        (0, settings.TILE_SIZE),
+        (settings.TILE_SIZE // 4, 0),
+        (settings.TILE_SIZE // 2, settings.TILE_SIZE),
+        (3 * settings.TILE_SIZE // 4, 0),
+        (settings.TILE_SIZE, settings.TILE_SIZE),
+    ]
+    pygame.draw.polygon(surface, SPIKE_COLOR, points)
+    return surface
+
+
+def _paint_invisible():
+    return new_surface((settings.TILE_SIZE, settings.TILE_SIZE), per_pixel_alpha=True)
+
+
+def _paint(tile_id, theme):
+    colors = TILE_THEMES[theme]
+    if tile_id == 3:
+        return _paint_spikes(colors[3])
+    if tile_id == 4:
+        return _paint_invisible()
+    return _paint_block(colors[tile_id])
+
+
+def _to_display_format(surface):
+    # convert() needs a display mode; without one (tests, tools) keep the
+    # surface as-is and mark it so it is converted on a later request.
+    if not has_display():
+        return surface, False
+    return optimize(surface), True
+
+
+def get_tile_surface(tile_id, theme="default"):
+    """Return the shared Surface for tile_id in the given theme."""
+    key = (theme, tile_id)
+    cached = _surface_cache.get(key)
+    if cached is not None:
+        surface, converted = cached
+        if converted or not has_display():
+            return surface
+    surface, converted = _to_display_format(_paint(tile_id, theme))
+    _surface_cache[key] = (surface, converted)
+    return surface
+
+
+def clear_tile_surfaces():
+    """Drop all cached surfaces (e.g. after changing the display mode)."""
+    _surface_cache.clear()
@@ -0,0 +1,152 @@
+"""
+Column streaming for the infinitely looping tile world.
+
+Instead of rebuilding every tile sprite whenever the player has moved far
+enough, the streamer keeps a fixed-width window of tile columns alive around
+the player. Columns entering on the leading edge are spawned and columns
+leaving on the trailing edge are recycled through a `TilePool`, so the
+per-frame cost only depends on how many columns were crossed (usually 0 or 1).
+
+The main game doesn't stream tile sprites: collisions query a
+`collision.TileGrid` and tiles are drawn from baked chunks. The streamer is
+for code that needs per-tile sprites in groups.
+"""
+
+from src import settings
+
+
+def tile_value(cell):
+    """Convert a raw CSV cell to an int tile id ('' and '-1' are empty)."""
+    if cell == "" or cell == "-1":
+        return 0
+    return int(cell)
+
+
+def parse_layout(layout):
+    """Convert raw CSV rows to rows of int tile ids."""
+    return [[tile_value(cell) for cell in row] for row in layout]
+
+
+class TilePool:
+    """Free lists of reusable tile sprites, keyed by tile id.
+
+    `factories` maps a tile id to a callable `factory(pos)` that creates a
+    new sprite when the free list for that id is empty.
+    """
+
+    def __init__(self, factories):
+        self.factories = factories
+        self._free = {tile_id: [] for tile_id in factories}
+        self.created = 0
+
+    def acquire(self, tile_id, pos, groups):
+        free = self._free[tile_id]
+        if free:
+            sprite = free.pop()
+            sprite.rect.topleft = pos
+        else:
+            sprite = self.factories[tile_id](pos)
+            self.created += 1
+        sprite.add(*groups)
+        return sprite
+
+    def release(self, tile_id, sprite):
+        sprite.kill()
+        self._free[tile_id].append(sprite)
+
+    def free_count(self):
+        return sum(len(free) for free in self._free.values())
+
+
+class ColumnStreamer:
+    """Keep a window of tile columns spawned around a moving x position.
+
+    tilemap: the `TileMap` (or endless `WorldMap`) to stream from.
+    pool: `TilePool` that creates and recycles sprites per tile id.
+    groups_for_tile: maps a tile id to the sprite groups it belongs to.
+        Tile ids missing from this mapping are treated as empty space.
+    window_width: width of the spawned window in pixels.
+    """
+
+    def __init__(self, tilemap, pool, groups_for_tile, window_width=None):
+        if window_width is None:
+            window_width = settings.SCREEN_WIDTH * 3
+        self.pool = pool
+        self.groups_for_tile = groups_for_tile
+        self.window_cols = max(1, window_width // settings.TILE_SIZE)
+        self.tilemap = tilemap
+        self.first_col = 0
+        self.last_col = 0  # exclusive
+        self.columns = {}  # world column -> list of (tile_id, sprite)
+
+    def _window_start(self, center_x):
+        start_x = max(0, int(center_x) - (self.window_cols * settings.TILE_SIZE) // 2)
+        return start_x // settings.TILE_SIZE
+
+    def _spawn_column(self, col):
+        spawned = []
+        world_x = col * settings.TILE_SIZE
+        for row_index, tile_id in enumerate(self.tilemap.column(col)):
+            groups = self.groups_for_tile.get(tile_id)
+            if groups is None:
+                continue
+            sprite = self.pool.acquire(tile_id, (world_x, row_index * settings.TILE_SIZE), groups)
+            spawned.append((tile_id, sprite))
+        self.columns[col] = spawned
+
+    def _recycle_column(self, col):
+        for tile_id, sprite in self.columns.pop(col, ()):
+            self.pool.release(tile_id, sprite)
+
+    def clear(self):
+        for col in list(self.columns):
+            self._recycle_column(col)
+        self.first_col = self.last_col = 0
+
+    def reset(self, center_x):
+        """Recycle everything and spawn a fresh window around center_x."""
+        self.clear()
+        self.first_col = self._window_start(center_x)
+        self.last_col = self.first_col
+        while self.last_col < self.first_col + self.window_cols:
+            self._spawn_column(self.last_col)
+            self.last_col += 1
+
+    def refresh_columns(self, columns):
+        """Respawn the given world columns if they're inside the window."""
+        for col in columns:
+            if self.first_col <= col < self.last_col:
+                self._recycle_column(col)
+                self._spawn_column(col)
+
+    def update(self, center_x):
+        """Slide the window so it stays centered on center_x.
+
+        Returns the number of columns spawned this call.
+        """
+        new_first = self._window_start(center_x)
+        if new_first == self.first_col and self.columns:
+            return 0
+        # A jump larger than the window (e.g. respawn) is just a reset
+        if not self.columns or abs(new_first - self.first_col) >= self.window_cols:
+            self.reset(center_x)
+            return self.window_cols
+        new_last = new_first + self.window_cols
+        spawned = 0
+        # Trailing edge: recycle columns that left the window
+        while self.first_col < new_first:
+            self._recycle_column(self.first_col)
+            self.first_col += 1
+        while self.last_col > new_last:
+            self.last_col -= 1
+            self._recycle_column(self.last_col)
+        # Leading edge: spawn columns that entered the window
+        while self.last_col < new_last:
+            self._spawn_column(self.last_col)
+            self.last_col += 1
+            spawned += 1
+        while self.first_col > new_first:
+            self.first_col -= 1
+            self._spawn_column(self.first_col)
+            spawned += 1
+        return spawned
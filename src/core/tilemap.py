@@ -0,0 +1,174 @@
+"""
+Array-backed tile map.
+
+The world is stored as one dense uint8 grid (row-major) instead of one
+sprite + Surface per tile, so a tile costs one byte. Maps loop horizontally
+by default, matching the infinite runner: column `width` is column 0 again.
+"""
+
+import sys
+from array import array
+
+from src import settings
+from src.core.constants import HAZARD_TILE_IDS, SOLID_TILE_IDS
+
+
+def _lookup_table(tile_ids):
+    table = bytearray(256)
+    for tile_id in tile_ids:
+        table[tile_id] = 1
+    return bytes(table)
+
+
+_SOLID = _lookup_table(SOLID_TILE_IDS)
+_HAZARD = _lookup_table(HAZARD_TILE_IDS)
+
+
+class TileMap:
+    """Dense width x height grid of tile ids.
+
+    data: any buffer of width * height bytes, row-major. An `array('B')`
+        keeps the map editable; a memoryview over a compiled map
+        (`CompiledMap.grid`) is read-only and shares the mmap.
+    wrap: when True, tx is taken modulo width (infinite horizontal loop).
+        Rows outside 0..height-1 are always empty.
+    """
+
+    def __init__(self, width, height, data=None, wrap=True):
+        if data is None:
+            data = array("B", bytes(width * height))
+        if len(data) != width * height:
+            raise ValueError(f"expected {width * height} tiles, got {len(data)}")
+        self.width = width
+        self.height = height
+        self.data = data
+        self.wrap = wrap
+        self._counts = None
+
+    @classmethod
+    def from_rows(cls, rows, wrap=True):
+        """Build an editable map from rows of tile ids (short rows are padded)."""
+        width = max((len(row) for row in rows), default=0)
+        data = array("B")
+        for row in rows:
+            data.extend(row)
+            data.extend(bytes(width - len(row)))
+        return cls(width, len(rows), data, wrap)
+
+    @classmethod
+    def from_compiled(cls, compiled, wrap=True):
+        """Wrap a `mapfile.CompiledMap` without copying its grid."""
+        return cls(compiled.width, compiled.height, compiled.grid, wrap)
+
+    # --- Cell access ---
+    def _index(self, tx, ty):
+        if ty < 0 or ty >= self.height or self.width == 0:
+            return None
+        if self.wrap:
+            tx %= self.width
+        elif tx < 0 or tx >= self.width:
+            return None
+        return ty * self.width + tx
+
+    def tile_at(self, tx, ty):
+        index = self._index(tx, ty)
+        return 0 if index is None else self.data[index]
+
+    def set_tile(self, tx, ty, tile_id):
+        index = self._index(tx, ty)
+        if index is None:
+            raise IndexError(f"tile ({tx}, {ty}) is outside the map")
+        self.data[index] = tile_id
+        self._counts = None
+
+    def is_solid(self, tx, ty):
+        return _SOLID[self.tile_at(tx, ty)] == 1
+
+    def is_hazard(self, tx, ty):
+        return _HAZARD[self.tile_at(tx, ty)] == 1
+
+    # --- Slices and queries ---
+    def row(self, ty):
+        """Row ty as a buffer slice (zero-copy for memoryview-backed maps)."""
+        return self.data[ty * self.width:(ty + 1) * self.width]
+
+    def column(self, tx):
+        """Tile ids of column tx, top to bottom, as bytes."""
+        if self.wrap and self.width:
+            tx %= self.width
+        if tx < 0 or tx >= self.width:
+            return bytes(self.height)
+        return bytes(self.data[tx::self.width])
+
+    def tile_range(self, x, y, w, h):
+        """Inclusive (left, top, right, bottom) tile range covering a pixel rect."""
+        size = settings.TILE_SIZE
+        return x // size, y // size, (x + w - 1) // size, (y + h - 1) // size
+
+    def get_tiles_in_rect(self, x, y, w, h, solid_only=True):
+        """Return the tiles overlapping a pixel rect.
+
+        Each entry is a dict with the tile id and its grid / world position
+        (`world_x`/`world_y` are unwrapped, so they match the queried rect).
+        With solid_only, only solid tiles are returned; otherwise every
+        non-empty tile is.
+        """
+        size = settings.TILE_SIZE
+        left, top, right, bottom = self.tile_range(int(x), int(y), int(w), int(h))
+        tiles = []
+        for ty in range(max(top, 0), min(bottom, self.height - 1) + 1):
+            for tx in range(left, right + 1):
+                tile_id = self.tile_at(tx, ty)
+                if tile_id == 0 or (solid_only and not _SOLID[tile_id]):
+                    continue
+                tiles.append(
+                    {"tx": tx, "ty": ty, "tile": tile_id, "world_x": tx * size, "world_y": ty * size}
+                )
+        return tiles
+
+    def merge_runs(self, first_col, cols, tile_ids):
+        """Greedily merge tiles of `tile_ids` in a column band into rectangles.
+
+        Scans row by row, grows each unclaimed run to its full width and then
+        downwards while the rows below match the whole run. Returns
+        (tx, ty, w, h) tuples in tiles, with tx relative to first_col.
+        """
+        matches = _lookup_table(tile_ids)
+        columns = [self.column(first_col + x) for x in range(cols)]
+        grid = [[matches[column[y]] == 1 for column in columns] for y in range(self.height)]
+        runs = []
+        for y in range(self.height):
+            row = grid[y]
+            x = 0
+            while x < cols:
+                if not row[x]:
+                    x += 1
+                    continue
+                w = 1
+                while x + w < cols and row[x + w]:
+                    w += 1
+                h = 1
+                while y + h < self.height and all(grid[y + h][x:x + w]):
+                    h += 1
+                for claimed in grid[y:y + h]:
+                    claimed[x:x + w] = [False] * w
+                runs.append((x, y, w, h))
+                x += w
+        return runs
+
+    def counts(self):
+        """Number of tiles per tile id (cached until the map is edited)."""
+        if self._counts is None:
+            raw = bytes(self.data)
+            self._counts = {tile_id: raw.count(tile_id) for tile_id in set(raw)}
+        return dict(self._counts)
+
+    def memory_footprint(self):
+        """Bytes used by the tile storage.
+
+        For arrays this is the object size including its header; for
+        memoryviews over a compiled map it's the mapped grid size.
+        """
+        if isinstance(self.data, memoryview):
+            return self.data.nbytes
+        return sys.getsizeof(self.data)
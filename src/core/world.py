@@ -0,0 +1,277 @@
+"""
+Multi-scene world streaming.
+
+Scenes are stitched end to end into one continuous, endless world: segment
+0 is always the first scene (it holds the spawn tile), later segments follow
+the configured order, either cycling through the list or picked at random
+by weight. Scenes of different heights are bottom-aligned so their floors
+line up.
+
+Scene data lives in a small LRU cache. Scenes ahead of the player are
+loaded on a background thread before the player reaches the seam, and old
+scenes fall out of the cache, so long sessions don't keep every scene ever
+visited in memory.
+"""
+
+import bisect
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from src import settings
+from src.core.mapfile import load_map, read_size
+from src.core.tilemap import TileMap
+
+
+class SceneCache:
+    """Bounded LRU cache of loaded scenes, keyed by CSV path.
+
+    Entries are (CompiledMap, TileMap) pairs. `prefetch` loads a scene on the
+    background worker; `get` returns it, waiting for an in-flight load or
+    loading synchronously as a last resort. Safe to use from several threads.
+
+    A scene's file mapping is closed as soon as it is loaded: its TileMap
+    owns a copy of the (small) grid. Nothing then keeps the compiled file
+    open, so it can be rewritten on hot reload (Windows refuses to replace a
+    mapped file), and readers still holding an evicted or invalidated
+    TileMap (e.g. a chunk bake in flight) keep working.
+    """
+
+    def __init__(self, capacity=3):
+        self.capacity = max(1, capacity)
+        self._scenes = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene-loader")
+        self.loads = 0
+
+    def _load(self, path):
+        with load_map(path) as compiled:
+            tilemap = TileMap(compiled.width, compiled.height, bytes(compiled.grid), wrap=False)
+        # The header fields and specials index stay usable after close()
+        return compiled, tilemap
+
+    def _insert(self, path, scene):
+        self._scenes[path] = scene
+        self._scenes.move_to_end(path)
+        self.loads += 1
+        # Evicted scenes are simply dropped: anything still reading them
+        # (e.g. a chunk bake in flight) keeps them alive until it finishes.
+        while len(self._scenes) > self.capacity:
+            self._scenes.popitem(last=False)
+
+    def _finish(self, path, future):
+        with self._lock:
+            if self._pending.get(path) is future:
+                del self._pending[path]
+                if future.exception() is None:
+                    self._insert(path, future.result())
+
+    def prefetch(self, path):
+        with self._lock:
+            if path in self._scenes:
+                self._scenes.move_to_end(path)
+                return
+            if path in self._pending:
+                return
+            future = self._executor.submit(self._load, path)
+            self._pending[path] = future
+        future.add_done_callback(lambda f: self._finish(path, f))
+
+    def get(self, path):
+        with self._lock:
+            scene = self._scenes.get(path)
+            if scene is not None:
+                self._scenes.move_to_end(path)
+                return scene
+            future = self._pending.get(path)
+        if future is not None:
+            scene = future.result()
+        else:
+            scene = self._load(path)
+        with self._lock:
+            if path not in self._scenes:
+                self._pending.pop(path, None)
+                self._insert(path, scene)
+        return scene
+
+    def scenes(self):
+        """Snapshot of the cached (CompiledMap, TileMap) pairs."""
+        with self._lock:
+            return list(self._scenes.values())
+
+    def peek(self, path):
+        """Return the cached scene without loading it or touching the LRU order."""
+        with self._lock:
+            return self._scenes.get(path)
+
+    def __contains__(self, path):
+        with self._lock:
+            return path in self._scenes
+
+    def invalidate(self, path):
+        """Forget a cached scene (e.g. after its CSV changed)."""
+        with self._lock:
+            self._scenes.pop(path, None)
+            self._pending.pop(path, None)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SceneSequence:
+    """Which scene fills each world segment.
+
+    order "sequence" cycles through `paths`; order "random" picks by
+    `weights`, seeded per segment so the same world is rebuilt on respawn.
+    Segment 0 is always paths[0].
+    """
+
+    def __init__(self, paths, order="sequence", weights=None, seed=0):
+        if not paths:
+            raise ValueError("SceneSequence needs at least one scene")
+        if order not in ("sequence", "random"):
+            raise ValueError(f"unknown scene order {order!r}")
+        self.paths = list(paths)
+        self.order = order
+        self.weights = list(weights) if weights else [1] * len(self.paths)
+        self.seed = seed
+
+    def scene_for(self, segment):
+        if segment == 0 or self.order == "sequence":
+            return self.paths[segment % len(self.paths)]
+        rng = random.Random(self.seed * 1_000_003 + segment)
+        return rng.choices(self.paths, weights=self.weights)[0]
+
+
+class WorldMap(TileMap):
+    """Endless row of scene segments with the same query API as TileMap.
+
+    Columns are world columns starting at 0; `height` is the tallest scene.
+    Only segment start columns are stored (one int per segment reached);
+    tile data comes from the scene cache.
+    """
+
+    def __init__(self, sequence, cache):
+        self.sequence = sequence
+        self.cache = cache
+        self.wrap = False
+        self.width = None  # endless
+        self._sizes = {path: read_size(path) for path in set(sequence.paths)}
+        self.height = max(h for _, h in self._sizes.values())
+        self._starts = [0]
+        self._lock = threading.Lock()
+
+    # --- Segments ---
+    def _extend_to(self, col):
+        # Called from the main thread and bake workers alike
+        with self._lock:
+            while self._starts[-1] <= col:
+                path = self.sequence.scene_for(len(self._starts) - 1)
+                self._starts.append(self._starts[-1] + max(1, self._sizes[path][0]))
+
+    def segment_at(self, col):
+        """Index of the segment containing world column col (col >= 0)."""
+        self._extend_to(col)
+        return bisect.bisect_right(self._starts, col) - 1
+
+    def segment_start(self, segment):
+        while len(self._starts) <= segment + 1:
+            self._extend_to(self._starts[-1])
+        return self._starts[segment]
+
+    def scene_at(self, col):
+        """(segment, path, scene TileMap, local column, row offset) for world column col."""
+        segment = self.segment_at(col)
+        path = self.sequence.scene_for(segment)
+        tilemap = self.cache.get(path)[1]
+        return segment, path, tilemap, col - self._starts[segment], self.height - tilemap.height
+
+    def _locate(self, col):
+        """Return (scene TileMap, local column, row offset) for world column col."""
+        return self.scene_at(col)[2:]
+
+    def prefetch(self, world_x, ahead=None, behind=None):
+        """Queue background loads for the scenes around world_x."""
+        if ahead is None:
+            ahead = settings.SCREEN_WIDTH * 2
+        if behind is None:
+            behind = settings.SCREEN_WIDTH
+        size = settings.TILE_SIZE
+        first = self.segment_at(max(0, int(world_x - behind) // size))
+        last = self.segment_at(max(0, int(world_x + ahead) // size))
+        for segment in range(first, last + 1):
+            self.cache.prefetch(self.sequence.scene_for(segment))
+
+    def find_spawn(self, tile_id):
+        """(col, row) of tile_id in segment 0, in world tiles, or None."""
+        path = self.sequence.scene_for(0)
+        compiled, tilemap = self.cache.get(path)
+        position = compiled.find_first(tile_id)
+        if position is None:
+            return None
+        return position[0], position[1] + self.height - tilemap.height
+
+    # --- TileMap API ---
+    def tile_at(self, tx, ty):
+        if tx < 0 or ty < 0 or ty >= self.height:
+            return 0
+        tilemap, local, offset = self._locate(tx)
+        return tilemap.tile_at(local, ty - offset)
+
+    def set_tile(self, tx, ty, tile_id):
+        raise TypeError("WorldMap is read-only; edit the scene CSVs instead")
+
+    def column(self, tx):
+        if tx < 0:
+            return bytes(self.height)
+        tilemap, local, offset = self._locate(tx)
+        return bytes(offset) + tilemap.column(local)
+
+    def row(self, ty):
+        raise TypeError("WorldMap is endless; query columns or rects instead")
+
+    def counts(self):
+        raise TypeError("WorldMap is endless; count tiles per scene instead")
+
+    def memory_footprint(self):
+        """Bytes held by the cached scenes plus the segment index."""
+        scenes = self.cache.scenes()
+        return sum(tilemap.memory_footprint() for _, tilemap in scenes) + 8 * len(self._starts)
+
+    # --- Hot reload ---
+    def reload(self, path):
+        """Reload a scene whose CSV changed.
+
+        Returns the set of world columns whose tiles changed, or None when the
+        scene's size changed: every later segment moves then, so callers
+        must rebuild everything.
+        """
+        old = self.cache.peek(path)
+        old_data = old[1].data if old is not None else None
+        self.cache.invalidate(path)
+        compiled, tilemap = self.cache.get(path)
+        size = (compiled.width, compiled.height)
+        if size != self._sizes.get(path):
+            with self._lock:
+                self._sizes[path] = size
+                self.height = max(h for _, h in self._sizes.values())
+                self._starts = [0]
+            return None
+        if old_data is None:
+            # Nothing to diff against: treat the whole scene as changed
+            local = set(range(tilemap.width))
+        else:
+            local = {
+                index % tilemap.width for index, (a, b) in enumerate(zip(old_data, tilemap.data)) if a != b
+            }
+        columns = set()
+        if local:
+            for segment in range(len(self._starts) - 1):
+                if self.sequence.scene_for(segment) == path:
+                    columns.update(self._starts[segment] + col for col in local)
+        return columns
+
+    def shutdown(self):
+        self.cache.shutdown()
@@ -0,0 +1,88 @@
+"""
+Camera zoom support: mip levels and LRU caches of prescaled surfaces.
+
+Rescaling every chunk and sprite each frame would make zoomed frames far
+more expensive than normal ones. Instead the world is drawn at a fixed
+"mip" level (a power of two at or below the zoom) from surfaces scaled once
+and cached per level; any leftover factor is applied to the finished frame
+in a single scale. Smooth zooming therefore only pays for the surfaces that
+enter a level for the first time.
+"""
+
+import weakref
+from collections import OrderedDict
+
+import pygame
+
+# Discrete zoom steps for zoom in / zoom out (1.0 is native size). 0.125
+# shows roughly 200 tiles across: an overview of a whole scene.
+ZOOM_LEVELS = (0.125, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0)
+# Scales surfaces are cached at; a zoom is drawn at the largest level <= it
+MIP_LEVELS = (0.125, 0.25, 0.5, 1.0, 2.0)
+
+
+def mip_level_for(zoom):
+    """Largest mip level not above zoom (the smallest level for tiny zooms)."""
+    level = MIP_LEVELS[0]
+    for candidate in MIP_LEVELS:
+        if candidate <= zoom + 1e-9:
+            level = candidate
+    return level
+
+
+def scale_surface(surface, level):
+    """Return surface scaled by level (smooth when shrinking, when supported)."""
+    width, height = surface.get_size()
+    size = (max(1, round(width * level)), max(1, round(height * level)))
+    if level < 1 and surface.get_colorkey() is not None:
+        # Smoothing would blend the key color into the edges; filter a
+        # per-pixel alpha copy instead.
+        alpha = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        alpha.blit(surface, (0, 0))
+        return pygame.transform.smoothscale(alpha, size)
+    if level < 1 and surface.get_bitsize() >= 24:
+        return pygame.transform.smoothscale(surface, size)
+    return pygame.transform.scale(surface, size)
+
+
+class ScaledSurfaceCache:
+    """Per-level LRU caches of scaled copies of source surfaces.
+
+    Sources are keyed by identity, so a shared tile or sprite frame is scaled
+    once per level no matter how many sprites use it. Each level keeps at
+    most `capacity` surfaces; the least recently drawn ones are dropped.
+    Sources are only weakly referenced: once a source is garbage (e.g. a
+    chunk the ChunkCache dropped or re-baked), its scaled copies go too.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self._levels = {}  # level -> OrderedDict(id(source) -> (weakref to source, scaled Surface))
+        self.scaled = 0  # how many surfaces were scaled (cache misses)
+
+    def _forget(self, key):
+        for cache in self._levels.values():
+            cache.pop(key, None)
+
+    def get(self, surface, level):
+        if level == 1:
+            return surface
+        cache = self._levels.setdefault(level, OrderedDict())
+        key = id(surface)
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+            return entry[1]
+        scaled = scale_surface(surface, level)
+        # The callback runs before the source's id can be reused
+        cache[key] = (weakref.ref(surface, lambda _, key=key: self._forget(key)), scaled)
+        self.scaled += 1
+        if len(cache) > self.capacity:
+            cache.popitem(last=False)
+        return scaled
+
+    def __len__(self):
+        return sum(len(cache) for cache in self._levels.values())
+
+    def clear(self):
+        self._levels.clear()
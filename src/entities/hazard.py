@@ -1,5 +1,6 @@
 import pygame
-from src import settings
+from src.core.render import plain_blit
+from src.core.tile_art import get_tile_surface
 
 
 class HazardTile(pygame.sprite.Sprite):
@@ -9,6 +10,7 @@ class HazardTile(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(topleft=pos)
         self.is_hazard = True
 
+    @plain_blit
     def draw(self, screen, off=None):
         if off is None:
             off = pygame.Vector2(0, 0)
@@ -18,21 +20,9 @@ class HazardTile(pygame.sprite.Sprite):
 
 class VisibleHazard(HazardTile):
     def __init__(self, pos, groups):
-        surface = pygame.Surface((settings.TILE_SIZE, settings.TILE_SIZE))
-        surface.fill((220, 20, 20))
-        points = [
-            (0, settings.TILE_SIZE),
-            (settings.TILE_SIZE // 4, 0),
-            (settings.TILE_SIZE // 2, settings.TILE_SIZE),
-            (3 * settings.TILE_SIZE // 4, 0),
-            (settings.TILE_SIZE, settings.TILE_SIZE),
-        ]
-        pygame.draw.polygon(surface, (180, 0, 0), points)
-        super().__init__(pos, groups, surface)
+        super().__init__(pos, groups, get_tile_surface(3))
 
 
 class InvisibleHazard(HazardTile):
     def __init__(self, pos, groups):
-        surface = pygame.Surface((settings.TILE_SIZE, settings.TILE_SIZE), pygame.SRCALPHA)
-        surface.fill((0, 0, 0, 0))
-        super().__init__(pos, groups, surface)
+        super().__init__(pos, groups, get_tile_surface(4))
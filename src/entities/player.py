@@ -1,78 +1,154 @@
 import pygame
+from src.core import constants
+from src.core.animation import Animation, AnimationSet, AnimationSpec
+from src.core.atlas import read_atlas
 from src.core.constants import PLAYER_COLLIDER_W, PLAYER_COLLIDER_H, PLAYER_PAD
 from src.core.sprite_align import align_frame_to_midbottom
-from src.core.support import load_aligned_vertical_sprite_frames
+from src.core.surfaces import new_surface
 from src import settings
 
 # Utility functions world_to_tile, tile_to_world, move_and_collide_rect are
-# defined in core/collision.py and should be imported if needed
+# defined in core/collision.py and should be imported if needed. When a
+# `TileGrid` from core/collision.py is assigned to `collision_grid`, tile and
+# hazard collisions are resolved against the grid instead of sprite groups.
+
+# Sprite sheets (and their packed atlas, if built) for the player
+PLAYER_SPRITE_DIR = "assets/mage.samurai"
+# Feet of the character inside a 128x48 source frame; anchored animations
+# (attacks, death) are pinned to the collider at this point.
+PLAYER_SHEET_FEET = (39, 32)
+# Animation of each player state, built on first use (src/core/animation.py).
+# There is no jump/fall sheet, so those states hold a walk pose.
+PLAYER_ANIMATIONS = {
+    "idle": AnimationSpec("Idle", count=4, speed=0.08, anchored=False),
+    "walk": AnimationSpec("walk", count=5, anchored=False),
+    "jump": AnimationSpec(source="walk", frames=[1]),
+    "fall": AnimationSpec(source="walk", frames=[3]),
+    "attack": AnimationSpec("Slam attack", loop=False, speed=0.5),
+    "death": AnimationSpec("death", loop=False, speed=0.2),
+}
+# Frames are sized as if aligned onto this canvas (see _fit_to_collider)
+PLAYER_FRAME_CANVAS = (48, 48)
+
+
+def read_player_animations():
+    """The player's AnimationSet with the first animation shown already read.
+
+    Safe off the main thread (e.g. as an asset loader job); the result goes
+    through `AnimationSet.convert` on the main thread before it's used.
+    """
+    animations = AnimationSet(
+        PLAYER_SPRITE_DIR,
+        PLAYER_ANIMATIONS,
+        PLAYER_SHEET_FEET,
+        canvas=PLAYER_FRAME_CANVAS,
+        atlas=read_atlas(PLAYER_SPRITE_DIR),
+    )
+    animations.decode("idle")
+    return animations
+
+
+def _fit_to_collider(image, collider_size, pad, visual_scale, canvas_size=None, anchor=None):
+    """Scale image to cover a collider of collider_size (minus pad).
+
+    canvas_size: size the scale is computed from, when image is a trimmed
+    frame (atlas) of a larger aligned canvas; defaults to the image size.
+    The visible pixels' midbottom (or anchor, a feet point in image pixels)
+    lands on the bottom center of the padded collider. Returns (scaled image, (offset x, offset y)) where the offset
+    is relative to the collider's topleft.
+    """
+    avail_w = collider_size[0] - pad[0] - pad[2]
+    avail_h = collider_size[1] - pad[1] - pad[3]
+    img_w, img_h = image.get_width(), image.get_height()
+
+    # If image empty, fallback to 1x1 to avoid div-by-zero
+    if img_w == 0 or img_h == 0:
+        return new_surface((1, 1)), (0, 0)
+
+    # Compute scale to COVER the collider (fill at least one axis).
+    canvas_w, canvas_h = canvas_size or (img_w, img_h)
+    scale_x = avail_w / canvas_w
+    scale_y = avail_h / canvas_h
+    cover_scale = max(scale_x, scale_y)
+    final_scale = cover_scale * (visual_scale if visual_scale else 1)
+
+    # Scale the full image by the final scale
+    target_w = max(1, int(round(img_w * final_scale)))
+    target_h = max(1, int(round(img_h * final_scale)))
+    scaled_img = pygame.transform.scale(image, (target_w, target_h))
+
+    # Target point inside collider: horizontally centered in available
+    # width, and bottom at available height (integers). Use the collider
+    # height so we align feet to the collider bottom exactly.
+    target_point_x = int(pad[0] + (avail_w // 2))
+    target_point_y = int(collider_size[1])
+
+    if anchor is not None:
+        offset_x = target_point_x - int(round(anchor[0] * final_scale))
+        offset_y = target_point_y - int(round(anchor[1] * final_scale))
+        return scaled_img, (offset_x, offset_y)
+
+    # Compute the bounding rect of visible pixels and scale its integer
+    # dimensions. Round positions/sizes so we can align in exact pixels.
+    bounding = image.get_bounding_rect()
+    scaled_bbox_left = int(round(bounding.left * final_scale))
+    scaled_bbox_top = int(round(bounding.top * final_scale))
+    scaled_bbox_w = max(1, int(round(bounding.width * final_scale)))
+    scaled_bbox_h = max(1, int(round(bounding.height * final_scale)))
+
+    # Compute integer pixel coordinates inside the scaled image for the
+    # bounding midbottom (feet center) and bottom.
+    scaled_mid_x_pixel = scaled_bbox_left + (scaled_bbox_w // 2)
+    scaled_bottom_pixel = scaled_bbox_top + scaled_bbox_h
+
+    # Offsets so the scaled bounding midbottom/bottom map exactly to the
+    # target point inside the collider.
+    offset_x = int(target_point_x - scaled_mid_x_pixel)
+    offset_y = int(target_point_y - scaled_bottom_pixel)
+    return scaled_img, (offset_x, offset_y)
 
 
 class Player(pygame.sprite.Sprite):
 
+    def _frame_variant(self, frame, pad, anchor=None):
+        """(image, draw image, draw offset) for frame at the current facing and collider.
+
+        anchor: feet point inside frame for anchored animations (None aligns
+        the visible pixels). Variants are memoized per (frame, facing,
+        collider size, pad, visual scale), so flipping and scaling happen
+        once per combination and steady-state animation does no transforms.
+        """
+        visual_scale = getattr(constants, "PLAYER_VISUAL_SCALE", 1)
+        key = (frame, self.facing_left, tuple(self.rect.size), tuple(pad), visual_scale)
+        variant = self._variants.get(key)
+        if variant is None:
+            image = frame
+            if self.facing_left:
+                image = pygame.transform.flip(frame, True, False)
+                if anchor is not None:
+                    anchor = (frame.get_width() - anchor[0], anchor[1])
+            draw_image, offset = _fit_to_collider(image, self.rect.size, pad, visual_scale, self.frame_canvas, anchor)
+            variant = self._variants[key] = (image, draw_image, offset)
+            self.variant_builds += 1
+        return variant
+
+    def invalidate_frame_variants(self, collider_size=None):
+        """Drop memoized frame variants (only those for collider_size if given)."""
+        if collider_size is None:
+            self._variants.clear()
+            return
+        collider_size = tuple(collider_size)
+        for key in [key for key in self._variants if key[2] == collider_size]:
+            del self._variants[key]
+
     def _rescale_draw_image_to_collider(self, pad=None):
         # Use runtime padding lookup to avoid default-eval of module constants
         if pad is None:
-            pad = PLAYER_PAD
-
-        rect = self.rect
-        img = self.image
-        avail_w = rect.width - pad[0] - pad[2]
-        avail_h = rect.height - pad[1] - pad[3]
-        img_w, img_h = img.get_width(), img.get_height()
-
-        # If image empty, fallback to 1x1 to avoid div-by-zero
-        if img_w == 0 or img_h == 0:
-            self._draw_image = pygame.Surface((1, 1))
-            self._draw_offset = pygame.Vector2(0, 0)
-            return
+            pad = self.pad
+        self.image, self._draw_image, offset = self._frame_variant(self._frame, pad, self._anchor)
+        self._draw_offset = pygame.Vector2(offset)
 
-        # Compute scale to COVER the collider (fill at least one axis).
-        scale_x = avail_w / img_w
-        scale_y = avail_h / img_h
-        cover_scale = max(scale_x, scale_y)
-
-        # Get visual-only scale (default 1)
-        try:
-            from src.core.constants import PLAYER_VISUAL_SCALE
-        except Exception:
-            PLAYER_VISUAL_SCALE = 1
-
-        final_scale = cover_scale * (PLAYER_VISUAL_SCALE if PLAYER_VISUAL_SCALE else 1)
-
-        # Scale the full image by the final scale
-        target_w = max(1, int(round(img_w * final_scale)))
-        target_h = max(1, int(round(img_h * final_scale)))
-        scaled_img = pygame.transform.scale(img, (target_w, target_h))
-
-        # Compute the bounding rect of visible pixels and scale its integer
-        # dimensions. Round positions/sizes so we can align in exact pixels.
-        bounding = img.get_bounding_rect()
-        scaled_bbox_left = int(round(bounding.left * final_scale))
-        scaled_bbox_top = int(round(bounding.top * final_scale))
-        scaled_bbox_w = max(1, int(round(bounding.width * final_scale)))
-        scaled_bbox_h = max(1, int(round(bounding.height * final_scale)))
-
-        # Target point inside collider: horizontally centered in available
-        # width, and bottom at available height (integers). Use rect.height
-        # so we align feet to the collider bottom exactly.
-        target_point_x = int(pad[0] + (avail_w // 2))
-        target_point_y = int(rect.height)
-
-        # Compute integer pixel coordinates inside the scaled image for the
-        # bounding midbottom (feet center) and bottom.
-        scaled_mid_x_pixel = scaled_bbox_left + (scaled_bbox_w // 2)
-        scaled_bottom_pixel = scaled_bbox_top + scaled_bbox_h
-
-        # Offsets so the scaled bounding midbottom/bottom map exactly to the
-        # target point inside the collider.
-        offset_x = int(target_point_x - scaled_mid_x_pixel)
-        offset_y = int(target_point_y - scaled_bottom_pixel)
-
-        self._draw_image = scaled_img
-        self._draw_offset = pygame.Vector2(int(offset_x), int(offset_y))
-
-    def set_frame(self, new_frame: pygame.Surface):
+    def set_frame(self, new_frame: pygame.Surface, anchor=None):
         # Be defensive: self.rect might not exist yet (callers during init).
         # Use a default rect sized to the collider so we can preserve midbottom.
         prev_midbottom = getattr(
@@ -80,48 +156,61 @@ class Player(pygame.sprite.Sprite):
             "rect",
             pygame.Rect(0, 0, PLAYER_COLLIDER_W, PLAYER_COLLIDER_H),
         ).midbottom
-        self.image = new_frame
+        self._frame = new_frame
+        self._anchor = anchor
         # Use the configured collider size as authoritative for physics.
         # Preserve midbottom (above) and set rect to the configured collider.
-        self.rect = self.image.get_rect()
-        self.rect.size = (PLAYER_COLLIDER_W, PLAYER_COLLIDER_H)
+        self.rect = new_frame.get_rect()
+        self.rect.size = self.collider_size
         self.rect.midbottom = prev_midbottom
         self._rescale_draw_image_to_collider()
 
-    def __init__(self, pos, groups):
+    def resize_collider(self, size):
+        """Resize the collider in place (debug keys), keeping its midbottom.
+
+        Only the frame variants built for the old size are dropped.
+        """
+        self.invalidate_frame_variants(self.rect.size)
+        midbottom = self.rect.midbottom
+        self.collider_size = (max(1, size[0]), max(1, size[1]))
+        self.rect.size = self.collider_size
+        self.rect.midbottom = midbottom
+        self.pos = pygame.Vector2(self.rect.topleft)
+        self._rescale_draw_image_to_collider()
+
+    def __init__(self, pos, groups, animations=None):
+        """animations: from `read_player_animations` (converted) if already loaded."""
         super().__init__(groups)
-        # Load animation frames
+        # Animations are built per state on first use (see PLAYER_ANIMATIONS)
+        self.frame_canvas = PLAYER_FRAME_CANVAS
+        self.state = "idle"
+        self.attacking = False
         try:
-            # Load and align all frames to midbottom using loader utility
-            self.walk_frames = load_aligned_vertical_sprite_frames(
-                "assets/mage.samurai/walk.png", 128, 48, 5, align_size=(48, 48)
-            )
-            self.idle_frames = [self.walk_frames[0]]
-    # If you flip or scale frames at runtime, recompute alignment after the
-    # transform so the sprite stays aligned to its collider.
-    # Example (commented):
-    # new_frame = pygame.transform.flip(self.image, True, False)
-    # aligned_frame = align_frame_to_midbottom(
-    #     new_frame, (PLAYER_WIDTH, PLAYER_HEIGHT)
-    # )
-    # self.set_frame(aligned_frame)
+            self.animations = animations if animations is not None else read_player_animations().convert()
+            self.animation = self.animations.get(self.state)
         except Exception as e:
             print(f"Animation loading failed: {e}")
-            fallback_surface = pygame.Surface((settings.PLAYER_WIDTH, settings.PLAYER_HEIGHT))
-            fallback_surface.fill((70, 130, 180))
-            self.walk_frames = [
-                align_frame_to_midbottom(
-                    fallback_surface, (settings.PLAYER_WIDTH, settings.PLAYER_HEIGHT)
-                )
-            ]
-            self.idle_frames = [self.walk_frames[0]]
-        self.current_frames = self.idle_frames
+            fallback_surface = new_surface(
+                (settings.PLAYER_WIDTH, settings.PLAYER_HEIGHT), fill=(70, 130, 180)
+            )
+            self.frame_canvas = (settings.PLAYER_WIDTH, settings.PLAYER_HEIGHT)
+            self.animations = None
+            self.animation = Animation([align_frame_to_midbottom(fallback_surface, self.frame_canvas)])
+        self.current_frames = self.animation.frames
         self.frame_index = 0
-        self.animation_speed = 0.1
-        self.image = self.current_frames[0]
+        self.facing_left = False
+        self.pad = PLAYER_PAD
+        # Collider size; PLAYER_COLLIDER_W/H unless resized (debug keys)
+        self.collider_size = (PLAYER_COLLIDER_W, PLAYER_COLLIDER_H)
+        # (frame, facing, collider size, pad, visual scale) -> (image, draw image, offset)
+        self._variants = {}
+        self.variant_builds = 0
+        self._frame = self.current_frames[0]  # unflipped source of `image`
+        self._anchor = self.animation.anchors[0]
+        self.image = self._frame
         self.rect = self.image.get_rect()
         # Use configured collider size so physics uses tile-based dimensions
-        self.rect.size = (PLAYER_COLLIDER_W, PLAYER_COLLIDER_H)
+        self.rect.size = self.collider_size
         self.rect.midbottom = pos
         self._draw_image = self.image
         self._draw_offset = pygame.Vector2(0, 0)
@@ -143,9 +232,12 @@ class Player(pygame.sprite.Sprite):
         self.time_since_jump_pressed = 999.0
         self.time_holding_jump = 0.0
         self.prev_jump_pressed = False
+        self.prev_attack_pressed = False
         self.spawn_midbottom = pos
         # small grace timer after a jump to avoid immediate re-grounding
         self._just_jumped_timer = 0.0
+        # Optional core.collision.TileGrid; set by the game once a scene is loaded
+        self.collision_grid = None
 
     def draw(self, screen, off=None):
         """
@@ -163,6 +255,19 @@ class Player(pygame.sprite.Sprite):
         )
         pygame.draw.rect(screen, (0, 255, 0), debug_rect, 2)
 
+    def draw_source(self):
+        """(surface, world topleft) of the sprite image, without the debug box."""
+        draw_pos = pygame.Vector2(self.rect.topleft) + self._draw_offset
+        return self._draw_image, (int(draw_pos.x), int(draw_pos.y))
+
+    def draw_bounds(self, off=None):
+        """Screen rect touched by draw(): the sprite image plus the debug box."""
+        if off is None:
+            off = pygame.Vector2(0, 0)
+        draw_pos = pygame.Vector2(self.rect.topleft) + self._draw_offset - off
+        image_rect = self._draw_image.get_rect(topleft=(int(draw_pos.x), int(draw_pos.y)))
+        return image_rect.union(self.rect.move(-int(off.x), -int(off.y))).inflate(2, 2)
+
     def handle_input(self):
         # Deprecated: input handling is performed in update(dt, ...)
         return
@@ -186,6 +291,7 @@ class Player(pygame.sprite.Sprite):
         left = any(keys[k] for k in settings.LEFT_KEYS)
         right = any(keys[k] for k in settings.RIGHT_KEYS)
         jump_pressed = any(keys[k] for k in settings.JUMP_KEYS)
+        attack_pressed = any(keys[k] for k in settings.ATTACK_KEYS)
 
         # Optional per-frame jump diagnostics (off by default)
         # When enabled this prints a single compact line per frame giving the
@@ -209,6 +315,9 @@ class Player(pygame.sprite.Sprite):
         if jump_pressed and not self.prev_jump_pressed:
             self.time_since_jump_pressed = 0.0
         self.prev_jump_pressed = jump_pressed
+        if attack_pressed and not self.prev_attack_pressed:
+            self.attack()
+        self.prev_attack_pressed = attack_pressed
 
         # Update timing helpers
         if self.on_ground:
@@ -327,21 +436,34 @@ class Player(pygame.sprite.Sprite):
 
         # Move horizontally by vx * dt, resolve collisions
         self.pos.x += self.vel_x * dt
-        # Sync rect to float position before collision checks
-        self.rect.x = int(round(self.pos.x))
-        self.check_horizontal_collision(tiles)
+        if self.collision_grid is not None:
+            # Swept move against the grid: stops at the first solid column
+            # crossed, so large steps on slow frames can't tunnel.
+            self.collision_grid.sweep_x(self.rect, int(round(self.pos.x)) - self.rect.x)
+        else:
+            # Sync rect to float position before collision checks
+            self.rect.x = int(round(self.pos.x))
+            self.check_horizontal_collision(tiles)
         # After collision resolution, sync pos
         self.pos.x = float(self.rect.x)
 
         # Move vertically by vy * dt, resolve collisions
         self.pos.y += self.vel_y * dt
-        self.rect.y = int(round(self.pos.y))
-        self.check_vertical_collision(tiles)
+        if self.collision_grid is not None:
+            if self.collision_grid.sweep_y(self.rect, int(round(self.pos.y)) - self.rect.y):
+                self.vel_y = 0
+            # Probe the row under the feet: resting on flat ground, gravity
+            # rounds to a 0px step every other frame, so a blocked sweep alone
+            # would flicker between grounded and airborne.
+            self.on_ground = self.vel_y >= 0 and self.collision_grid.standing_on(self.rect)
+        else:
+            self.rect.y = int(round(self.pos.y))
+            self.check_vertical_collision(tiles)
         # After collision resolution, sync pos and grounded state
         self.pos.y = float(self.rect.y)
 
         # Hazards
-        if hazards:
+        if hazards or self.collision_grid is not None:
             self.check_hazard_collision(hazards)
 
         # Animation (kept frame-based increment for compatibility)
@@ -349,6 +471,10 @@ class Player(pygame.sprite.Sprite):
 
     def check_hazard_collision(self, hazards):
         """Check if player touches any hazard and die if so"""
+        if self.collision_grid is not None:
+            if self.collision_grid.overlaps_hazard(self.rect):
+                self.die()
+            return
         collisions = pygame.sprite.spritecollide(self, hazards, False)
         if collisions:
             self.die()
@@ -363,7 +489,7 @@ class Player(pygame.sprite.Sprite):
         """Respawn the player at spawn position, directly on ground"""
         # Respawn should restore collider sized to the configured collider
         # rather than deriving from the image bounding box.
-        self.rect = pygame.Rect(0, 0, PLAYER_COLLIDER_W, PLAYER_COLLIDER_H)
+        self.rect = pygame.Rect((0, 0), self.collider_size)
         self.rect.midbottom = self.spawn_midbottom
         self.vel_x = settings.RUN_SPEED
         self.vel_y = 0
@@ -376,24 +502,72 @@ class Player(pygame.sprite.Sprite):
             pass
         self.on_ground = True
         self.is_alive = True
-        self.frame_index = 0
-        self.current_frames = self.walk_frames
+        self.attacking = False
+        self.update_animation()
+
+    @property
+    def walk_frames(self):
+        return self._animation("walk").frames
+
+    def _animation(self, state):
+        """Animation of state, built on first use."""
+        if self.animations is None:
+            return self.animation  # loading failed: the fallback frame only
+        self.animations.collect(fallback=self.animation)
+        return self.animations.get(state, fallback=self.animation)
+
+    def preload_animation(self, state):
+        """Build the animation of state in the background (e.g. death once a
+        hazard is in view), so entering the state doesn't stall a frame."""
+        if self.animations is not None:
+            self.animations.preload(state)
+
+    def attack(self):
+        """Play the attack animation once (visual only; it hits nothing yet)."""
+        if self.is_alive:
+            self.attacking = True
+
+    def next_state(self):
+        """Animation state for the current physics state."""
+        if not self.is_alive:
+            return "death"
+        if self.attacking:
+            return "attack"
+        if not self.on_ground:
+            return "jump" if self.vel_y < 0 else "fall"
+        return "walk" if self.vel_x != 0 else "idle"
 
     def update_animation(self):
-        """Update player animation based on movement state"""
-        # Choose animation frames based on movement
-        if self.vel_x != 0:  # Moving
-            self.current_frames = self.walk_frames
-        else:  # Idle
-            self.current_frames = self.idle_frames
-        # Update animation frame
-        self.frame_index += self.animation_speed
-        if self.frame_index >= len(self.current_frames):
+        """Advance the animation of the current state.
+
+        Entering a state restarts its animation; one-shot animations hold
+        their last frame (an attack then ends and hands back to movement).
+        """
+        state = self.next_state()
+        if state != self.state:
+            self.state = state
+            self.animation = self._animation(state)
+            self.current_frames = self.animation.frames
             self.frame_index = 0
+        else:
+            self.frame_index += self.animation.speed
+            if self.frame_index >= len(self.current_frames):
+                if self.animation.loop:
+                    self.frame_index = 0
+                else:
+                    self.frame_index = len(self.current_frames) - 1
+                    self.attacking = False
+        # Face the direction of travel; keep the last facing while idle
+        facing_left = self.vel_x < 0 if self.vel_x else self.facing_left
+        index = int(self.frame_index)
+        frame = self.current_frames[index]
+        if frame is self._frame and facing_left == self.facing_left:
+            return  # same frame as last update: nothing to redo
+        self.facing_left = facing_left
         # Update sprite image and rebuild rect to preserve midbottom. The
         # `set_frame` call recomputes and preserves midbottom internally, so
         # we don't need to compute it here.
-        self.set_frame(self.current_frames[int(self.frame_index)])
+        self.set_frame(frame, self.animation.anchors[index])
 
     def check_horizontal_collision(self, tiles):
         collisions = pygame.sprite.spritecollide(self, tiles, False)
@@ -417,20 +591,15 @@ class Player(pygame.sprite.Sprite):
 
     def flip_horiz(self, facing_left: bool):
         """
-        Flip the currently aligned image horizontally if facing_left is True.
+        Face left (mirrored frames) or right.
 
-        This preserves rect.midbottom and calls
-        _rescale_draw_image_to_collider() to recompute the draw image
-        and offset so the sprite remains aligned to its collider.
+        This preserves rect.midbottom and picks the memoized variant of the
+        current frame for the new facing, so the sprite remains aligned to its
+        collider and repeated calls never re-flip the image.
         """
         prev_midbottom = self.rect.midbottom
-        # Flip only if needed
-        if facing_left:
-            self.image = pygame.transform.flip(self.image, True, False)
-        else:
-            # Optionally restore to original if you keep a reference
-            pass
-        self.rect = self.image.get_rect()
-        self.rect.size = (PLAYER_COLLIDER_W, PLAYER_COLLIDER_H)
+        self.facing_left = facing_left
+        self.rect = self._frame.get_rect()
+        self.rect.size = self.collider_size
         self.rect.midbottom = prev_midbottom
         self._rescale_draw_image_to_collider()
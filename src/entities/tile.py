@@ -1,20 +1,23 @@
 import pygame
 from src import settings
+from src.core.surfaces import new_surface
 
 
 class Tile(pygame.sprite.Sprite):
     # Base tile class
-    def __init__(self, pos, groups):
+    def __init__(self, pos, groups, surface=None):
         super().__init__(groups)
-        self.image = pygame.Surface((settings.TILE_SIZE, settings.TILE_SIZE))
+        if surface is None:
+            surface = new_surface((settings.TILE_SIZE, settings.TILE_SIZE))
+        self.image = surface
         self.rect = self.image.get_rect(topleft=pos)
 
 
 class StaticTile(Tile):
-    # Solid tile for collision detection
+    # Solid tile for collision detection. `surface` may be a shared
+    # surface from src.core.tile_art, so never draw onto it.
     def __init__(self, pos, groups, surface):
-        super().__init__(pos, groups)
-        self.image = surface
+        super().__init__(pos, groups, surface)
 
 
 class SpawnTile(Tile):
@@ -1,5 +1,6 @@
 import pygame
 from src import settings
+from src.core.surfaces import new_surface
 
 
 class Trigger(pygame.sprite.Sprite):
@@ -7,7 +8,7 @@ class Trigger(pygame.sprite.Sprite):
     def __init__(self, pos, image=None):
         super().__init__()
         self.image = (
-            image if image is not None else pygame.Surface((settings.TILE_SIZE, settings.TILE_SIZE))
+            image if image is not None else new_surface((settings.TILE_SIZE, settings.TILE_SIZE))
         )
         self.rect = self.image.get_rect()
         self.rect.midbottom = pos
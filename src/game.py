@@ -5,154 +5,233 @@ Main game class for I Am The Fool - Auto-Runner Platformer
 import pygame
 import sys
 from src import settings
-from src.core.support import load_csv_layout
-from src.core.camera import YSortCameraGroup
-from src.entities.player import Player
-from src.entities.tile import StaticTile
-from src.entities.hazard import VisibleHazard, InvisibleHazard
+from src.core.assets import AssetManager
+from src.core.camera import Viewport, YSortCameraGroup
+from src.core.chunks import ChunkCache
+from src.core.collision import TileGrid
+from src.core.hot_reload import MapWatcher
+from src.core.mapfile import SPAWN_TILE_ID
+from src.core.parallax import Parallax, paint_strips
+from src.core.present import Presenter
+from src.core.world import SceneCache, SceneSequence, WorldMap
+from src.entities.player import Player, read_player_animations
 from src.ui.death_screen import DeathScreen
+from src.ui.hud import DistanceHUD
+from src.ui.loading_screen import LoadingScreen
+from src.ui.minimap import Minimap
 
 
 class Game:
-    """Main game class that manages the game loop and infinite scene looping"""
+    """Main game class that manages the game loop and the endless multi-scene world"""
 
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        window_size = (settings.SCREEN_WIDTH * settings.WINDOW_SCALE, settings.SCREEN_HEIGHT * settings.WINDOW_SCALE)
+        pygame.display.set_mode(window_size, pygame.RESIZABLE if settings.WINDOW_RESIZABLE else 0)
         pygame.display.set_caption("I Am The Fool")
         self.clock = pygame.time.Clock()
+        # Everything renders into the presenter's fixed-size backbuffer, which
+        # is scaled to the window once per frame (dirty rects when possible),
+        # or straight into the window when it has the backbuffer's size
+        self.presenter = Presenter()
+        self.screen = self.presenter.surface
 
         # Sprite groups
         self.camera_group = YSortCameraGroup()
-        self.tiles = pygame.sprite.Group()
-        self.hazards = pygame.sprite.Group()
+        self.camera_group.display_surface = self.screen
 
         # Game state
-        self.game_state = "playing"  # "playing" or "dead"
-        self.death_screen = DeathScreen(self.screen)
+        self.game_state = "loading"  # "loading", "playing" or "dead"
+        self.show_colliders = False  # F3 debug overlay
+        self.show_frame_stats = settings.SHOW_FRAME_STATS  # F4: draw stats in the window title
+        self.overview = None  # F5: picture-in-picture overview camera
+        self.death_screen = None  # built in start()
+        self.distance_hud = DistanceHUD() if settings.SHOW_DISTANCE_HUD else None
+        self.distance_traveled = 0  # furthest tile column reached past the spawn
+        self.show_minimap = settings.SHOW_MINIMAP  # MINIMAP_KEYS toggle it
+        self.minimap = Minimap(
+            (settings.SCREEN_WIDTH - 12, 12), settings.MINIMAP_SCALE, max_width=settings.MINIMAP_MAX_WIDTH
+        )
+        self.death_preloaded = False  # death animation requested in the background
 
-        # Level data for infinite looping
-        self.scene_layout = []
-        self.scene_width = 0
-        self.loop_offset = 0  # How many times we've looped
-
-        # Find spawn tile in map (value '5')
-        spawn_pos = None
-        layout_path = "src/scenes/scene_1/testmap.csv"
-        layout = load_csv_layout(layout_path)
-        spawn_col = None
-        spawn_row = None
-        for row_idx, row in enumerate(layout):
-            for col_idx, cell in enumerate(row):
-                if cell == "5":
-                    spawn_col = col_idx
-                    spawn_row = row_idx
-                    break
-            if spawn_col is not None:
-                break
-        if spawn_col is not None:
-            # Place player on the spawn tile. Use the tile's mid-bottom so
-            # Player.rect.midbottom aligns with the tile bottom edge.
-            spawn_pos = (
-                spawn_col * settings.TILE_SIZE + settings.TILE_SIZE // 2,
-                spawn_row * settings.TILE_SIZE + settings.TILE_SIZE,
-            )
-        else:
-            spawn_pos = (100, 300)  # fallback
+        # Level data: scenes stitched into one endless world
+        self.tilemap = None
+        self.chunk_cache = None
+        self.world = WorldMap(
+            SceneSequence(
+                settings.SCENE_PATHS,
+                settings.SCENE_ORDER,
+                settings.SCENE_WEIGHTS,
+                settings.SCENE_RANDOM_SEED,
+            ),
+            SceneCache(settings.SCENE_CACHE_SIZE),
+        )
+        self.spawn_midbottom = None
+        self.player = None
+        self.parallax = None
+
+        # Watch mode: reload scene CSVs when they're edited on disk
+        self.map_watcher = MapWatcher(settings.SCENE_PATHS) if settings.HOT_RELOAD else None
+
+        # The first scene, player sprites and parallax strips load on worker
+        # threads behind the loading screen; start() builds the game from them.
+        self.loading_screen = LoadingScreen(self.screen)
+        self.assets = AssetManager(settings.ASSET_WORKERS)
+        self.assets.submit("spawn", self._find_spawn_point, label="scenes")
+        self.assets.submit("player sprites", read_player_animations, lambda animations: animations.convert())
+        if settings.PARALLAX_LAYERS:
+            self.assets.submit("background", paint_strips)
+
+    def start(self):
+        """Build the game from the startup assets (waiting for them) and play."""
+        self.assets.wait()
         # Save canonical spawn point (midbottom) so we can reliably
         # respawn the player later.
-        self.spawn_midbottom = spawn_pos
-        self.player = Player(spawn_pos, [self.camera_group])
+        self.spawn_midbottom = self.assets.get("spawn")
+        self.player = Player(
+            self.spawn_midbottom, [self.camera_group], animations=self.assets.get("player sprites")
+        )
+
+        # Parallax strips are painted once; layers are placed relative to the
+        # camera height at the spawn
+        if settings.PARALLAX_LAYERS:
+            self.parallax = Parallax.from_strips(
+                self.assets.get("background"), reference_y=self.player.rect.centery - settings.SCREEN_HEIGHT // 2
+            )
+        self.death_screen = DeathScreen(self.screen)
 
         # Load scene
         self.load_scene()
+        self.game_state = "playing"
+        self.presenter.invalidate()
 
-    def load_scene(self):
-        """Load only scene_1 from CSV tilemap data and store for infinite looping"""
-        layout_path = "src/scenes/scene_1/testmap.csv"
-        self.scene_layout = load_csv_layout(layout_path)
-        self.scene_width = (
-            len(self.scene_layout[0]) * settings.TILE_SIZE if self.scene_layout else 0
+    def show_loading(self):
+        """Run the loading screen until the startup assets are ready, then start()."""
+        while not self.assets.ready():
+            self.clock.tick(settings.FPS)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    self.quit()
+                elif event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                    self.resize_window()
+            self.assets.poll()
+            self.loading_screen.draw(self.assets.progress(), self.assets.status)
+            self.presenter.invalidate()
+            self.presenter.present((0, 0))
+        self.start()
+
+    def resize_window(self):
+        """Lay the frame out in the resized window.
+
+        The presenter may switch between drawing into the window and into
+        its backbuffer, so everything holding the screen is pointed at it.
+        """
+        self.presenter.resize()
+        self.screen = self.presenter.surface
+        self.camera_group.display_surface = self.screen
+        self.loading_screen.screen = self.screen
+        if self.death_screen is not None:
+            self.death_screen.screen = self.screen
+
+    def _find_spawn_point(self):
+        """Midbottom of the spawn tile in the first scene (or a fallback)"""
+        # The first scene's compiled header indexes the spawn tile
+        spawn_tile = self.world.find_spawn(SPAWN_TILE_ID)
+        if spawn_tile is None:
+            return (100, 300)  # fallback
+        spawn_col, spawn_row = spawn_tile
+        # Place player on the spawn tile. Use the tile's mid-bottom so
+        # Player.rect.midbottom aligns with the tile bottom edge.
+        return (
+            spawn_col * settings.TILE_SIZE + settings.TILE_SIZE // 2,
+            spawn_row * settings.TILE_SIZE + settings.TILE_SIZE,
         )
-        self.build_tiles()
-
-    def build_tiles(self):
-        """Build tiles for current view with infinite looping"""
-        # Clear existing tiles and hazards
-        self.camera_group.empty()
-        self.tiles.empty()
-        self.hazards.empty()
-
-        # Re-add player to camera group
-        self.camera_group.add(self.player)
-
-        # Define tile colors
-        tile_colors = {
-            0: None,  # Empty space
-            1: (139, 69, 19),  # Ground tile
-            2: (100, 100, 100),  # Platform tile
-            3: (220, 20, 20),  # Visible hazard (red)
-            4: (128, 128, 128),  # Invisible hazard (grey, not rendered)
-            5: (255, 215, 0),  # Player spawnpoint (gold/yellow)
-        }
-
-        # Calculate how many screen widths to build (build extra for smooth scrolling)
-        build_width = settings.SCREEN_WIDTH * 3  # Build 3 screen widths worth
-        start_x = max(0, int(self.player.rect.centerx - build_width // 2))
-        end_x = start_x + build_width
-
-        # Build tiles from layout with looping
-        for row_index, row in enumerate(self.scene_layout):
-            for world_x in range(start_x, end_x, settings.TILE_SIZE):
-                # Calculate which column in the original layout this represents
-                col_index = (world_x // settings.TILE_SIZE) % len(row)
-                cell = row[col_index]
-
-                y = row_index * settings.TILE_SIZE
-
-                # Treat empty string and '-1' as 0 (empty space)
-                if cell == "" or cell == "-1":
-                    tile_value = 0
-                else:
-                    tile_value = int(cell)
-                if tile_value == 5:
-                    # Player spawnpoint, draw it but don't add collision
-                    color = tile_colors[tile_value]
-                    surface = pygame.Surface((settings.TILE_SIZE, settings.TILE_SIZE))
-                    surface.fill(color)
-                    pygame.draw.rect(surface, settings.BLACK, surface.get_rect(), 2)
-                    StaticTile((world_x, y), [self.camera_group], surface)
-                elif tile_value == 4:
-                    # Invisible hazard
-                    InvisibleHazard((world_x, y), [self.hazards])
-                elif tile_value == 3:
-                    # Visible hazard
-                    color = tile_colors[tile_value]
-                    surface = pygame.Surface((settings.TILE_SIZE, settings.TILE_SIZE))
-                    surface.fill(color)
-                    pygame.draw.rect(surface, settings.BLACK, surface.get_rect(), 2)
-                    VisibleHazard((world_x, y), [self.camera_group, self.hazards])
-                elif tile_value == 2 or tile_value == 1:
-                    # Platform or ground tile
-                    color = tile_colors[tile_value]
-                    surface = pygame.Surface((settings.TILE_SIZE, settings.TILE_SIZE))
-                    surface.fill(color)
-                    pygame.draw.rect(surface, settings.BLACK, surface.get_rect(), 2)
-                    StaticTile((world_x, y), [self.camera_group, self.tiles], surface)
-                # 0 is empty space, do nothing
-
-    def update_tiles(self):
-        """Update tiles based on player position for infinite scrolling"""
-        # Rebuild tiles when player has moved significantly
-        if hasattr(self, "_last_build_x"):
-            if abs(self.player.rect.centerx - self._last_build_x) > settings.SCREEN_WIDTH // 2:
-                self.build_tiles()
-                self._last_build_x = self.player.rect.centerx
+
+    def load_scene(self):
+        """Set up collision and chunk baking over the world map.
+
+        Tiles have no sprites: collisions query the tile grid and tiles are
+        drawn from the baked chunk layer.
+        """
+        self.tilemap = self.world
+        # Player collisions query this grid instead of the tile sprite groups
+        self.collision_grid = TileGrid(self.tilemap)
+        self.player.collision_grid = self.collision_grid
+        # Static tile layers are baked into chunk surfaces ahead of the camera
+        if self.chunk_cache is not None:
+            self.chunk_cache.shutdown()
+        # Scaled copies of the previous scene's chunks are never drawn again
+        self.camera_group.scaled_surfaces.clear()
+        self.chunk_cache = ChunkCache(self.tilemap)
+        self.camera_group.static_layers = [self.chunk_cache]
+        if self.parallax is not None:
+            self.camera_group.static_layers.insert(0, self.parallax)
+
+    def prefetch_scenes(self):
+        """Load the next scenes in the background before the player reaches them"""
+        self.world.prefetch(self.player.rect.centerx)
+
+    def reload_scene(self, path):
+        """Apply an edited scene CSV without restarting.
+
+        Only the chunks and merged colliders covering changed cells are
+        rebuilt; a scene that changed size shifts every segment
+        after it, so that case rebuilds the whole world. The player keeps
+        their position either way.
+        """
+        columns = self.world.reload(path)
+        self.presenter.invalidate()
+        self.minimap.invalidate()
+        self.spawn_midbottom = self._find_spawn_point()
+        if columns is None:
+            self.load_scene()
+            if settings.HOT_RELOAD_LOG:
+                print(f"[HOT RELOAD] {path}: size changed, rebuilt the world")
+        else:
+            self.chunk_cache.invalidate_columns(columns)
+            self.collision_grid.colliders.invalidate_columns(columns)
+            if settings.HOT_RELOAD_LOG:
+                print(f"[HOT RELOAD] {path}: {len(columns)} columns changed")
+
+    def draw_minimap(self):
+        """Draw the minimap of the scene under the player.
+
+        The map image is cached per scene TileMap, so it is rebuilt only when
+        the player enters another scene or a hot reload replaces the map.
+        """
+        col = max(0, self.player.rect.centerx // settings.TILE_SIZE)
+        _, _, tilemap, local_col, row_offset = self.world.scene_at(col)
+        self.minimap.update(tilemap, tilemap)
+        row = self.player.rect.centery // settings.TILE_SIZE - row_offset
+        self.presenter.mark(self.minimap.draw(self.screen, (local_col, row)))
+
+    def toggle_overview(self):
+        """Show/hide a zoomed-out picture-in-picture view following the player"""
+        if self.overview is None:
+            width, height = self.screen.get_size()
+            rect = pygame.Rect(0, 0, width // 3, height // 3)
+            rect.bottomright = (width - 10, height - 10)
+            self.overview = self.camera_group.add_viewport(
+                Viewport(rect, target=self.player, zoom=0.25, background=(90, 150, 200))
+            )
         else:
-            self._last_build_x = self.player.rect.centerx
+            self.camera_group.remove_viewport(self.overview)
+            self.overview = None
+        self.presenter.invalidate()
+
+    def preload_death_animation(self):
+        """Start building the death animation once a hazard is on screen."""
+        if self.death_preloaded:
+            return
+        view = pygame.Rect(self.camera_group.offset, (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        if self.collision_grid.overlaps_hazard(view):
+            self.player.preload_animation("death")
+            self.death_preloaded = True
 
     def run(self):
         """Main game loop"""
+        if self.game_state == "loading":
+            self.show_loading()
         while True:
             # Compute dt in seconds and clamp to avoid instability on stalls
             dt_ms = self.clock.tick(settings.FPS)
@@ -162,12 +241,34 @@ class Game:
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
+                elif event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                    self.resize_window()
+                elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    # Mouse positions arrive in window pixels; the UI works in backbuffer pixels
+                    event = self.presenter.map_event(event)
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
-                        pygame.quit()
-                        sys.exit()
+                        self.quit()
+                    elif event.key == pygame.K_F3:
+                        # Toggle merged collider debug overlay
+                        self.show_colliders = not self.show_colliders
+                        self.presenter.invalidate()
+                    elif event.key in settings.ZOOM_IN_KEYS:
+                        self.camera_group.zoom_in()
+                    elif event.key in settings.ZOOM_OUT_KEYS:
+                        self.camera_group.zoom_out()
+                    elif event.key in settings.ZOOM_RESET_KEYS:
+                        self.camera_group.set_zoom(1.0)
+                    elif event.key == pygame.K_F5:
+                        self.toggle_overview()
+                    elif event.key in settings.MINIMAP_KEYS:
+                        self.show_minimap = not self.show_minimap
+                        self.presenter.invalidate()
+                    elif event.key == pygame.K_F4:
+                        self.show_frame_stats = not self.show_frame_stats
+                        if not self.show_frame_stats:
+                            pygame.display.set_caption("I Am The Fool")
 
                 # Handle death screen input
                 if self.game_state == "dead":
@@ -175,28 +276,65 @@ class Game:
                     if action == "retry":
                         self.restart_game()
                     elif action == "quit":
-                        pygame.quit()
-                        sys.exit()
+                        self.quit()
+
+            if self.map_watcher is not None:
+                for path in self.map_watcher.poll():
+                    self.reload_scene(path)
 
             # Update game based on state
             if self.game_state == "playing":
                 # Update player (dt in seconds) and check for death
-                self.player.update(dt, self.tiles, self.hazards)
-                self.update_tiles()  # Update tiles for infinite scrolling
+                # No tile sprite groups: the player collides through its collision_grid
+                self.player.update(dt, ())
+                self.prefetch_scenes()
+                progress = (self.player.rect.centerx - self.spawn_midbottom[0]) // settings.TILE_SIZE
+                self.distance_traveled = max(self.distance_traveled, progress)
+                self.preload_death_animation()
 
                 # Check if player died
                 if not self.player.is_alive:
                     self.game_state = "dead"
+                    self.presenter.invalidate()  # the overlay covers the whole screen
+            elif self.game_state == "dead":
+                self.player.update_animation()  # play the death animation under the overlay
 
             # Draw
+            self.camera_group.update_zoom(dt)
             self.screen.fill((135, 206, 250))  # Sky blue background
             self.camera_group.custom_draw(self.player)
+            if self.show_colliders and self.camera_group.zoom == 1:
+                self.collision_grid.colliders.debug_draw(self.screen, self.camera_group.offset)
+            if self.distance_hud is not None:
+                self.distance_hud.set_distance(self.distance_traveled)
+                self.presenter.mark(self.distance_hud.draw(self.screen, self.camera_group.stats))
+            if self.show_minimap:
+                self.draw_minimap()
 
             # Draw death screen if player is dead
             if self.game_state == "dead":
                 self.death_screen.draw()
+                for rect in self.death_screen.button_rects:
+                    self.presenter.mark(rect)
+
+            # Refresh the title about twice a second; set_caption isn't free
+            if self.show_frame_stats and self.camera_group.stats.frames % 30 == 0:
+                pygame.display.set_caption(
+                    f"I Am The Fool - {self.camera_group.stats.summary()} - {self.clock.get_fps():.0f} fps"
+                )
+
+            self.presenter.present(self.camera_group.offset, self.camera_group.drawn_rects)
 
-            pygame.display.flip()
+    def quit(self):
+        """Stop background workers and exit the game"""
+        if self.chunk_cache is not None:
+            self.chunk_cache.shutdown()
+        if self.player is not None and self.player.animations is not None:
+            self.player.animations.shutdown()
+        self.assets.shutdown()
+        self.world.shutdown()
+        pygame.quit()
+        sys.exit()
 
     def restart_game(self):
         """Restart the game after death"""
@@ -209,4 +347,5 @@ class Game:
             pass
         self.player.respawn()
         self.game_state = "playing"
-        self.build_tiles()  # Rebuild tiles around spawn position
+        self.distance_traveled = 0
+        self.presenter.invalidate()
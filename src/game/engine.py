@@ -14,6 +14,7 @@ from src import settings
 
 # Use the real modules under src so imports match the rest of the project
 from src.core.camera import YSortCameraGroup
+from src.core.present import Presenter
 from src.entities.player import Player
 from src.ui.death_screen import DeathScreen
 
@@ -29,8 +30,11 @@ class Game:
     def __init__(self):
         pygame.init()
         # Ensure a display surface exists for CameraSystem
-        self.screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("I Am The Fool - Engine")
+        # Render into the presenter's backbuffer; it is scaled to the window
+        self.presenter = Presenter()
+        self.screen = self.presenter.surface
 
         self.clock = pygame.time.Clock()
 
@@ -41,6 +45,7 @@ class Game:
 
         # Camera is a Group - use the core YSortCameraGroup implementation
         self.camera = YSortCameraGroup()
+        self.camera.display_surface = self.screen
 
         # Instantiate player and add to both `all_sprites` and `camera` so it
         # will be included in camera drawing. Player expects (pos, groups).
@@ -48,6 +53,14 @@ class Game:
 
         # Death screen will be created lazily
         self.death_screen = DeathScreen(self.screen)
+        self._was_alive = True
+
+    def resize_window(self):
+        """Lay the frame out in the resized window and draw into the presenter's current surface."""
+        self.presenter.resize()
+        self.screen = self.presenter.surface
+        self.camera.display_surface = self.screen
+        self.death_screen.screen = self.screen
 
     def run(self):
         """Run the main loop.
@@ -69,6 +82,10 @@ class Game:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
+                if event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                    self.resize_window()
+                elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    event = self.presenter.map_event(event)
 
                 # When dead, forward events to the death screen to handle menu actions
                 if not self.player.is_alive:
@@ -92,12 +109,24 @@ class Game:
             except Exception:
                 # Defensive fallback: if camera.custom_draw raises, blit all
                 # sprites directly using their rect positions.
-                for sprite in self.all_sprites.sprites():
-                    if hasattr(sprite, "image") and hasattr(sprite, "rect"):
-                        self.screen.blit(sprite.image, sprite.rect.topleft)
+                self.screen.blits(
+                    [
+                        (sprite.image, sprite.rect.topleft)
+                        for sprite in self.all_sprites.sprites()
+                        if hasattr(sprite, "image") and hasattr(sprite, "rect")
+                    ],
+                    doreturn=False,
+                )
+                self.presenter.invalidate()
 
             # If player is dead, draw the death overlay
             if not self.player.is_alive:
                 self.death_screen.draw()
-
-            pygame.display.flip()
+                for rect in self.death_screen.button_rects:
+                    self.presenter.mark(rect)
+            if self.player.is_alive != self._was_alive:
+                # The overlay appeared or went away: push the whole screen
+                self._was_alive = self.player.is_alive
+                self.presenter.invalidate()
+
+            self.presenter.present(self.camera.offset, self.camera.drawn_rects)
@@ -3,6 +3,7 @@ from src import settings
 from src.core.camera import YSortCameraGroup, CameraLookAhead
 from src.entities.player import Player
 from src.entities.tile import SpawnTile
+from src.ui.fonts import get_font
 
 
 class Game:
@@ -14,7 +15,7 @@ class Game:
         pygame.display.set_caption("I Am The Fool")
         self.clock = pygame.time.Clock()
         self.running = True
-        self.font = pygame.font.SysFont(None, 36)
+        self.font = get_font(36)
         # Use a simple string-based state; settings.MENU was removed/absent.
         self.game_state = "menu"
         self.camera = YSortCameraGroup()
@@ -51,12 +52,10 @@ class Game:
             keys = pygame.key.get_pressed()
             if keys[pygame.K_F6]:
                 w, h = self.player.rect.size
-                self.player.rect.size = (w, h + 1)
-                self.player._rescale_draw_image_to_collider(self.player._art_pad)
+                self.player.resize_collider((w, h + 1))
             if keys[pygame.K_F7]:
                 w, h = self.player.rect.size
-                self.player.rect.size = (w, max(1, h - 1))
-                self.player._rescale_draw_image_to_collider(self.player._art_pad)
+                self.player.resize_collider((w, h - 1))
             self.handle_events(events, keys)
             self.player.update(dt, self.obstacles)
             self.cam_lookahead.update(self.player.rect.center, dt)
@@ -13,6 +13,14 @@ import pygame
 # adjustments to UI/camera logic.
 SCREEN_WIDTH = 800  # pixels
 SCREEN_HEIGHT = 600  # pixels
+# WINDOW_SCALE: initial window size as a multiple of SCREEN_WIDTH/HEIGHT.
+# The game always renders at SCREEN_WIDTH x SCREEN_HEIGHT and the frame is
+# scaled up by the largest integer factor that fits the window (black bars
+# fill the rest), so resizing the window doesn't change render cost. At 1,
+# frames are drawn straight into the window until it's resized.
+# WINDOW_RESIZABLE: allow resizing the window.
+WINDOW_SCALE = 1
+WINDOW_RESIZABLE = True
 # FPS: target frames-per-second used with pygame.time.Clock.tick(FPS).
 # Affects how often update/draw run; movement code sometimes assumes
 # per-frame steps (not always dt-corrected), so test gameplay when
@@ -33,6 +41,70 @@ GREEN = (0, 255, 0)
 # calculations throughout the codebase.
 TILE_SIZE = 32  # pixels
 
+# World / scenes
+# SCENE_PATHS: scene CSVs stitched end to end into one endless world. The
+# first scene always starts the world (it holds the spawn tile).
+# SCENE_ORDER: "sequence" cycles through SCENE_PATHS; "random" picks each
+# following scene by SCENE_WEIGHTS (seeded, so respawns see the same world).
+# SCENE_CACHE_SIZE: how many parsed scenes stay in memory (LRU).
+SCENE_PATHS = [
+    "src/scenes/scene_1/testmap.csv",
+    "src/scenes/scene_2/map.csv",
+    "src/scenes/scene_3/map.csv",
+]
+SCENE_ORDER = "sequence"
+SCENE_WEIGHTS = [1, 1, 1]
+SCENE_RANDOM_SEED = 0
+SCENE_CACHE_SIZE = 3
+# HOT_RELOAD: watch the scene CSVs and apply edits live (also `main.py --watch`).
+# HOT_RELOAD_INTERVAL: seconds between checks of the CSV modification times.
+# HOT_RELOAD_LOG: print what each reload rebuilt.
+HOT_RELOAD = False
+HOT_RELOAD_INTERVAL = 0.5
+HOT_RELOAD_LOG = False
+
+# Assets and caches
+# ASSET_WORKERS: threads decoding images and parsing maps at startup, behind
+# the loading screen (src/core/assets.py).
+ASSET_WORKERS = 2
+# FRAME_CACHE_DIR: processed sprite frames are cached here (src/core/
+# frame_cache.py) so warm starts skip slicing/aligning the sheets. Safe to
+# delete; empty disables the cache.
+FRAME_CACHE_DIR = ".cache/frames"
+
+# Rendering diagnostics
+# SHOW_FRAME_STATS: show per-frame draw calls / blits / pixels in the window
+# title (toggle in game with F4).
+SHOW_FRAME_STATS = False
+# DIRTY_RECTS: present frames with display.update(rects) instead of a full
+# flip, pushing only the regions sprites and UI changed.
+# DIRTY_SCROLL_THRESHOLD: camera movement (px) that forces a full flip. Any
+# scroll moves every world pixel, so keep this at 0 unless the view can
+# tolerate stale pixels.
+DIRTY_RECTS = True
+DIRTY_SCROLL_THRESHOLD = 0
+
+# Parallax background (src/core/parallax.py), back to front. Each entry is
+# (kind, color, scroll factor, top): kind is "hills" or "clouds", factor 0
+# stays fixed on screen and 1 scrolls with the world, and top is the layer's
+# screen y while the camera is at the spawn height. Empty disables parallax.
+PARALLAX_LAYERS = [
+    ("clouds", (240, 248, 255), 0.1, 40),
+    ("hills", (150, 190, 215), 0.25, 250),
+    ("hills", (110, 160, 140), 0.5, 330),
+]
+
+# HUD
+# SHOW_DISTANCE_HUD: draw the distance counter (tiles past the spawn, in
+# meters) in the top-left corner.
+SHOW_DISTANCE_HUD = True
+# SHOW_MINIMAP: overview of the current scene in the top-right corner
+# (toggle with MINIMAP_KEYS). MINIMAP_SCALE: minimap pixels per tile.
+# MINIMAP_MAX_WIDTH: wider scenes are shrunk to fit this many pixels.
+SHOW_MINIMAP = True
+MINIMAP_SCALE = 2
+MINIMAP_MAX_WIDTH = 320
+
 # Player dimensions and visual fallback
 # PLAYER_WIDTH / PLAYER_HEIGHT: only used as a fallback visual surface
 # when sprite frame loading fails. The authoritative collision size is
@@ -73,6 +145,15 @@ JUMP_HOLD_TIME = 0.35      # max duration that “hold jump for higher jump” i
 JUMP_KEYS = [pygame.K_SPACE, pygame.K_w, pygame.K_UP]
 LEFT_KEYS = [pygame.K_a, pygame.K_LEFT]
 RIGHT_KEYS = [pygame.K_d, pygame.K_RIGHT]
+# ATTACK_KEYS: play the attack animation (visual only for now).
+ATTACK_KEYS = [pygame.K_j]
+# Camera zoom: step through core.zoom.ZOOM_LEVELS; reset returns to 1.0.
+ZOOM_IN_KEYS = [pygame.K_EQUALS, pygame.K_KP_PLUS]
+ZOOM_OUT_KEYS = [pygame.K_MINUS, pygame.K_KP_MINUS]
+ZOOM_RESET_KEYS = [pygame.K_0, pygame.K_KP0]
+# ZOOM_SPEED: how quickly the camera eases to a new zoom (1/s; higher = snappier).
+ZOOM_SPEED = 8.0
+MINIMAP_KEYS = [pygame.K_m]
 
 # Game states
 MENU = "menu"
@@ -4,6 +4,7 @@ Death screen overlay menu with retry/quit options
 
 import pygame
 from src import settings
+from src.ui.widgets import Label, Overlay
 
 
 class DeathScreen:
@@ -11,9 +12,6 @@ class DeathScreen:
 
     def __init__(self, screen):
         self.screen = screen
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
 
         # Menu state
         self.selected_option = 0  # 0 = Retry, 1 = Quit
@@ -26,6 +24,16 @@ class DeathScreen:
         self.selected_color = (255, 255, 0)  # Yellow for selected option
         self.hover_color = (200, 200, 200)  # Light grey for hover
 
+        # Retained widgets: rendered once, redrawn from cache every frame
+        center_x = settings.SCREEN_WIDTH // 2
+        center_y = settings.SCREEN_HEIGHT // 2
+        self.overlay = Overlay((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), alpha=128)
+        self.title = Label("YOU DIED", 72, (220, 20, 20), (center_x, center_y - 100))
+        self.option_labels = [
+            Label(option, 48, self._option_color(i), (center_x, center_y + i * 60))
+            for i, option in enumerate(self.options)
+        ]
+
     def handle_input(self, event):
         """Handle keyboard and mouse input for menu navigation"""
         if event.type == pygame.KEYDOWN:
@@ -58,58 +66,34 @@ class DeathScreen:
         return None
 
     def draw(self):
-        """Draw the death screen overlay"""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-
-        # Draw "YOU DIED" text
-        death_text = self.font_large.render("YOU DIED", True, (220, 20, 20))
-        death_rect = death_text.get_rect(
-            center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2 - 100)
-        )
-        self.screen.blit(death_text, death_rect)
-
-        # Clear button rects for new frame
-        self.button_rects = []
-
-        # Draw menu options with clickable areas
-        for i, option in enumerate(self.options):
-            color = (
-                self.selected_color if i == self.selected_option else self.text_color
-            )
-            option_text = self.font_medium.render(option, True, color)
-            option_rect = option_text.get_rect(
-                center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2 + i * 60)
-            )
-
-            # Create clickable area (larger than text for easier clicking)
-            button_rect = pygame.Rect(
-                option_rect.centerx - 100, option_rect.centery - 30, 200, 60
-            )
-            self.button_rects.append(button_rect)
+        """Draw the death screen overlay from cached widgets.
+
+        Nothing is rendered here: labels only re-render when the selection
+        changes their color.
+        """
+        self.overlay.draw(self.screen)
+        self.title.draw(self.screen)
 
+        self.button_rects = self._compute_button_rects()
+        for i, label in enumerate(self.option_labels):
+            label.color = self._option_color(i)
             # Draw button background if selected/hovered
             if i == self.selected_option:
-                pygame.draw.rect(self.screen, (50, 50, 50), button_rect, 2)
+                pygame.draw.rect(self.screen, (50, 50, 50), self.button_rects[i], 2)
+            label.draw(self.screen)
 
-            self.screen.blit(option_text, option_rect)
+    def _option_color(self, index):
+        return self.selected_color if index == self.selected_option else self.text_color
 
     def _compute_button_rects(self):
-        """Compute `button_rects` using current fonts and layout.
+        """Compute `button_rects` from the cached layout.
 
         This allows input handling to work even when events are processed
         before draw() is called in the frame loop.
         """
-        self.button_rects = []
-        for i, option in enumerate(self.options):
-            option_text = self.font_medium.render(option, True, self.text_color)
-            option_rect = option_text.get_rect(
-                center=(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2 + i * 60)
-            )
-            button_rect = pygame.Rect(
-                option_rect.centerx - 100, option_rect.centery - 30, 200, 60
-            )
-            self.button_rects.append(button_rect)
+        # Clickable area, larger than the text for easier clicking
+        self.button_rects = [
+            pygame.Rect(label.pos[0] - 100, label.pos[1] - 30, 200, 60)
+            for label in self.option_labels
+        ]
+        return self.button_rects
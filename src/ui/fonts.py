@@ -0,0 +1,77 @@
+"""
+Shared fonts and glyph atlases for the UI.
+
+`get_font` keeps one `pygame.font.Font` per (name, size), so widgets never
+load the same font twice. A `GlyphAtlas` pre-renders a fixed character set
+(digits by default) into one surface; text made of those characters is
+drawn as one blit per glyph with no `font.render` at all, which is what a
+per-frame counter needs.
+"""
+
+import pygame
+
+from src.core.render import submit
+from src.core.surfaces import new_surface
+
+DIGITS = "0123456789"
+
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """Shared Font for (name, size); name None is pygame's default font."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+class GlyphAtlas:
+    """Characters of one font and color packed into a single surface.
+
+    `glyphs` maps each character to a subsurface of `surface`, so drawing
+    text is a batch of (glyph, dest) blits. Characters outside the atlas are
+    rendered once on first use and kept.
+    """
+
+    def __init__(self, font, color, chars=DIGITS):
+        self.font = font
+        self.color = color
+        rendered = [(char, font.render(char, True, color)) for char in dict.fromkeys(chars)]
+        self.height = max([font.get_height()] + [image.get_height() for _, image in rendered])
+        width = sum(image.get_width() for _, image in rendered)
+        self.surface = new_surface((max(1, width), self.height), per_pixel_alpha=True)
+        self.glyphs = {}
+        x = 0
+        for char, image in rendered:
+            self.surface.blit(image, (x, 0))
+            self.glyphs[char] = self.surface.subsurface((x, 0, image.get_width(), self.height))
+            x += image.get_width()
+
+    def glyph(self, char):
+        image = self.glyphs.get(char)
+        if image is None:
+            image = self.glyphs[char] = self.font.render(char, True, self.color)
+        return image
+
+    def width(self, text):
+        return sum(self.glyph(char).get_width() for char in text)
+
+    def layout(self, text, topleft, items):
+        """Append (glyph, dest) pairs for text at topleft; returns the text Rect."""
+        x, y = topleft
+        for char in text:
+            image = self.glyph(char)
+            items.append((image, (x, y)))
+            x += image.get_width()
+        return pygame.Rect(topleft, (x - topleft[0], self.height))
+
+    def draw(self, surface, text, topleft, stats=None):
+        items = []
+        rect = self.layout(text, topleft, items)
+        submit(surface, items, stats)
+        return rect
@@ -0,0 +1,33 @@
+"""
+In-game HUD: distance counter.
+
+The counter is drawn from a digit `GlyphAtlas`, so updating it every frame
+costs a handful of glyph blits and never calls `font.render`.
+"""
+
+from src import settings
+from src.core.render import submit
+from src.ui.fonts import GlyphAtlas, get_font
+
+
+class DistanceHUD:
+    """Shows how far the player got, in meters (one tile = one meter)."""
+
+    def __init__(self, topleft=(16, 12), size=36, color=None):
+        self.topleft = topleft
+        self.atlas = GlyphAtlas(get_font(size), color or settings.WHITE, "0123456789 m")
+        self._text = None
+        self._items = []
+        self.rect = None
+
+    def set_distance(self, meters):
+        text = f"{int(meters)} m"
+        if text != self._text:
+            self._text = text
+            self._items = []
+            self.rect = self.atlas.layout(text, self.topleft, self._items)
+
+    def draw(self, surface, stats=None):
+        """Blit the counter; returns the screen rect it covers."""
+        submit(surface, self._items, stats)
+        return self.rect
@@ -0,0 +1,33 @@
+"""
+Loading screen shown while the startup assets load.
+"""
+
+import pygame
+from src import settings
+from src.ui.widgets import Label
+
+
+class LoadingScreen:
+    """Title, progress bar and the name of the last asset loaded."""
+
+    def __init__(self, screen, background=(20, 28, 48), bar_size=(400, 16)):
+        self.screen = screen
+        self.background = background
+        center_x = settings.SCREEN_WIDTH // 2
+        center_y = settings.SCREEN_HEIGHT // 2
+        self.title = Label("Loading", 48, settings.WHITE, (center_x, center_y - 40))
+        self.status = Label("", 24, (160, 170, 190), (center_x, center_y + 50))
+        self.bar = pygame.Rect((0, 0), bar_size)
+        self.bar.center = (center_x, center_y + 16)
+
+    def draw(self, progress, status=""):
+        """Draw the screen with progress (0-1) filled in the bar."""
+        self.screen.fill(self.background)
+        self.title.draw(self.screen)
+        self.status.text = status
+        self.status.draw(self.screen)
+        fill = self.bar.inflate(-6, -6)
+        fill.width = round(fill.width * max(0.0, min(1.0, progress)))
+        if fill.width:
+            self.screen.fill(settings.WHITE, fill)
+        pygame.draw.rect(self.screen, settings.WHITE, self.bar, 2)
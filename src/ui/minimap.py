@@ -0,0 +1,94 @@
+"""
+Corner minimap of the current scene.
+
+The tile-id grid is wrapped as an 8-bit palettized surface and colored by
+its palette, so the whole map is drawn in one vectorized step with no
+per-tile work. That image is only rebuilt when the scene under the player
+changes (or is hot-reloaded); each frame costs the map blit plus a marker.
+"""
+
+import pygame
+
+from src.core.surfaces import new_surface, optimize
+from src.core.tile_art import TILE_THEMES
+
+# Color of empty cells (and of invisible hazards, which stay secret)
+EMPTY_COLOR = (20, 28, 48)
+MARKER_COLOR = (255, 255, 255)
+
+
+def tile_palette(theme="default"):
+    """256-entry palette mapping tile ids to minimap colors."""
+    palette = [EMPTY_COLOR] * 256
+    for tile_id, color in TILE_THEMES[theme].items():
+        palette[tile_id] = color
+    return palette
+
+
+def render_grid(tilemap, palette, scale=1):
+    """Surface with one pixel (scaled by scale) per tile of tilemap."""
+    size = (tilemap.width, tilemap.height)
+    surface = pygame.image.frombuffer(bytes(tilemap.data), size, "P")
+    surface.set_palette(palette)
+    if scale != 1:
+        surface = pygame.transform.scale(surface, (size[0] * scale, size[1] * scale))
+    return surface
+
+
+class Minimap:
+    """Scene overview anchored to a screen corner with a player marker.
+
+    scale: minimap pixels per tile. alpha: constant opacity of the map.
+    max_width: wider maps are shrunk (keeping their aspect) to this width.
+    """
+
+    def __init__(self, topright, scale=2, alpha=200, theme="default", max_width=None):
+        self.topright = topright
+        self.scale = scale
+        self.max_width = max_width
+        self.alpha = alpha
+        self.palette = tile_palette(theme)
+        self.image = None
+        self.rect = None
+        self.grid_size = (0, 0)  # tiles shown by the image
+        self.key = None  # what the cached image shows
+        self.builds = 0
+        self.marker = new_surface((2 * scale, 2 * scale), fill=MARKER_COLOR)
+
+    def update(self, tilemap, key):
+        """Show tilemap; the image is only rebuilt when key changes."""
+        if key == self.key and self.image is not None:
+            return
+        self.key = key
+        image = render_grid(tilemap, self.palette, self.scale)
+        if self.max_width and image.get_width() > self.max_width:
+            height = max(1, image.get_height() * self.max_width // image.get_width())
+            image = pygame.transform.scale(image, (self.max_width, height))
+        self.image = optimize(image, alpha=self.alpha)
+        self.rect = self.image.get_rect(topright=self.topright)
+        self.grid_size = (tilemap.width, tilemap.height)
+        self.builds += 1
+
+    def invalidate(self):
+        """Rebuild on the next update (e.g. the scene was edited)."""
+        self.key = None
+
+    def draw(self, surface, tile_pos):
+        """Blit the map and the marker at tile_pos (col, row in the scene).
+
+        Returns the screen rect covered, for dirty-rect presentation.
+        """
+        if self.image is None:
+            return None
+        surface.blit(self.image, self.rect)
+        width, height = self.grid_size
+        col = min(max(int(tile_pos[0]), 0), width - 1)
+        row = min(max(int(tile_pos[1]), 0), height - 1)
+        # Center of the tile's cell (cells are scale pixels unless shrunk)
+        center = (
+            self.rect.x + (2 * col + 1) * self.rect.width // (2 * width),
+            self.rect.y + (2 * row + 1) * self.rect.height // (2 * height),
+        )
+        marker = self.marker.get_rect(center=center)
+        surface.blit(self.marker, marker.clamp(self.rect))
+        return self.rect
@@ -0,0 +1,73 @@
+"""
+Retained-mode UI widgets.
+
+Widgets keep their rendered surface between frames and only re-render
+when their content or state changes, so drawing a static menu is a couple
+of blits per frame.
+"""
+
+import pygame
+
+from src.core.surfaces import new_surface, optimize
+from src.ui.fonts import get_font
+
+
+class Label:
+    """Text rendered once and cached until its text or color changes.
+
+    anchor: a pygame.Rect attribute name ("center", "topleft", ...) and
+    pos the point it is placed at.
+    """
+
+    def __init__(self, text, size, color, pos, anchor="center", font_name=None):
+        self.font = get_font(size, font_name)
+        self.pos = pos
+        self.anchor = anchor
+        self._text = text
+        self._color = color
+        self._image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.renders = 0
+        self._render()
+
+    def _render(self):
+        self._image = self.font.render(self._text, True, self._color)
+        self.rect = self._image.get_rect(**{self.anchor: self.pos})
+        self.renders += 1
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        if text != self._text:
+            self._text = text
+            self._render()
+
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, color):
+        if color != self._color:
+            self._color = color
+            self._render()
+
+    @property
+    def image(self):
+        return self._image
+
+    def draw(self, surface):
+        surface.blit(self._image, self.rect)
+
+
+class Overlay:
+    """Full-area translucent fill, built once per size."""
+
+    def __init__(self, size, color=(0, 0, 0), alpha=128):
+        self.image = optimize(new_surface(size, fill=color), alpha=alpha)
+
+    def draw(self, surface):
+        surface.blit(self.image, (0, 0))
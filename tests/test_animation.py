@@ -0,0 +1,110 @@
+import pygame
+
+from src import settings
+from src.core.animation import Animation, AnimationSet, AnimationSpec
+
+FRAME_SIZE = (16, 12)
+FEET = (6, 10)
+
+
+def _sheet(path, boxes):
+    """Vertical strip with one opaque box (x, y, w, h) per frame."""
+    sheet = pygame.Surface((FRAME_SIZE[0], FRAME_SIZE[1] * len(boxes)), pygame.SRCALPHA)
+    for i, (x, y, w, h) in enumerate(boxes):
+        sheet.fill((200, 40, 90, 255), (x, y + i * FRAME_SIZE[1], w, h))
+    pygame.image.save(sheet, str(path))
+
+
+def _animation_set(directory, **specs):
+    return AnimationSet(directory, specs, FEET, frame_size=FRAME_SIZE, canvas=(12, 12))
+
+
+def test_animations_are_built_on_first_use(tmp_path):
+    _sheet(tmp_path / "walk.png", [(4, 4, 4, 6)] * 2)
+    _sheet(tmp_path / "death.png", [(4, 4, 4, 6)])
+    animations = _animation_set(
+        tmp_path, walk=AnimationSpec("walk", count=2), death=AnimationSpec("death", loop=False)
+    )
+    assert animations.builds == 0
+    walk = animations.get("walk")
+    assert animations.get("walk") is walk
+    assert animations.builds == 1 and not animations.loaded("death")
+
+
+def test_poses_reuse_the_frames_of_their_source(tmp_path):
+    _sheet(tmp_path / "walk.png", [(4, 4, 4, 6)] * 3)
+    animations = _animation_set(
+        tmp_path, walk=AnimationSpec("walk"), jump=AnimationSpec(source="walk", frames=[1])
+    )
+    jump = animations.get("jump")
+    assert jump.frames == [animations.get("walk").frames[1]]
+    assert animations.builds == 1
+
+
+def test_anchored_frames_share_one_crop(tmp_path):
+    # A lunge: the second frame reaches right of the character
+    _sheet(tmp_path / "attack.png", [(4, 4, 4, 6), (4, 4, 10, 6)])
+    attack = _animation_set(tmp_path, attack=AnimationSpec("attack")).get("attack")
+    assert [frame.get_size() for frame in attack.frames] == [(10, 6), (10, 6)]
+    # Feet stay at the same point of every frame instead of re-centering
+    assert attack.anchors == [(FEET[0] - 4, FEET[1] - 4)] * 2
+
+
+def test_preload_builds_in_the_background(tmp_path):
+    _sheet(tmp_path / "death.png", [(4, 4, 4, 6)] * 3)
+    animations = _animation_set(tmp_path, death=AnimationSpec("death", frames=[0, 2], loop=False))
+    animations.preload("death")
+    animations.pending["death"].result()
+    animations.collect()
+    assert animations.loaded("death") and not animations.pending
+    assert len(animations.get("death").frames) == 2
+    animations.shutdown()
+
+
+def test_failed_builds_use_the_fallback(tmp_path):
+    fallback = Animation([pygame.Surface((4, 4))])
+    animations = _animation_set(tmp_path, death=AnimationSpec("death"))
+    assert animations.get("death", fallback=fallback) is fallback
+
+
+def test_decoded_sheets_are_finished_without_rereading(tmp_path, monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    monkeypatch.setattr(settings, "FRAME_CACHE_DIR", str(tmp_path / "cache"))
+    _sheet(tmp_path / "walk.png", [(4, 4, 4, 6)] * 2)
+    animations = _animation_set(tmp_path, walk=AnimationSpec("walk", count=2, anchored=False))
+    # As an asset loader worker would, before the main thread needs it
+    animations.decode("walk")
+    assert animations.decoded and not animations.loaded("walk")
+
+    def load(*args):
+        raise AssertionError("sheet decoded on the main thread")
+
+    monkeypatch.setattr(pygame.image, "load", load)
+    assert len(animations.get("walk").frames) == 2
+
+
+def test_failed_background_reads_use_the_fallback(tmp_path):
+    fallback = Animation([pygame.Surface((4, 4))])
+    animations = _animation_set(tmp_path, death=AnimationSpec("death"))
+    animations.preload("death")  # the sheet doesn't exist
+    animations.pending["death"].exception()
+    animations.collect(fallback=fallback)
+    assert not animations.pending and animations.get("death") is fallback
+    animations.shutdown()
+
+
+def test_atlas_frames_come_from_the_converted_pages(tmp_path):
+    from src.core.atlas import build_atlas, read_atlas
+
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    _sheet(tmp_path / "walk.png", [(4, 4, 4, 6)] * 2)
+    build_atlas(tmp_path, frame_size=FRAME_SIZE)
+    # Read on a loader thread, converted on the main thread
+    animations = AnimationSet(tmp_path, {"walk": AnimationSpec("walk")}, FEET, FRAME_SIZE, atlas=read_atlas(tmp_path))
+    unconverted = animations.atlas.pages[0]
+    animations.decode("walk")
+    animations.convert()
+    frames = animations.get("walk").frames
+    assert all(frame.get_parent() is animations.atlas.pages[0] is not unconverted for frame in frames)
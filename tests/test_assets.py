@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from src.core.assets import AssetManager
+
+
+def test_loads_run_on_workers_and_finish_on_the_main_thread():
+    assets = AssetManager(workers=2)
+    threads = {}
+
+    def load():
+        threads["load"] = threading.current_thread()
+        return 2
+
+    def finish(value):
+        threads["finish"] = threading.current_thread()
+        return value * 10
+
+    assets.submit("number", load, finish)
+    assert assets.get("number") == 20
+    assert threads["load"] is not threading.main_thread()
+    assert threads["finish"] is threading.main_thread()
+    assets.shutdown()
+
+
+def test_ready_waits_only_for_required_jobs():
+    gate = threading.Event()
+    assets = AssetManager()
+    assets.submit("scene", lambda: "map")
+    assets.submit("music", gate.wait, required=False)
+    assert assets.progress() < 1
+    assets.wait()
+    assert assets.ready() and assets.get("scene") == "map"
+    assert assets.progress() == 0.5
+    gate.set()
+    assets.get("music")
+    assert assets.progress() == 1.0
+    assets.shutdown()
+
+
+def test_failed_jobs_raise_from_get():
+    def load():
+        raise OSError("missing file")
+
+    assets = AssetManager()
+    assets.submit("broken", load)
+    assets.wait()
+    assert assets.ready()
+    with pytest.raises(OSError):
+        assets.get("broken")
+    assets.shutdown()
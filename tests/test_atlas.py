@@ -0,0 +1,55 @@
+import os
+
+import pygame
+
+from src.core.atlas import build_atlas, is_stale, load_atlas, shelf_pack
+
+
+def _sheet(path, boxes, frame_size=(16, 12)):
+    """Vertical strip with one opaque box (x, y, w, h) per frame."""
+    sheet = pygame.Surface((frame_size[0], frame_size[1] * len(boxes)), pygame.SRCALPHA)
+    for i, (x, y, w, h) in enumerate(boxes):
+        sheet.fill((200, 40 * i, 90, 255), (x, y + i * frame_size[1], w, h))
+    pygame.image.save(sheet, str(path))
+
+
+def test_shelf_pack_places_boxes_without_overlap():
+    sizes = [(30, 10), (5, 40), (20, 20), (60, 8), (12, 12), (70, 30)]
+    placements, pages = shelf_pack(sizes, max_size=64, padding=1)
+    rects = {}
+    for (w, h), (page, x, y) in zip(sizes, placements):
+        rects.setdefault(page, []).append(pygame.Rect(x, y, w + 1, h + 1))
+    for page, page_rects in rects.items():
+        bounds = pygame.Rect((0, 0), pages[page])
+        for i, rect in enumerate(page_rects):
+            assert bounds.contains(rect) or rect.width > 64
+            assert rect.collidelist(page_rects[i + 1:]) == -1
+    assert len(pages) > 1
+
+
+def test_atlas_round_trip_yields_trimmed_subsurfaces(tmp_path):
+    _sheet(tmp_path / "walk.png", [(2, 3, 5, 6), (8, 0, 4, 12)])
+    _sheet(tmp_path / "idle.png", [(0, 10, 16, 2)])
+    build_atlas(tmp_path, frame_size=(16, 12))
+
+    atlas = load_atlas(tmp_path)
+    assert sorted(atlas.names()) == ["idle", "walk"]
+    walk = atlas.frames("walk")
+    assert [frame.get_size() for frame in walk] == [(5, 6), (4, 12)]
+    assert len(atlas.pages) == 1
+    assert all(frame.get_parent() is atlas.pages[0] for frame in walk + atlas.frames("idle"))
+    assert walk[1].get_at((0, 0)) == (200, 40, 90, 255)
+    # Feet point relative to the trimmed frame: bottom center
+    assert atlas.pivots("walk") == [(2, 6), (2, 12)]
+
+
+def test_atlas_goes_stale_when_a_sheet_changes(tmp_path):
+    _sheet(tmp_path / "walk.png", [(2, 3, 5, 6)])
+    build_atlas(tmp_path, frame_size=(16, 12))
+    assert not is_stale(tmp_path)
+
+    _sheet(tmp_path / "walk.png", [(2, 3, 6, 6)])
+    stat = os.stat(tmp_path / "walk.png")
+    os.utime(tmp_path / "walk.png", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert is_stale(tmp_path)
+    assert load_atlas(tmp_path) is None
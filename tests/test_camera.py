@@ -0,0 +1,168 @@
+import pygame
+
+from src.core import camera
+from src.core.camera import Viewport, YSortCameraGroup
+from src.core.zoom import ScaledSurfaceCache
+
+
+class _Box(pygame.sprite.Sprite):
+    def __init__(self, groups, topleft, size=(10, 10)):
+        super().__init__(groups)
+        self.image = pygame.Surface(size)
+        self.rect = self.image.get_rect(topleft=topleft)
+
+
+class _Drawn(_Box):
+    def __init__(self, groups, topleft):
+        super().__init__(groups, topleft)
+        self.calls = []
+
+    def draw(self, screen, off=None):
+        self.calls.append(tuple(off))
+
+
+def test_visible_sprites_are_culled_and_depth_sorted():
+    group = YSortCameraGroup()
+    low = _Box(group, (100, 300))
+    high = _Box(group, (120, 50))
+    far = _Box(group, (50_000, 100))
+    view = pygame.Rect(0, 0, 800, 600)
+    assert group.visible_sprites(view) == [high, low]
+
+    # Moving a sprite re-sorts it; moving one away culls it
+    high.rect.y = 400
+    far.rect.x = 500
+    assert group.visible_sprites(view) == [far, low, high]
+    low.rect.x = -10_000
+    assert group.visible_sprites(view) == [far, high]
+    high.kill()
+    assert group.visible_sprites(view) == [far]
+    assert group.visible_sprites(pygame.Rect(49_000, 0, 800, 600)) == []
+
+
+class _Watched(_Box):
+    """Counts how often its rect is read."""
+
+    reads = 0
+
+    @property
+    def rect(self):
+        _Watched.reads += 1
+        return self._rect
+
+    @rect.setter
+    def rect(self, rect):
+        self._rect = rect
+
+
+def test_static_sprites_away_from_the_view_are_checked_round_robin(monkeypatch):
+    monkeypatch.setattr(camera, "MOVE_SWEEP_BATCH", 10)
+    group = YSortCameraGroup()
+    far = [_Watched(group, (20_000 + 20 * i, 100)) for i in range(100)]
+    view = pygame.Rect(0, 0, 800, 600)
+    group.visible_sprites(view)  # indexes the new sprites
+    _Watched.reads = 0
+    group.visible_sprites(view)
+    assert _Watched.reads <= 2 * 10
+
+    # One of them walks into view: found by the sweep, then tracked
+    far[42].rect.x = 300
+    for _ in range(10):
+        group.visible_sprites(view)
+    assert group.visible_sprites(view) == [far[42]]
+
+
+def test_draw_path_is_resolved_per_sprite():
+    surface = pygame.Surface((800, 600))
+    group = YSortCameraGroup()
+    group.display_surface = surface
+    drawn = _Drawn(group, (400, 300))
+    plain = _Box(group, (390, 290))
+    plain.image.fill((255, 0, 0))
+    group.custom_draw(drawn)
+    assert drawn.calls == [(5, 5)]
+    assert surface.get_at((390 - 5, 290 - 5))[:3] == (255, 0, 0)
+
+
+def test_plain_sprites_are_batched_into_one_submit():
+    surface = pygame.Surface((800, 600))
+    group = YSortCameraGroup()
+    group.display_surface = surface
+    target = _Box(group, (400, 300))
+    for i in range(5):
+        _Box(group, (i * 20, 100))
+    _Box(group, (90_000, 100))  # culled
+    group.custom_draw(target)
+    assert (group.stats.draw_calls, group.stats.blits, group.stats.pixels) == (1, 6, 600)
+
+    # A sprite with its own draw splits the batch around it
+    _Drawn(group, (0, 200))
+    group.custom_draw(target)
+    assert (group.stats.draw_calls, group.stats.blits) == (3, 7)
+
+
+def test_zoomed_frames_reuse_prescaled_surfaces():
+    surface = pygame.Surface((800, 600))
+    group = YSortCameraGroup()
+    group.display_surface = surface
+    target = _Box(group, (400, 300), size=(20, 20))
+    target.image.fill((255, 0, 0))
+
+    group.set_zoom(2.0, smooth=False)
+    group.custom_draw(target)
+    # 2x on a mip level: the 20px sprite covers 40px around the screen center
+    assert surface.get_at((400 - 19, 300 - 19))[:3] == (255, 0, 0)
+    assert surface.get_at((400 - 21, 300))[:3] != (255, 0, 0)
+    group.custom_draw(target)
+    assert group.scaled_surfaces.scaled == 1
+
+    # Between levels the frame is drawn at the level below and scaled once
+    group.set_zoom(0.75, smooth=False)
+    group.custom_draw(target)
+    group.custom_draw(target)
+    assert group.scaled_surfaces.scaled == 2
+    assert surface.get_at((400, 300))[:3] == (255, 0, 0)
+
+
+def test_scaled_copies_are_dropped_with_their_source():
+    cache = ScaledSurfaceCache()
+    chunk = pygame.Surface((64, 64))
+    cache.get(chunk, 0.5)
+    cache.get(chunk, 0.25)
+    assert len(cache) == 2
+    del chunk  # e.g. the chunk cache re-baked it
+    assert len(cache) == 0
+
+
+def test_zoom_steps_and_eases_to_target():
+    group = YSortCameraGroup()
+    group.zoom_out()
+    assert group.target_zoom == 0.75 and group.zoom == 1.0
+    for _ in range(60):
+        group.update_zoom(1 / 60)
+    assert group.zoom == 0.75
+
+
+def test_viewports_share_index_and_scaled_surfaces():
+    surface = pygame.Surface((800, 600))
+    group = YSortCameraGroup()
+    group.display_surface = surface
+    player = _Box(group, (400, 300), size=(20, 20))
+    player.image.fill((255, 0, 0))
+    far = _Box(group, (5_000, 300), size=(20, 20))
+    far.image.fill((0, 0, 255))
+
+    spectator = group.add_viewport(Viewport((600, 0, 200, 150), center=far.rect.center, background=(0, 0, 0)))
+    pip = group.add_viewport(Viewport((0, 450, 200, 150), target=player, zoom=0.5))
+    pip_twin = group.add_viewport(Viewport((200, 450, 200, 150), target=player, zoom=0.5))
+    group.custom_draw(player)
+
+    assert surface.get_at((700, 75))[:3] == (0, 0, 255)  # spectator view centered on `far`
+    assert surface.get_at((100, 525))[:3] == (255, 0, 0)  # picture-in-picture of the player
+    assert spectator.visible and [s for _, _, s in spectator.visible] == [far]
+    # The second zoomed view reused the first one's scaled sprite
+    assert group.scaled_surfaces.scaled == 1
+    assert pygame.Rect(600, 0, 200, 150) in group.drawn_rects
+
+    group.remove_viewport(pip_twin)
+    assert group.viewports == [group.main_view, spectator, pip]
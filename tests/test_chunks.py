@@ -0,0 +1,58 @@
+import pygame
+
+from src import settings
+from src.core.chunks import ChunkCache
+from src.core.tile_art import TILE_THEMES
+from src.core.tilemap import TileMap
+
+
+def test_bake_matches_tile_layout_and_loops():
+    """A baked chunk contains each static tile at its grid position."""
+    rows = [[0, 2], [1, 1]]
+    cache = ChunkCache(TileMap.from_rows(rows), chunk_cols=4)
+    try:
+        chunk = cache.get(0)
+        ts = settings.TILE_SIZE
+        assert chunk.get_size() == (4 * ts, 2 * ts)
+        center = ts // 2
+        # Row 0 alternates empty / platform as the 2-wide row loops
+        empty = chunk.get_at((center, center))
+        assert empty.a == 0 or empty == chunk.get_colorkey()  # colorkeyed once a display is set
+        assert chunk.get_at((ts + center, center))[:3] == TILE_THEMES["default"][2]
+        assert chunk.get_at((3 * ts + center, center))[:3] == TILE_THEMES["default"][2]
+        assert chunk.get_at((2 * ts + center, ts + center))[:3] == TILE_THEMES["default"][1]
+    finally:
+        cache.shutdown()
+
+
+def test_draw_prefetches_chunks_ahead_of_view():
+    """Drawing bakes the visible chunks and queues the upcoming ones."""
+    cache = ChunkCache(TileMap.from_rows([[1] * 8]), chunk_cols=4)
+    try:
+        target = pygame.Surface((cache.chunk_width, settings.TILE_SIZE))
+        cache.draw(target, pygame.Vector2(0, 0))
+        assert 0 in cache.chunks
+        assert 1 in cache.chunks or 1 in cache.pending
+        for future in list(cache.pending.values()):
+            future.result()
+        cache.collect()
+        assert 1 in cache.chunks
+    finally:
+        cache.shutdown()
+
+
+def test_views_keep_their_own_chunk_ranges():
+    """Two viewports far apart don't evict each other's chunks."""
+    cache = ChunkCache(TileMap.from_rows([[1] * 8]), chunk_cols=4)
+    try:
+        cache.prefetch(0, 1, view="main")
+        cache.prefetch(40, 41, view="spectator")
+        cache.get(0)
+        cache.get(40)
+        cache.prefetch(1, 2, view="main")
+        assert 40 in cache.chunks and 0 not in cache.chunks
+        cache.release_view("spectator")
+        cache.prefetch(1, 2, view="main")
+        assert 40 not in cache.chunks
+    finally:
+        cache.shutdown()
@@ -0,0 +1,89 @@
+import pygame
+
+from src import settings
+from src.core.collision import MergedColliders, TileGrid, move_and_collide_rect
+from src.core.tilemap import TileMap
+
+TS = settings.TILE_SIZE
+
+
+def _grid():
+    # Row 2 is a floor; (3, 1) is a wall block; (5, 1) is a hazard
+    return TileGrid(TileMap.from_rows([[0] * 8, [0, 0, 0, 1, 0, 3, 0, 0], [2] * 8]))
+
+
+def test_grid_lookup_loops_and_ignores_outside_cells():
+    grid = _grid()
+    assert grid.is_solid(3, 1)
+    assert grid.is_solid(3 + 8, 1)  # rows loop horizontally
+    assert not grid.is_solid(-5, 1)  # nothing left of x = 0
+    assert not grid.is_solid(0, 3)  # below the layout
+    assert grid.is_hazard(5, 1)
+
+
+def test_resolve_lands_on_floor_and_stops_at_wall():
+    grid = _grid()
+    rect = pygame.Rect(TS // 2, TS + 10, TS, TS)
+    assert grid.resolve_y(rect, 100)
+    assert rect.bottom == 2 * TS
+
+    rect = pygame.Rect(2 * TS + 5, TS, TS, TS)
+    assert grid.resolve_x(rect, 50)
+    assert rect.right == 3 * TS
+    assert not grid.resolve_x(pygame.Rect(0, 0, TS, TS), 50)
+
+
+def test_overlaps_hazard_only_checks_covered_cells():
+    grid = _grid()
+    assert grid.overlaps_hazard(pygame.Rect(5 * TS - 1, TS, 2, 2))
+    assert not grid.overlaps_hazard(pygame.Rect(6 * TS, TS, TS, TS))
+
+
+def test_move_and_collide_rect_applies_movement_once():
+    grid = _grid()
+    rect = pygame.Rect(0, 0, TS, TS)
+    rect, vx, vy = move_and_collide_rect(rect, 10, 5, grid.is_solid)
+    assert rect.topleft == (10, 5)
+    assert (vx, vy) == (10, 5)
+
+
+def test_sweep_stops_fast_bodies_at_thin_platforms():
+    """A step much larger than a tile still lands on a one-tile platform."""
+    grid = TileGrid(TileMap.from_rows([[0] * 4, [2] * 4, [0] * 4, [0] * 4, [0] * 4, [1] * 4]))
+    rect = pygame.Rect(TS, 0, 8, 8)
+    assert grid.sweep_y(rect, 4 * TS)
+    assert rect.bottom == TS
+
+    # Jumping up from below stops under the platform instead of passing it
+    rect = pygame.Rect(TS, 4 * TS, 8, 8)
+    assert grid.sweep_y(rect, -4 * TS)
+    assert rect.top == 2 * TS
+
+
+def test_sweep_moves_freely_when_path_is_clear():
+    grid = _grid()
+    rect = pygame.Rect(0, 0, TS, TS)
+    assert not grid.sweep_x(rect, 3 * TS)
+    assert rect.x == 3 * TS
+    rect = pygame.Rect(4 * TS, TS, TS, TS)
+    assert grid.sweep_x(rect, -3 * TS)
+    assert rect.left == 4 * TS
+
+
+def test_merged_colliders_cover_runs_with_few_rects():
+    """A two-row floor with a gap merges into two rects per chunk."""
+    floor = [1, 1, 1, 0, 2, 2, 2, 2]
+    tilemap = TileMap.from_rows([[0] * 8, [0, 0, 0, 0, 0, 4, 4, 0], floor, floor])
+    colliders = MergedColliders(tilemap, chunk_cols=8)
+    solids = colliders.chunk_rects("solid", 0)
+    assert sorted(map(tuple, solids)) == [(0, 2 * TS, 3 * TS, 2 * TS), (4 * TS, 2 * TS, 4 * TS, 2 * TS)]
+    assert len(colliders.chunk_rects("hazard", 0)) == 1
+
+    # Chunks further along the loop reuse the merge, shifted into place
+    second = colliders.chunk_rects("solid", 1)
+    assert second[0].x == solids[0].x + colliders.chunk_width
+    assert colliders.query(pygame.Rect(-TS, 0, TS, 4 * TS)) == []
+
+    grid = TileGrid(tilemap)
+    assert grid.overlaps_hazard(pygame.Rect(5 * TS + 8 * TS, TS, 4, 4))
+    assert not grid.overlaps_hazard(pygame.Rect(0, 0, TS, TS))
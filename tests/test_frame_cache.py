@@ -0,0 +1,73 @@
+import pygame
+import pytest
+
+from src.core import frame_cache
+from src.core.frame_cache import load_aligned_frames, pack_frames, unpack_frames
+
+FRAME_SIZE = (16, 12)
+
+
+def _sheet(path, color=(200, 40, 90, 255)):
+    sheet = pygame.Surface((FRAME_SIZE[0], FRAME_SIZE[1] * 2), pygame.SRCALPHA)
+    sheet.fill(color, (2, 3, 5, 6))
+    sheet.fill(color, (8, FRAME_SIZE[1], 4, 12))
+    pygame.image.save(sheet, str(path))
+
+
+@pytest.fixture
+def display():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+
+
+def _pixels(frames):
+    return [pygame.image.tobytes(frame, "RGBA") for frame in frames]
+
+
+def test_pack_round_trip_keeps_pixels():
+    frame = pygame.Surface((8, 8), pygame.SRCALPHA)
+    frame.fill((10, 20, 30, 128), (2, 4, 3, 4))
+    frames = unpack_frames(pack_frames([frame, frame.copy()]))
+    assert _pixels(frames) == _pixels([frame, frame])
+    with pytest.raises(frame_cache.FrameCacheError):
+        unpack_frames(pack_frames([frame])[:-1])
+
+
+def test_warm_load_skips_processing(tmp_path, monkeypatch, display):
+    sheet = tmp_path / "walk.png"
+    _sheet(sheet)
+    cold = load_aligned_frames(str(sheet), *FRAME_SIZE, 2, (12, 12), cache_dir=tmp_path / "cache")
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def process(*args):
+        raise AssertionError("processed on a warm start")
+
+    monkeypatch.setattr(frame_cache, "load_aligned_vertical_sprite_frames", process)
+    warm = load_aligned_frames(str(sheet), *FRAME_SIZE, 2, (12, 12), cache_dir=tmp_path / "cache")
+    assert _pixels(warm) == _pixels(cold)
+
+
+def test_editing_the_sheet_or_parameters_misses_the_cache(tmp_path, display):
+    sheet = tmp_path / "walk.png"
+    _sheet(sheet)
+    cache = tmp_path / "cache"
+    load_aligned_frames(str(sheet), *FRAME_SIZE, 2, (12, 12), cache_dir=cache)
+    first = {path.name for path in cache.iterdir()}
+
+    load_aligned_frames(str(sheet), *FRAME_SIZE, 2, (16, 16), cache_dir=cache)
+    assert {path.name for path in cache.iterdir()} != first
+
+    _sheet(sheet, color=(0, 255, 0, 255))
+    frames = load_aligned_frames(str(sheet), *FRAME_SIZE, 2, (16, 16), cache_dir=cache)
+    assert frames[0].get_at((frames[0].get_width() // 2, 15)) == (0, 255, 0, 255)
+    # Older entries for the same sheet are replaced, not accumulated
+    assert len(list(cache.iterdir())) == 1
+
+
+def test_same_named_sheets_of_different_characters_keep_their_entries(tmp_path, display):
+    cache = tmp_path / "cache"
+    for character in ("mage", "knight"):
+        (tmp_path / character).mkdir()
+        _sheet(tmp_path / character / "walk.png")
+        load_aligned_frames(str(tmp_path / character / "walk.png"), *FRAME_SIZE, 2, (12, 12), cache_dir=cache)
+    assert len(list(cache.iterdir())) == 2
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from src.core.mapfile import compile_layout, CompiledMap, MapFormatError, load_map, open_compiled
+
+
+def test_compiled_map_round_trip_and_special_index():
+    layout = [["0", "", "-1"], ["1", "5", "4"], ["2", "3"]]
+    compiled = CompiledMap(compile_layout(layout))
+    assert (compiled.width, compiled.height) == (3, 3)
+    assert [list(row) for row in compiled.rows] == [[0, 0, 0], [1, 5, 4], [2, 3, 0]]
+    assert compiled.find_first(5) == (1, 1)
+    assert compiled.specials[4] == [(2, 1)]
+    assert compiled.find_first(9) is None
+
+
+def test_maps_too_wide_for_the_header_are_rejected():
+    with pytest.raises(MapFormatError):
+        compile_layout([["0"] * 65536])
+
+
+def test_load_map_recompiles_when_csv_is_newer(tmp_path):
+    csv_path = tmp_path / "map.csv"
+    csv_path.write_text("0,5\n1,1\n")
+    with load_map(csv_path) as first:
+        assert first.find_first(5) == (1, 0)
+
+    compiled_path = tmp_path / "map.tilemap"
+    assert compiled_path.exists()
+    csv_path.write_text("5,0\n1,1\n")
+    stamp = os.path.getmtime(compiled_path) + 5
+    os.utime(csv_path, (stamp, stamp))
+    with load_map(csv_path) as second:
+        assert second.find_first(5) == (0, 0)
+
+
+def test_empty_compiled_file_falls_back_to_the_csv(tmp_path):
+    csv_path = tmp_path / "map.csv"
+    csv_path.write_text("0,5\n1,1\n")
+    compiled_path = tmp_path / "map.tilemap"
+    compiled_path.write_bytes(b"")
+    stamp = os.path.getmtime(csv_path) + 5
+    os.utime(compiled_path, (stamp, stamp))  # not stale: only the format check can catch it
+    with pytest.raises(MapFormatError):
+        open_compiled(compiled_path)
+    with load_map(csv_path) as compiled:
+        assert compiled.find_first(5) == (1, 0)
@@ -0,0 +1,45 @@
+import pygame
+
+from src.core.parallax import Parallax, ParallaxLayer, render_hills
+
+
+def test_layer_covers_the_view_with_at_most_two_blits():
+    strip = pygame.Surface((800, 100))
+    layer = ParallaxLayer(strip, 0.5, (0, 300))
+    for x in (0, 1, 799, 1600, 123456, -50):
+        items = []
+        layer.draw_items(items, pygame.Vector2(x, 0), (800, 600))
+        assert 1 <= len(items) <= 2
+        xs = [dest[0] for _, dest in items]
+        assert xs[0] <= 0 < xs[0] + 800
+        assert xs[0] == -(round(x * 0.5) % 800)
+
+
+def test_layer_scrolls_at_its_factor_and_culls_offscreen():
+    layer = ParallaxLayer(pygame.Surface((800, 100)), 0.25, (0, 300))
+    items = []
+    layer.draw_items(items, pygame.Vector2(400, 200), (800, 600))
+    assert items[0][1] == (-100, 250)
+    items.clear()
+    layer.draw_items(items, pygame.Vector2(0, 2000), (800, 600))
+    assert items == []
+
+
+def test_hill_strip_wraps_seamlessly():
+    strip = render_hills(800, 200, (0, 128, 0), seed=3)
+    mask = pygame.mask.from_surface(strip)
+    left = [mask.get_at((0, y)) for y in range(200)]
+    right = [mask.get_at((799, y)) for y in range(200)]
+    # Outline heights at both edges differ by at most a pixel or two
+    assert abs(sum(left) - sum(right)) <= 2
+
+
+def test_from_settings_builds_one_layer_per_entry():
+    parallax = Parallax.from_settings(
+        [("clouds", (255, 255, 255), 0.1, 40), ("hills", (0, 100, 0), 0.5, 300)], view_width=1000
+    )
+    assert [layer.factor for layer in parallax.layers] == [0.1, 0.5]
+    assert all(layer.width >= 1000 for layer in parallax.layers)
+    items = []
+    parallax.draw_items(items, pygame.Vector2(0, 0), (1000, 600))
+    assert len(items) == 2
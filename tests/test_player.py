@@ -0,0 +1,105 @@
+import pygame
+
+from src.entities.player import Player
+
+
+def _player():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    return Player((100, 300), [])
+
+
+def test_steady_state_animation_reuses_memoized_variants(monkeypatch):
+    player = _player()
+    player.on_ground = True
+    player.vel_x = 1
+    for _ in range(len(player.walk_frames) * 20):
+        player.update_animation()
+    builds = player.variant_builds
+
+    scaled = []
+    monkeypatch.setattr(pygame.transform, "scale", lambda *args: scaled.append(args))
+    for _ in range(200):
+        player.update_animation()
+    assert player.variant_builds == builds
+    assert scaled == []
+
+
+def test_facing_left_mirrors_frames_once():
+    player = _player()
+    player.flip_horiz(True)
+    flipped = player.image
+    builds = player.variant_builds
+    player.flip_horiz(True)
+    assert player.image is flipped and player.variant_builds == builds
+    player.flip_horiz(False)
+    assert player.image is player._frame
+
+
+def test_resizing_the_collider_drops_only_old_size_variants():
+    player = _player()
+    midbottom = player.rect.midbottom
+    old_size = player.rect.size
+    player.resize_collider((old_size[0], old_size[1] + 1))
+    assert player.rect.midbottom == midbottom
+    sizes = {key[2] for key in player._variants}
+    assert old_size not in sizes and player.rect.size in sizes
+    # Animation keeps the resized collider
+    player.set_frame(player.walk_frames[-1])
+    assert player.rect.size == (old_size[0], old_size[1] + 1)
+
+
+def test_startup_builds_only_the_idle_animation():
+    player = _player()
+    assert player.state == "idle"
+    assert player.animations.loaded("idle") and not player.animations.loaded("death")
+
+
+def test_states_follow_physics_and_one_shots_hold():
+    player = _player()
+    player.vel_y = -10
+    player.update_animation()
+    assert player.state == "jump"
+    player.on_ground = True
+    player.attack()
+    player.update_animation()
+    assert player.state == "attack"
+    for _ in range(200):
+        player.update_animation()
+    assert player.state == "idle" and not player.attacking
+
+    player.die()
+    for _ in range(200):
+        player.update_animation()
+    assert player.state == "death"
+    assert player._frame is player.current_frames[-1]
+
+
+class _Held:
+    """Stand-in for pygame.key.get_pressed() with some keys held."""
+
+    def __init__(self, keys):
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+def test_walking_on_flat_ground_stays_grounded(monkeypatch):
+    from src import settings
+    from src.core.collision import TileGrid
+    from src.core.tilemap import TileMap
+
+    player = _player()
+    ts = settings.TILE_SIZE
+    player.collision_grid = TileGrid(TileMap.from_rows([[0] * 40] * 11 + [[1] * 40]))
+    player.rect.bottom = 11 * ts
+    player.pos.update(player.rect.topleft)
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: _Held(settings.RIGHT_KEYS))
+
+    states = set()
+    for _ in range(60):
+        player.update(1 / 60, [])
+        states.add((player.state, player.on_ground))
+    assert states == {("walk", True)}
+    assert player.frame_index > 0
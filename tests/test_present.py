@@ -0,0 +1,74 @@
+import pygame
+
+from src.core.present import Presenter
+
+
+def _record_presents(monkeypatch):
+    updates = []
+    monkeypatch.setattr(pygame.display, "update", lambda rects: updates.append(list(rects)))
+    monkeypatch.setattr(pygame.display, "flip", lambda: updates.append("flip"))
+    return updates
+
+
+def test_presenter_pushes_only_dirty_regions_while_camera_is_still(monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((200, 100))
+    updates = _record_presents(monkeypatch)
+
+    presenter = Presenter((200, 100), enabled=True, scroll_threshold=0)
+    presenter.present((0, 0), [pygame.Rect(10, 10, 20, 20)])
+    assert updates[-1] == "flip"  # first frame is always full
+    presenter.present((0, 0), [pygame.Rect(15, 10, 20, 20)])
+    # The old and the new sprite region
+    assert updates[-1] == [pygame.Rect(10, 10, 20, 20), pygame.Rect(15, 10, 20, 20)]
+    assert presenter.pixels == 800
+
+    presenter.present((1, 0), [pygame.Rect(15, 10, 20, 20)])
+    assert updates[-1] == "flip"  # scrolled
+    presenter.mark((190, 90, 50, 50))
+    presenter.present((1, 0), [])
+    assert updates[-1] == [pygame.Rect(190, 90, 10, 10), pygame.Rect(15, 10, 20, 20)]
+    presenter.invalidate()
+    presenter.present((1, 0), [])
+    assert updates[-1] == "flip"
+
+
+def test_backbuffer_is_integer_scaled_and_letterboxed(monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((450, 220))
+    updates = _record_presents(monkeypatch)
+
+    presenter = Presenter((200, 100), enabled=True, scroll_threshold=0)
+    assert presenter.scale == 2
+    assert presenter.dest == pygame.Rect(25, 10, 400, 200)
+    assert presenter.to_surface((25 + 21, 10 + 41)) == (10, 20)
+    motion = pygame.event.Event(pygame.MOUSEMOTION, pos=(25 + 21, 10 + 41), rel=(8, -4), buttons=(0, 0, 0))
+    assert presenter.map_event(motion).rel == (4, -2)
+
+    presenter.surface.fill((0, 0, 0))
+    presenter.surface.fill((255, 0, 0), (10, 20, 5, 5))
+    presenter.present((0, 0))
+    window = pygame.display.get_surface()
+    assert window.get_at((25 + 20, 10 + 40))[:3] == (255, 0, 0)
+    assert window.get_at((25 + 29, 10 + 49))[:3] == (255, 0, 0)
+    assert window.get_at((25 + 30, 10 + 50))[:3] == (0, 0, 0)
+
+    presenter.present((0, 0), [pygame.Rect(10, 20, 5, 5)])
+    assert updates[-1] == [pygame.Rect(45, 50, 10, 10)]
+
+
+def test_window_of_the_logical_size_is_drawn_into_directly(monkeypatch):
+    pygame.display.init()
+    window = pygame.display.set_mode((200, 100))
+    updates = _record_presents(monkeypatch)
+
+    presenter = Presenter((200, 100), enabled=True, scroll_threshold=0)
+    assert presenter.direct and presenter.surface is window
+    presenter.present((0, 0))
+    presenter.present((0, 0), [pygame.Rect(10, 10, 20, 20)])
+    assert updates == ["flip", [pygame.Rect(10, 10, 20, 20)]]
+
+    # A bigger window needs scaling, so drawing moves to the backbuffer
+    pygame.display.set_mode((400, 200))
+    presenter.resize()
+    assert not presenter.direct and presenter.surface.get_size() == (200, 100)
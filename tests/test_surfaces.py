@@ -0,0 +1,59 @@
+import pygame
+
+from src.core.surfaces import (
+    COLORKEY,
+    COLORKEYED,
+    CONSTANT_ALPHA,
+    OPAQUE,
+    PER_PIXEL_ALPHA,
+    new_surface,
+    optimize,
+    surface_kind,
+)
+
+
+def _display():
+    pygame.display.init()
+    return pygame.display.set_mode((64, 64))
+
+
+def test_optimize_picks_the_cheapest_blit_mode():
+    screen = _display()
+
+    opaque = pygame.Surface((8, 8), pygame.SRCALPHA)
+    opaque.fill((10, 20, 30, 255))
+    assert surface_kind(optimize(opaque)) == OPAQUE
+
+    spikes = pygame.Surface((8, 8), pygame.SRCALPHA)
+    spikes.fill((200, 0, 0, 255), (0, 4, 8, 4))
+    keyed = optimize(spikes)
+    assert surface_kind(keyed) == COLORKEYED
+    assert keyed.get_flags() & pygame.RLEACCELOK  # encoded on first blit
+    assert keyed.get_at((0, 6))[:3] == (200, 0, 0)
+
+    glow = pygame.Surface((8, 8), pygame.SRCALPHA)
+    glow.fill((255, 255, 255, 96))
+    assert surface_kind(optimize(glow)) == PER_PIXEL_ALPHA
+
+    overlay = optimize(new_surface((8, 8), fill=(0, 0, 0)), alpha=128)
+    assert surface_kind(overlay) == CONSTANT_ALPHA
+    assert overlay.get_bitsize() == screen.get_bitsize()
+
+
+def test_binary_alpha_keeps_per_pixel_alpha_if_the_key_color_is_used():
+    _display()
+    art = pygame.Surface((4, 4), pygame.SRCALPHA)
+    art.fill(COLORKEY + (255,), (0, 0, 4, 2))
+    assert surface_kind(optimize(art)) == PER_PIXEL_ALPHA
+
+
+def test_colorkeyed_surface_blits_like_its_source():
+    _display()
+    source = pygame.Surface((4, 4), pygame.SRCALPHA)
+    source.fill((0, 200, 0, 255), (0, 0, 2, 4))
+    expected = pygame.Surface((4, 4))
+    actual = pygame.Surface((4, 4))
+    for target, surface in ((expected, source), (actual, optimize(source))):
+        target.fill((135, 206, 250))
+        target.blit(surface, (0, 0))
+    assert pygame.image.tobytes(expected, "RGB") == pygame.image.tobytes(actual, "RGB")
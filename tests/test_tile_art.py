@@ -0,0 +1,33 @@
+import pygame
+import pytest
+
+from src.core.tile_art import clear_tile_surfaces, get_tile_surface
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_tile_surfaces()
+    yield
+    clear_tile_surfaces()
+
+
+def test_tiles_of_one_id_and_theme_share_a_surface():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    ground = get_tile_surface(1)
+    assert get_tile_surface(1) is ground
+    assert get_tile_surface(1, "default") is ground
+    assert get_tile_surface(2) is not ground
+
+
+def test_surfaces_painted_before_set_mode_are_converted_later():
+    pygame.display.quit()
+    pygame.display.init()
+    early = get_tile_surface(3)
+    assert get_tile_surface(3) is early  # still no display: kept as painted
+
+    screen = pygame.display.set_mode((64, 64))
+    converted = get_tile_surface(3)
+    assert converted is not early
+    assert converted.get_bitsize() == screen.get_bitsize()
+    assert get_tile_surface(3) is converted
@@ -0,0 +1,52 @@
+import pygame
+
+from src import settings
+from src.core.tile_stream import ColumnStreamer, TilePool, parse_layout
+from src.core.tilemap import TileMap
+
+
+def _make_streamer(group, window_cols=4):
+    def factory(pos):
+        sprite = pygame.sprite.Sprite()
+        sprite.image = pygame.Surface((settings.TILE_SIZE, settings.TILE_SIZE))
+        sprite.rect = sprite.image.get_rect(topleft=pos)
+        return sprite
+
+    layout = [["0", "1", "0"], ["1", "1", "-1"]]
+    pool = TilePool({1: factory})
+    tilemap = TileMap.from_rows(parse_layout(layout))
+    streamer = ColumnStreamer(tilemap, pool, {1: (group,)}, window_cols * settings.TILE_SIZE)
+    return streamer, pool
+
+
+def test_streamer_recycles_columns_instead_of_rebuilding():
+    """Scrolling forward spawns only entering columns and reuses pooled sprites."""
+    group = pygame.sprite.Group()
+    streamer, pool = _make_streamer(group)
+    streamer.reset(0)
+    assert (streamer.first_col, streamer.last_col) == (0, 4)
+    created_after_reset = pool.created
+
+    # Move far enough to shift the window by one column at a time
+    for step in range(1, 40):
+        x = 2 * settings.TILE_SIZE + step * settings.TILE_SIZE
+        assert streamer.update(x) <= 1
+        assert streamer.last_col - streamer.first_col == 4
+
+    # Each layout column has 1 or 2 solid cells, so the pool only ever needs
+    # to grow by a couple of sprites to cover the window.
+    assert pool.created <= created_after_reset + 2
+    spawned = sum(len(col) for col in streamer.columns.values())
+    assert len(group) == spawned
+
+
+def test_streamer_places_tiles_with_looping_columns():
+    """World columns past the layout width wrap back onto the layout."""
+    group = pygame.sprite.Group()
+    streamer, _ = _make_streamer(group, window_cols=6)
+    streamer.reset(0)
+    positions = sorted(sprite.rect.topleft for sprite in group)
+    ts = settings.TILE_SIZE
+    assert positions == sorted(
+        [(0, ts), (ts, 0), (ts, ts), (3 * ts, ts), (4 * ts, 0), (4 * ts, ts)]
+    )
@@ -0,0 +1,46 @@
+from src import settings
+from src.core.mapfile import CompiledMap, compile_layout
+from src.core.tilemap import TileMap
+
+TS = settings.TILE_SIZE
+
+
+def _map():
+    return TileMap.from_rows([[0, 0, 2, 0], [1, 1, 3, 1]])
+
+
+def test_lookup_wraps_horizontally_only():
+    tilemap = _map()
+    assert tilemap.tile_at(2, 0) == 2
+    assert tilemap.tile_at(2 + 4, 0) == 2
+    assert tilemap.tile_at(-2, 0) == 2
+    assert tilemap.tile_at(0, 5) == 0
+    assert tilemap.is_solid(5, 1)
+    assert tilemap.is_hazard(2, 1)
+    assert not TileMap.from_rows([[1]], wrap=False).is_solid(1, 0)
+
+
+def test_get_tiles_in_rect_returns_world_positions():
+    tilemap = _map()
+    tiles = tilemap.get_tiles_in_rect(5 * TS, 0, 2 * TS, 2 * TS)
+    assert [(t["tx"], t["ty"]) for t in tiles] == [(6, 0), (5, 1)]
+    assert tiles[0]["world_x"] == 6 * TS
+    everything = tilemap.get_tiles_in_rect(2 * TS, TS, TS, TS, solid_only=False)
+    assert [t["tile"] for t in everything] == [3]
+
+
+def test_columns_counts_and_footprint():
+    tilemap = _map()
+    assert tilemap.column(2) == bytes([2, 3])
+    assert tilemap.counts() == {0: 3, 1: 3, 2: 1, 3: 1}
+    tilemap.set_tile(0, 0, 2)
+    assert tilemap.counts()[2] == 2
+    # One byte per tile plus the array header, never a sprite per tile
+    assert tilemap.memory_footprint() < 8 * 64 + 100
+
+
+def test_from_compiled_shares_the_compiled_grid():
+    compiled = CompiledMap(compile_layout([["1", "5"], ["2", "4"]]))
+    tilemap = TileMap.from_compiled(compiled)
+    assert tilemap.row(1).tolist() == [2, 4]
+    assert tilemap.memory_footprint() == 4
@@ -0,0 +1,109 @@
+import pygame
+
+from src.core.tilemap import TileMap
+from src.ui.death_screen import DeathScreen
+from src.ui.fonts import GlyphAtlas, get_font
+from src.ui.hud import DistanceHUD
+from src.ui.loading_screen import LoadingScreen
+from src.ui.minimap import EMPTY_COLOR, MARKER_COLOR, Minimap, render_grid, tile_palette
+from src.ui.widgets import Label
+
+
+def test_fonts_are_shared_per_name_and_size():
+    assert get_font(36) is get_font(36)
+    assert get_font(36) is not get_font(48)
+
+
+def test_label_rerenders_only_on_change():
+    label = Label("Retry", 48, (255, 255, 255), (100, 50))
+    assert label.renders == 1
+    label.text = "Retry"
+    label.color = (255, 255, 255)
+    assert label.renders == 1
+    label.color = (255, 255, 0)
+    assert label.renders == 2
+    assert label.rect.center == (100, 50)
+
+
+def test_glyph_atlas_lays_out_text_as_glyph_blits():
+    atlas = GlyphAtlas(get_font(36), (255, 255, 255))
+    items = []
+    rect = atlas.layout("120", (5, 7), items)
+    assert [image for image, _ in items] == [atlas.glyphs["1"], atlas.glyphs["2"], atlas.glyphs["0"]]
+    assert items[0][1] == (5, 7)
+    assert rect.width == atlas.width("120")
+    # Glyphs are views into one atlas surface
+    assert all(image.get_parent() is atlas.surface for image, _ in items)
+
+
+def test_distance_hud_relayouts_only_when_the_value_changes():
+    hud = DistanceHUD(topleft=(0, 0))
+    hud.set_distance(12)
+    items = hud._items
+    hud.set_distance(12.4)
+    assert hud._items is items
+    hud.set_distance(13)
+    assert hud._items is not items
+
+    surface = pygame.Surface((200, 60))
+    assert hud.draw(surface) == hud.rect
+
+
+def test_death_screen_draw_reuses_cached_text():
+    surface = pygame.Surface((800, 600))
+    screen = DeathScreen(surface)
+    screen.draw()
+    screen.draw()
+    assert screen.title.renders == 1
+    assert [label.renders for label in screen.option_labels] == [1, 1]
+    screen.selected_option = 1
+    screen.draw()
+    assert [label.renders for label in screen.option_labels] == [2, 2]
+    assert screen.button_rects[1].center == screen.option_labels[1].rect.center
+
+
+def test_minimap_grid_maps_tile_ids_through_the_palette():
+    tilemap = TileMap.from_rows([[0, 1, 2], [3, 4, 5]])
+    palette = tile_palette()
+    image = render_grid(tilemap, palette, scale=2)
+    assert image.get_size() == (6, 4)
+    assert image.get_at((2, 0))[:3] == palette[1]
+    assert image.get_at((5, 3))[:3] == palette[5]
+    assert image.get_at((3, 3))[:3] == EMPTY_COLOR  # invisible hazards stay hidden
+
+
+def test_minimap_rebuilds_only_when_the_map_changes():
+    first = TileMap.from_rows([[1] * 10] * 4)
+    minimap = Minimap((100, 0))
+    minimap.update(first, first)
+    minimap.update(first, first)
+    assert minimap.builds == 1
+    second = TileMap.from_rows([[2] * 12] * 4)
+    minimap.update(second, second)
+    assert minimap.builds == 2
+    assert minimap.rect.topright == (100, 0) and minimap.rect.width == 24
+
+    surface = pygame.Surface((100, 20))
+    assert minimap.draw(surface, (3, 1)) == minimap.rect
+    # The marker is centered on the tile's 2x2 cell
+    assert surface.get_at((minimap.rect.x + 3 * 2 + 1, 1 * 2 + 1))[:3] == MARKER_COLOR
+
+
+def test_minimap_shrinks_wide_maps_to_fit():
+    minimap = Minimap((100, 0), scale=2, max_width=40)
+    wide = TileMap.from_rows([[1] * 100] * 10)
+    minimap.update(wide, wide)
+    assert minimap.rect.size == (40, 4) and minimap.rect.left >= 0
+    surface = pygame.Surface((100, 20))
+    minimap.draw(surface, (99, 9))
+    assert surface.get_at((minimap.rect.right - 1, minimap.rect.bottom - 1))[:3] == MARKER_COLOR
+
+
+def test_loading_screen_fills_the_bar_by_progress():
+    surface = pygame.Surface((800, 600))
+    screen = LoadingScreen(surface)
+    inner = screen.bar.inflate(-6, -6)
+    screen.draw(0.5, "scenes")
+    assert surface.get_at((inner.x + inner.width // 2 - 1, inner.centery))[:3] == (255, 255, 255)
+    assert surface.get_at((inner.x + inner.width // 2 + 1, inner.centery))[:3] == screen.background
+    assert screen.status.text == "scenes"
@@ -0,0 +1,99 @@
+import os
+
+from src.core.hot_reload import MapWatcher
+from src.core.world import SceneCache, SceneSequence, WorldMap
+
+
+def _write_scenes(tmp_path):
+    tall = tmp_path / "tall.csv"
+    tall.write_text("0,0,0\n0,5,0\n1,1,1\n")
+    short = tmp_path / "short.csv"
+    short.write_text("3,0\n2,2\n")
+    return str(tall), str(short)
+
+
+def test_world_stitches_scenes_bottom_aligned(tmp_path):
+    tall, short = _write_scenes(tmp_path)
+    cache = SceneCache(capacity=2)
+    world = WorldMap(SceneSequence([tall, short]), cache)
+    try:
+        assert world.height == 3
+        assert world.find_spawn(5) == (1, 1)
+        # tall: cols 0-2, short: cols 3-4 (one row lower), tall again: 5-7
+        assert [world.segment_at(col) for col in (0, 2, 3, 4, 5, 8)] == [0, 0, 1, 1, 2, 3]
+        assert world.segment_start(3) == 8
+        assert list(world.column(3)) == [0, 3, 2]
+        assert list(world.column(6)) == [0, 5, 1]
+        assert world.tile_at(4, 2) == 2 and world.tile_at(4, 0) == 0
+        assert world.is_hazard(3, 1) and world.is_solid(7, 2)
+        assert world.tile_at(-1, 2) == 0
+    finally:
+        world.shutdown()
+
+
+def test_scene_cache_is_bounded_lru(tmp_path):
+    tall, short = _write_scenes(tmp_path)
+    third = tmp_path / "third.csv"
+    third.write_text("1\n")
+    cache = SceneCache(capacity=2)
+    try:
+        cache.get(tall)
+        cache.get(short)
+        cache.get(tall)  # tall is now most recently used
+        compiled, evicted = cache.peek(short)
+        cache.get(str(third))
+        assert tall in cache and str(third) in cache
+        assert short not in cache
+        # Mappings are closed right after loading, so the compiled file can
+        # be replaced, while TileMaps still held elsewhere stay readable
+        assert compiled._buffer.closed
+        assert list(evicted.column(0)) == [3, 2]
+        cache.prefetch(short)
+        assert cache.get(short)[1].height == 2
+        assert cache.loads == 4
+    finally:
+        cache.shutdown()
+
+
+def test_random_sequence_is_seeded_per_segment():
+    paths = ["a", "b", "c"]
+    first = SceneSequence(paths, "random", seed=7)
+    second = SceneSequence(paths, "random", seed=7)
+    picks = [first.scene_for(segment) for segment in range(20)]
+    assert picks[0] == "a"
+    assert picks == [second.scene_for(segment) for segment in range(20)]
+    only_c = SceneSequence(paths, "random", weights=[0, 0, 1])
+    assert {only_c.scene_for(segment) for segment in range(1, 10)} == {"c"}
+
+
+def test_reload_reports_only_changed_world_columns(tmp_path):
+    tall, short = _write_scenes(tmp_path)
+    world = WorldMap(SceneSequence([tall, short]), SceneCache(capacity=2))
+    try:
+        world.segment_at(12)  # tall segments start at 0, 5 and 10
+        assert world.tile_at(5, 0) == 0
+        with open(tall, "w") as file:
+            file.write("2,0,0\n0,5,0\n1,1,1\n")
+        os.utime(tall, (os.path.getmtime(tall) + 5,) * 2)
+        assert world.reload(tall) == {0, 5, 10}
+        assert world.tile_at(5, 0) == 2
+
+        with open(short, "w") as file:
+            file.write("3,0,0\n2,2,2\n")
+        os.utime(short, (os.path.getmtime(short) + 5,) * 2)
+        assert world.reload(short) is None
+        assert world.segment_start(2) == 6
+    finally:
+        world.shutdown()
+
+
+def test_map_watcher_reports_changed_files_once(tmp_path):
+    tall, short = _write_scenes(tmp_path)
+    now = [0.0]
+    watcher = MapWatcher([tall, short], interval=1.0, clock=lambda: now[0])
+    stamp = os.path.getmtime(short) + 5
+    os.utime(short, (stamp, stamp))
+    assert watcher.poll() == []  # interval not elapsed yet
+    now[0] = 1.5
+    assert watcher.poll() == [short]
+    assert watcher.poll(force=True) == []
@@ -0,0 +1,82 @@
+import sys
+import pathlib
+import time
+
+
+def _time_blits(target, surface, count, repeats=5):
+    """Best-of-repeats microseconds per blit of surface onto target."""
+    positions = [((i * 37) % 760, (i * 53) % 560) for i in range(count)]
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for pos in positions:
+            target.blit(surface, pos)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / count * 1e6
+
+
+def main():
+    # Ensure repo root is on sys.path so we can import package-style modules
+    # from the local workspace.
+    repo_root = pathlib.Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(repo_root))
+
+    # Local imports after sys.path mutation to avoid E402 lint errors.
+    import pygame
+    from src import settings
+    from src.core.surfaces import new_surface, optimize, surface_kind
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    pygame.init()
+    pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    target = new_surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    tile = (settings.TILE_SIZE, settings.TILE_SIZE)
+
+    def plain_opaque():
+        surface = pygame.Surface(tile, 0, 24)
+        surface.fill((139, 69, 19))
+        return surface
+
+    def plain_binary_alpha():
+        surface = pygame.Surface(tile, pygame.SRCALPHA)
+        pygame.draw.polygon(surface, (220, 20, 20), [(0, 32), (16, 0), (32, 32)])
+        return surface
+
+    def plain_chunk():
+        # What ChunkCache used to store: per-pixel alpha, sky rows transparent
+        surface = pygame.Surface((512, 512), pygame.SRCALPHA)
+        surface.fill((139, 69, 19, 255), (0, 256, 512, 256))
+        return surface.convert_alpha()
+
+    def plain_overlay():
+        surface = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), 0, 24)
+        surface.fill((0, 0, 0))
+        surface.set_alpha(128)
+        return surface
+
+    def plain_blended():
+        surface = pygame.Surface(tile, pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 255, 255, 96), (16, 16), 16)
+        return surface
+
+    # (name, old-style surface, optimize() options, blits to time)
+    cases = [
+        ("tile", plain_opaque, {}, count),
+        ("spikes", plain_binary_alpha, {}, count),
+        ("chunk", plain_chunk, {}, max(1, count // 50)),
+        ("overlay", plain_overlay, {"alpha": 128}, max(1, count // 100)),
+        ("glow", plain_blended, {}, count),
+    ]
+    print(f"{'surface':<10}{'kind':<18}{'plain us':>10}{'factory us':>12}{'speedup':>9}")
+    for name, make, options, n in cases:
+        plain = make()
+        fast = optimize(make(), **options)
+        plain_us = _time_blits(target, plain, n)
+        fast_us = _time_blits(target, fast, n)
+        print(f"{name:<10}{surface_kind(fast):<18}{plain_us:>10.2f}{fast_us:>12.2f}{plain_us / fast_us:>8.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
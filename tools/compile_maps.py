@@ -0,0 +1,23 @@
+import sys
+import pathlib
+
+
+def main():
+    # Ensure repo root is on sys.path so we can import package-style modules
+    # from the local workspace.
+    repo_root = pathlib.Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(repo_root))
+
+    # Local import after sys.path mutation to avoid E402 lint errors.
+    from src.core.mapfile import compile_all
+
+    force = "--force" in sys.argv[1:]
+    written = compile_all(repo_root / "src" / "scenes", force=force)
+    for path in written:
+        print(f"compiled {path.relative_to(repo_root)}")
+    if not written:
+        print("all maps up to date")
+
+
+if __name__ == "__main__":
+    main()
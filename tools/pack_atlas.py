@@ -0,0 +1,29 @@
+import sys
+import pathlib
+
+
+def main():
+    # Ensure repo root is on sys.path so we can import package-style modules
+    # from the local workspace.
+    repo_root = pathlib.Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(repo_root))
+
+    # Local import after sys.path mutation to avoid E402 lint errors.
+    from src.core.atlas import build_atlas, is_stale, read_index
+
+    args = sys.argv[1:]
+    force = "--force" in args
+    directories = [arg for arg in args if not arg.startswith("--")] or [repo_root / "assets" / "mage.samurai"]
+    for directory in directories:
+        directory = pathlib.Path(directory)
+        if not force and not is_stale(directory):
+            print(f"{directory}: atlas up to date")
+            continue
+        build_atlas(directory)
+        index = read_index(directory)
+        frames = sum(len(entries) for entries in index["animations"].values())
+        print(f"{directory}: packed {frames} frames into {len(index['pages'])} page(s)")
+
+
+if __name__ == "__main__":
+    main()